@@ -25,7 +25,8 @@ Performance Targets:
 from __future__ import annotations
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import Any, Dict, List, Optional, Set, Tuple, cast
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, List, Mapping, Optional, Tuple, cast
 from datetime import datetime
 import logging
 
@@ -264,9 +265,9 @@ class KeyItem:
     use_location: Optional[str] = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PokemonState:
-    """State of a Pokemon for item usage decisions"""
+    """State of a Pokemon for item usage decisions (immutable snapshot)"""
 
     species: str
     level: int
@@ -360,6 +361,66 @@ class InventoryState:
 
     ITEM_DATABASE: Dict[ItemType, ItemData] = {}
     TM_DATABASE: Dict[int, TMData] = {}
+    # Shared by every instance, so read-only all the way down
+    CATEGORY_MAPPING: Mapping[ItemCategory, FrozenSet[ItemType]] = MappingProxyType(
+        {
+            ItemCategory.POTION: frozenset(
+                {
+                    ItemType.POTION,
+                    ItemType.SUPER_POTION,
+                    ItemType.HYPER_POTION,
+                    ItemType.MAX_POTION,
+                    ItemType.FULL_RESTORE,
+                }
+            ),
+            ItemCategory.POKEBALL: frozenset(
+                {
+                    ItemType.POKE_BALL,
+                    ItemType.GREAT_BALL,
+                    ItemType.ULTRA_BALL,
+                    ItemType.MASTER_BALL,
+                    ItemType.SAFARI_BALL,
+                }
+            ),
+            ItemCategory.STATUS_CURE: frozenset(
+                {
+                    ItemType.ANTIDOTE,
+                    ItemType.BURN_HEAL,
+                    ItemType.ICE_HEAL,
+                    ItemType.AWAKENING,
+                    ItemType.PARALYZE_HEAL,
+                    ItemType.FULL_HEAL,
+                    ItemType.REVIVE,
+                    ItemType.MAX_REVIVE,
+                }
+            ),
+            ItemCategory.BATTLE_ITEM: frozenset(
+                {
+                    ItemType.X_ATTACK,
+                    ItemType.X_DEFEND,
+                    ItemType.X_SPEED,
+                    ItemType.X_SPECIAL,
+                    ItemType.DIRE_HIT,
+                    ItemType.GUARD_SPEC,
+                }
+            ),
+            ItemCategory.KEY_ITEM: frozenset(
+                {
+                    ItemType.BICYCLE,
+                    ItemType.COIN_CASE,
+                    ItemType.ITEMFINDER,
+                    ItemType.OLD_ROD,
+                    ItemType.GOOD_ROD,
+                    ItemType.SUPER_ROD,
+                    ItemType.POKEDEX,
+                    ItemType.TOWN_MAP,
+                    ItemType.VS_SEEKER,
+                    ItemType.BASEMENT_KEY,
+                }
+            ),
+            ItemCategory.TM_HM: frozenset(),
+        }
+    )
 
     def __init__(self) -> None:
         self._items: Dict[ItemType, InventoryItem] = {}
@@ -709,60 +770,14 @@ class InventoryState:
 
     def get_by_category(self, category: ItemCategory) -> List[InventoryItem]:
         """Get all items in a category"""
-        category_items = self._get_category_mapping().get(category, set())
+        category_items = self._get_category_mapping().get(category, frozenset())
         return [
             item for item in self._items.values() if item.item_type in category_items
         ]
 
-    def _get_category_mapping(self) -> Dict[ItemCategory, Set[ItemType]]:
-        """Get mapping of categories to item types"""
-        return {
-            ItemCategory.POTION: {
-                ItemType.POTION,
-                ItemType.SUPER_POTION,
-                ItemType.HYPER_POTION,
-                ItemType.MAX_POTION,
-                ItemType.FULL_RESTORE,
-            },
-            ItemCategory.POKEBALL: {
-                ItemType.POKE_BALL,
-                ItemType.GREAT_BALL,
-                ItemType.ULTRA_BALL,
-                ItemType.MASTER_BALL,
-                ItemType.SAFARI_BALL,
-            },
-            ItemCategory.STATUS_CURE: {
-                ItemType.ANTIDOTE,
-                ItemType.BURN_HEAL,
-                ItemType.ICE_HEAL,
-                ItemType.AWAKENING,
-                ItemType.PARALYZE_HEAL,
-                ItemType.FULL_HEAL,
-                ItemType.REVIVE,
-                ItemType.MAX_REVIVE,
-            },
-            ItemCategory.BATTLE_ITEM: {
-                ItemType.X_ATTACK,
-                ItemType.X_DEFEND,
-                ItemType.X_SPEED,
-                ItemType.X_SPECIAL,
-                ItemType.DIRE_HIT,
-                ItemType.GUARD_SPEC,
-            },
-            ItemCategory.KEY_ITEM: {
-                ItemType.BICYCLE,
-                ItemType.COIN_CASE,
-                ItemType.ITEMFINDER,
-                ItemType.OLD_ROD,
-                ItemType.GOOD_ROD,
-                ItemType.SUPER_ROD,
-                ItemType.POKEDEX,
-                ItemType.TOWN_MAP,
-                ItemType.VS_SEEKER,
-                ItemType.BASEMENT_KEY,
-            },
-            ItemCategory.TM_HM: set(),
-        }
+    def _get_category_mapping(self) -> Mapping[ItemCategory, FrozenSet[ItemType]]:
+        """Get read-only mapping of categories to item types"""
+        return InventoryState.CATEGORY_MAPPING
 
     def get_potions(self) -> Dict[ItemType, int]:
         """Get all healing potions with quantities"""
@@ -1637,6 +1652,14 @@ class ItemUsageStrategy:
         "ASLEEP": ItemType.AWAKENING,
     }
 
+    POTION_POWER: Dict[ItemType, int] = {
+        ItemType.HYPER_POTION: 200,
+        ItemType.SUPER_POTION: 50,
+        ItemType.POTION: 20,
+        ItemType.MAX_POTION: 999,
+        ItemType.FULL_RESTORE: 999,
+    }
+
     def __init__(self, inventory: InventoryState):
         self._inventory = inventory
 
@@ -1760,18 +1783,10 @@ class ItemUsageStrategy:
 
         missing_hp = pokemon.max_hp - pokemon.current_hp
 
-        potion_power: Dict[ItemType, int] = {
-            ItemType.HYPER_POTION: 200,
-            ItemType.SUPER_POTION: 50,
-            ItemType.POTION: 20,
-            ItemType.MAX_POTION: 999,
-            ItemType.FULL_RESTORE: 999,
-        }
-
         best_potion = None
         best_efficiency = 0.0
 
-        for potion_type, power in potion_power.items():
+        for potion_type, power in ItemUsageStrategy.POTION_POWER.items():
             if potion_type in available_potions:
                 heal_amount = min(power, missing_hp)
                 cost = ShoppingHeuristic.ITEM_COSTS.get(potion_type, 9999)
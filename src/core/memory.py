@@ -15,15 +15,46 @@ Performance Specifications:
 """
 
 from __future__ import annotations
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any, Tuple, cast
+from dataclasses import dataclass, field, fields
+from typing import (
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Any,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+)
+import heapq
 import json
+import math
 import time
 import logging
 import sqlite3
+import sys
 from enum import Enum, auto
-from collections import defaultdict
+from collections import Counter, defaultdict, deque
 
+# orjson is an optional speedup for the JSON columns of the tactician tables
+_json_loads: Callable[[str], Any]
+try:
+    import orjson
+
+    def _json_dumps(value: Any) -> str:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    _json_loads = orjson.loads
+except ImportError:
+
+    def _json_dumps(value: Any) -> str:
+        return json.dumps(value)
+
+    _json_loads = json.loads
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +68,63 @@ class MemoryTier(Enum):
 
 
 MAX_RECENT_ACTIONS = 10
+# Resource snapshots per session and consolidation results kept, oldest first
+MAX_RESOURCE_SNAPSHOTS = 100
+MAX_CONSOLIDATION_HISTORY = 100
+
+# Base strength, in days, of the forgetting curve used to rank patterns
+RETENTION_STRENGTH_DAYS = 30.0
+# Pattern retrievals buffered before their access stats are applied inline
+MAX_PENDING_ACCESSES = 1024
+# Sort weight per MistakeRecord.severity (lower-cased); others weigh 0
+_SEVERITY_WEIGHTS = {"critical": 3, "major": 2, "minor": 1}
+
+# A database path, or an open connection the caller keeps ownership of
+DatabaseTarget = Union[str, sqlite3.Connection]
+
+_T = TypeVar("_T")
+
+
+def _lowest_ranked(items: List[_T], count: int, key: Callable[[_T], Any]) -> List[_T]:
+    """
+    The count items a stable descending sort by key would place last
+
+    Runs in O(n log count) instead of sorting everything; ties go to the
+    later item, as they do in sorted(items, key=key, reverse=True).
+    """
+    positions = heapq.nsmallest(
+        count, range(len(items)), key=lambda i: (key(items[i]), -i)
+    )
+    return [items[i] for i in positions]
+
+
+def _interned(value: Any) -> Any:
+    """
+    sys.intern a str column value; anything else is returned unchanged
+
+    Used for the small vocabularies (pattern types, severities, Pokemon
+    names) read back from the database, so equal values share one object
+    and == and dict lookups succeed on the identity check.
+    """
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+# Field names per record class, filled on first to_dict
+_FIELD_NAMES: Dict[type, Tuple[str, ...]] = {}
+
+
+class _RecordDictMixin:
+    """Shallow to_dict for record dataclasses, without dataclasses.asdict"""
+
+    __slots__ = ()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize record fields to a plain dict"""
+        cls = self.__class__
+        names = _FIELD_NAMES.get(cls)
+        if names is None:
+            names = _FIELD_NAMES[cls] = tuple(f.name for f in fields(cast(Any, self)))
+        return {name: getattr(self, name) for name in names}
 
 
 # ============================================================================
@@ -44,7 +132,7 @@ MAX_RECENT_ACTIONS = 10
 # ============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class TickState:
     """Current tick game state snapshot"""
 
@@ -59,8 +147,8 @@ class TickState:
     active_goal: Optional[str] = None
 
 
-@dataclass
-class ActionRecord:
+@dataclass(slots=True)
+class ActionRecord(_RecordDictMixin):
     """Recent action with outcome"""
 
     tick: int
@@ -73,7 +161,7 @@ class ActionRecord:
     duration_ms: float
 
 
-@dataclass
+@dataclass(slots=True)
 class SensoryInput:
     """Immediate vision/OCR input"""
 
@@ -97,10 +185,19 @@ class ObserverMemory:
     """
 
     current_state: TickState = field(default_factory=TickState)
-    recent_actions: List[ActionRecord] = field(default_factory=list)
+    recent_actions: Deque[ActionRecord] = field(
+        default_factory=lambda: deque(maxlen=MAX_RECENT_ACTIONS)
+    )
     sensory_input: SensoryInput = field(default_factory=SensoryInput)
     decision_context: Dict[str, Any] = field(default_factory=dict)
 
+    def __post_init__(self) -> None:
+        if (
+            not isinstance(self.recent_actions, deque)
+            or self.recent_actions.maxlen != MAX_RECENT_ACTIONS
+        ):
+            self.recent_actions = deque(self.recent_actions, maxlen=MAX_RECENT_ACTIONS)
+
     def get_recent_outcomes(self) -> List[Dict[str, Any]]:
         """Get summary of recent action outcomes"""
         return [
@@ -118,8 +215,18 @@ class ObserverMemory:
     def add_action(self, action: ActionRecord) -> None:
         """Record action and maintain FIFO buffer (max 10 actions)"""
         self.recent_actions.append(action)
-        if len(self.recent_actions) > MAX_RECENT_ACTIONS:
-            self.recent_actions.pop(0)
+
+    def add_actions(self, actions: Iterable[ActionRecord]) -> None:
+        """Record several actions at once; only the newest 10 are kept"""
+        self.recent_actions.extend(actions)
+
+    def set_last_outcome(self, success: bool, outcome_summary: str) -> None:
+        """Overwrite the newest action's outcome"""
+        if not self.recent_actions:
+            return
+        last = self.recent_actions[-1]
+        last.success = success
+        last.outcome_summary = outcome_summary
 
     def clear(self) -> None:
         """Reset memory for new decision cycle"""
@@ -138,6 +245,8 @@ class ObserverMemory:
         """Get success rate of recent actions"""
         if not self.recent_actions:
             return 0.0
+        # Summed per call: the buffer holds at most ten actions, and their
+        # outcomes may be edited in place
         successful = sum(1 for a in self.recent_actions if a.success)
         return successful / len(self.recent_actions)
 
@@ -179,8 +288,8 @@ class ObserverMemory:
 # ============================================================================
 
 
-@dataclass
-class SessionObjective:
+@dataclass(slots=True)
+class SessionObjective(_RecordDictMixin):
     """Current session objective"""
 
     objective_id: str
@@ -196,8 +305,8 @@ class SessionObjective:
     related_location: Optional[str]
 
 
-@dataclass
-class BattleRecord:
+@dataclass(slots=True)
+class BattleRecord(_RecordDictMixin):
     """Single battle outcome"""
 
     battle_id: str
@@ -210,13 +319,14 @@ class BattleRecord:
     outcome: str
     turns_taken: int
     player_hp_remaining: float
-    moves_used: List[str]
-    items_used: List[str]
-    key_decisions: List[str]
+    # Read-only after creation, so an empty tuple is shared when nothing is given
+    moves_used: Sequence[str] = ()
+    items_used: Sequence[str] = ()
+    key_decisions: Sequence[str] = ()
 
 
-@dataclass
-class LocationVisited:
+@dataclass(slots=True)
+class LocationVisited(_RecordDictMixin):
     """Location exploration record"""
 
     location_name: str
@@ -230,8 +340,8 @@ class LocationVisited:
     npcs_interacted: List[str]
 
 
-@dataclass
-class ResourceSnapshot:
+@dataclass(slots=True)
+class ResourceSnapshot(_RecordDictMixin):
     """Resource state at point in time"""
 
     tick: int
@@ -256,15 +366,26 @@ class StrategistMemory:
     active_objective: Optional[SessionObjective]
     battle_history: List[BattleRecord]
     locations_visited: Dict[str, LocationVisited]
-    resource_history: List[ResourceSnapshot]
+    resource_history: Deque[ResourceSnapshot]
     total_battles: int = 0
     victories: int = 0
     defeats: int = 0
     current_money: int = 0
     current_items: Dict[str, int] = field(default_factory=dict)
 
+    def __post_init__(self) -> None:
+        if (
+            not isinstance(self.resource_history, deque)
+            or self.resource_history.maxlen != MAX_RESOURCE_SNAPSHOTS
+        ):
+            self.resource_history = deque(
+                self.resource_history, maxlen=MAX_RESOURCE_SNAPSHOTS
+            )
+
     def get_objectives_progress(self) -> Dict[str, float]:
         """Get completion percentage by objective type"""
+        # Not memoized: objectives and their progress are public and edited
+        # in place, and a session holds few enough of them to regroup cheaply
         progress_by_type = defaultdict(list)
         for obj in self.objectives:
             progress_by_type[obj.objective_type].append(obj.progress_percent)
@@ -274,6 +395,10 @@ class StrategistMemory:
             for obj_type, progress in progress_by_type.items()
         }
 
+    def get_objectives_by_status(self, status: str) -> List[SessionObjective]:
+        """Get objectives with the given status, in the order they were added"""
+        return [obj for obj in self.objectives if obj.status == status]
+
     def get_win_rate(self) -> float:
         """Calculate session battle win rate"""
         if self.total_battles == 0:
@@ -285,11 +410,22 @@ class StrategistMemory:
         self.battle_history.append(battle)
         self.total_battles += 1
 
+        # Comparing against interned literals measured faster than a
+        # dict-of-deltas lookup; other outcomes count toward the total only
         if battle.outcome == "victory":
             self.victories += 1
         elif battle.outcome == "defeat":
             self.defeats += 1
 
+    def record_battles_bulk(self, battles: Iterable[BattleRecord]) -> None:
+        """Add several battles to history and update stats in one pass"""
+        batch = list(battles)
+        self.battle_history.extend(batch)
+        self.total_battles += len(batch)
+        outcomes = Counter(b.outcome for b in batch)
+        self.victories += outcomes["victory"]
+        self.defeats += outcomes["defeat"]
+
     def update_objective_progress(self, objective_id: str, progress: float) -> None:
         """Update objective progress"""
         for obj in self.objectives:
@@ -353,9 +489,8 @@ class StrategistMemory:
             tms_obtained=[],  # Would be populated from inventory
             hms_obtained=[],  # Would be populated from inventory
         )
+        # The deque drops the oldest snapshot once full
         self.resource_history.append(snapshot)
-        if len(self.resource_history) > 100:
-            self.resource_history.pop(0)
 
     def update_money(self, amount: int) -> None:
         """Update current money"""
@@ -411,9 +546,7 @@ class StrategistMemory:
             else None,
             "locations_count": len(self.locations_visited),
             "objectives_count": len(self.objectives),
-            "completed_objectives": len(
-                [o for o in self.objectives if o.status == "completed"]
-            ),
+            "completed_objectives": len(self.get_objectives_by_status("completed")),
             "session_duration_ticks": self.get_session_duration_ticks(),
             "current_money": self.current_money,
             "current_items_count": len(self.current_items),
@@ -425,8 +558,8 @@ class StrategistMemory:
 # ============================================================================
 
 
-@dataclass
-class LearnedPattern:
+@dataclass(slots=True)
+class LearnedPattern(_RecordDictMixin):
     """Learned pattern from experience"""
 
     pattern_id: str
@@ -440,6 +573,9 @@ class LearnedPattern:
     confidence: float = 0.0
     last_validated: float = 0.0
     relevance_score: float = 0.5
+    # Retrieval stats; session-local, not persisted with the pattern
+    access_count: int = 0
+    last_accessed: float = field(default_factory=time.time)
 
     def update_confidence(self) -> None:
         """Update confidence based on success/failure ratio"""
@@ -448,9 +584,20 @@ class LearnedPattern:
             self.confidence = self.success_count / total
         self.last_validated = time.time()
 
+    def retention_score(self, now: float) -> float:
+        """
+        Relevance decayed along a forgetting curve since the last access
 
-@dataclass
-class SuccessfulStrategy:
+        R = exp(-idle_days / (RETENTION_STRENGTH_DAYS + access_count)): every
+        retrieval stretches the curve, so patterns in use fade more slowly.
+        """
+        idle_days = max(0.0, now - self.last_accessed) / 86400.0
+        strength = RETENTION_STRENGTH_DAYS + self.access_count
+        return self.relevance_score * math.exp(-idle_days / strength)
+
+
+@dataclass(slots=True)
+class SuccessfulStrategy(_RecordDictMixin):
     """Strategy that worked in past battles"""
 
     strategy_id: str
@@ -476,8 +623,8 @@ class SuccessfulStrategy:
         self.last_used = time.time()
 
 
-@dataclass
-class MistakeRecord:
+@dataclass(slots=True)
+class MistakeRecord(_RecordDictMixin):
     """Mistake to avoid in future"""
 
     mistake_id: str
@@ -496,8 +643,8 @@ class MistakeRecord:
         self.occurrence_count += 1
 
 
-@dataclass
-class PlayerPreference:
+@dataclass(slots=True)
+class PlayerPreference(_RecordDictMixin):
     """Player-configured or learned preferences"""
 
     preference_id: str
@@ -510,6 +657,63 @@ class PlayerPreference:
     updated_at: float = 0.0
 
 
+# Statement text shared by every save/load, so sqlite3's per-connection
+# statement cache always hits. Column order matches each record's fields.
+_PATTERN_COLUMNS = (
+    "pattern_id, pattern_type, description, trigger_conditions, "
+    "learned_from_session, learned_from_tick, success_count, failure_count, "
+    "confidence, last_validated, relevance_score"
+)
+_STRATEGY_COLUMNS = (
+    "strategy_id, context, enemy_type, player_pokemon, strategy_description, "
+    "moves_sequence, success_rate, total_uses, successful_uses, first_used, "
+    "last_used"
+)
+_MISTAKE_COLUMNS = (
+    "mistake_id, description, situation, outcome, severity, prevention_tip, "
+    "first_occurred, last_occurred, occurrence_count"
+)
+_PREFERENCE_COLUMNS = (
+    "preference_id, category, description, preference_value, "
+    "learned_from_session, confidence, created_at, updated_at"
+)
+
+
+def _insert_sql(table: str, columns: str) -> str:
+    """INSERT OR REPLACE statement binding one parameter per column"""
+    placeholders = ", ".join("?" * (columns.count(",") + 1))
+    return f"INSERT OR REPLACE INTO {table} ({columns}) VALUES ({placeholders})"
+
+
+_SELECT_PATTERNS_SQL = f"SELECT {_PATTERN_COLUMNS} FROM tactician_patterns"
+_SELECT_STRATEGIES_SQL = f"SELECT {_STRATEGY_COLUMNS} FROM successful_strategies"
+_SELECT_MISTAKES_SQL = f"SELECT {_MISTAKE_COLUMNS} FROM mistake_records"
+_SELECT_PREFERENCES_SQL = f"SELECT {_PREFERENCE_COLUMNS} FROM player_preferences"
+_SELECT_STATS_SQL = (
+    "SELECT total_sessions, total_battles, overall_win_rate, total_wins "
+    "FROM tactician_stats"
+)
+# Databases saved before total_wins was stored lack that column
+_SELECT_LEGACY_STATS_SQL = (
+    "SELECT total_sessions, total_battles, overall_win_rate FROM tactician_stats"
+)
+_INSERT_PATTERNS_SQL = _insert_sql("tactician_patterns", _PATTERN_COLUMNS)
+_INSERT_STRATEGIES_SQL = _insert_sql("successful_strategies", _STRATEGY_COLUMNS)
+_INSERT_MISTAKES_SQL = _insert_sql("mistake_records", _MISTAKE_COLUMNS)
+_INSERT_PREFERENCES_SQL = _insert_sql("player_preferences", _PREFERENCE_COLUMNS)
+_INSERT_STATS_SQL = (
+    "INSERT OR REPLACE INTO tactician_stats "
+    "(id, total_sessions, total_battles, overall_win_rate, total_wins) "
+    "VALUES (1, ?, ?, ?, ?)"
+)
+
+
+def _has_column(cursor: sqlite3.Cursor, table: str, column: str) -> bool:
+    """Check whether an existing table has the given column"""
+    cursor.execute(f"PRAGMA table_info({table})")
+    return any(row[1] == column for row in cursor.fetchall())
+
+
 @dataclass
 class TacticianMemory:
     """
@@ -525,23 +729,45 @@ class TacticianMemory:
     preferences: Dict[str, PlayerPreference] = field(default_factory=dict)
     total_sessions: int = 0
     total_battles: int = 0
+    # Cached total_wins / total_battles; update_stats keeps it in step
     overall_win_rate: float = 0.0
     last_saved: float = 0.0
+    # Whole wins behind overall_win_rate, seeded from the rate if not given
+    total_wins: int = 0
+    # (pattern ids, time) per retrieval, applied by flush_access_stats
+    _access_log: Deque[Tuple[Tuple[str, ...], float]] = field(
+        default_factory=deque, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        if self.total_battles and not self.total_wins:
+            self.total_wins = round(self.overall_win_rate * self.total_battles)
 
     def add_pattern(self, pattern: LearnedPattern) -> None:
         """Add or update learned pattern"""
-        if pattern.pattern_id in self.patterns:
-            existing = self.patterns[pattern.pattern_id]
-            existing.success_count = pattern.success_count
-            existing.failure_count = pattern.failure_count
-            existing.confidence = pattern.confidence
-            existing.relevance_score = max(
-                existing.relevance_score, pattern.relevance_score
-            )
-            existing.last_validated = time.time()
-        else:
-            pattern.last_validated = time.time()
-            self.patterns[pattern.pattern_id] = pattern
+        self.add_patterns((pattern,))
+
+    def add_patterns(self, patterns: Iterable[LearnedPattern]) -> None:
+        """Add or update several learned patterns in one pass"""
+        now = time.time()
+        stored = self.patterns
+        for pattern in patterns:
+            existing = stored.get(pattern.pattern_id)
+            if existing is not None:
+                existing.success_count = pattern.success_count
+                existing.failure_count = pattern.failure_count
+                existing.confidence = pattern.confidence
+                existing.relevance_score = max(
+                    existing.relevance_score, pattern.relevance_score
+                )
+                existing.last_validated = now
+            else:
+                pattern.last_validated = now
+                stored[pattern.pattern_id] = pattern
+
+    def add_strategy(self, strategy: SuccessfulStrategy) -> None:
+        """Add or replace a strategy"""
+        self.strategies[strategy.strategy_id] = strategy
 
     def record_strategy_success(self, strategy_id: str, success: bool) -> None:
         """Record successful use of strategy"""
@@ -572,7 +798,7 @@ class TacticianMemory:
             moves_sequence=moves_sequence,
             first_used=time.time(),
         )
-        self.strategies[strategy_key] = strategy
+        self.add_strategy(strategy)
         return strategy
 
     def _generate_strategy_key(
@@ -592,8 +818,7 @@ class TacticianMemory:
             self.mistakes[mistake.mistake_id].record_occurrence()
         else:
             if not self.merge_similar_mistake(mistake):
-                mistake.first_occurred = time.time()
-                mistake.last_occurred = time.time()
+                mistake.first_occurred = mistake.last_occurred = time.time()
                 self.mistakes[mistake.mistake_id] = mistake
 
     def merge_similar_mistake(self, mistake: MistakeRecord) -> bool:
@@ -625,17 +850,38 @@ class TacticianMemory:
             existing.confidence = max(existing.confidence, preference.confidence)
             existing.updated_at = time.time()
         else:
-            preference.created_at = time.time()
-            preference.updated_at = time.time()
+            preference.created_at = preference.updated_at = time.time()
             self.preferences[preference.category] = preference
 
     def get_relevant_patterns(self, context: Dict[str, Any]) -> List[LearnedPattern]:
         """Get patterns relevant to current context"""
-        relevant = []
-        for pattern in self.patterns.values():
-            if self._context_matches(pattern.trigger_conditions, context):
-                relevant.append(pattern)
-        return sorted(relevant, key=lambda p: p.relevance_score, reverse=True)
+        relevant = [
+            p
+            for p in self.patterns.values()
+            if self._context_matches(p.trigger_conditions, context)
+        ]
+        relevant.sort(key=lambda p: p.relevance_score, reverse=True)
+        if relevant:
+            self._access_log.append(
+                (tuple(p.pattern_id for p in relevant), time.time())
+            )
+            if len(self._access_log) >= MAX_PENDING_ACCESSES:
+                self.flush_access_stats()
+        return relevant
+
+    def flush_access_stats(self) -> int:
+        """Apply buffered pattern retrievals to access stats, return count"""
+        applied = 0
+        log = self._access_log
+        while log:
+            pattern_ids, accessed_at = log.popleft()
+            for pattern_id in pattern_ids:
+                pattern = self.patterns.get(pattern_id)
+                if pattern is not None:
+                    pattern.access_count += 1
+                    pattern.last_accessed = max(pattern.last_accessed, accessed_at)
+                    applied += 1
+        return applied
 
     def _context_matches(
         self, conditions: Dict[str, Any], context: Dict[str, Any]
@@ -679,128 +925,117 @@ class TacticianMemory:
 
     def _severity_weight(self, severity: str) -> int:
         """Get numeric weight for severity"""
-        weights = {"critical": 3, "major": 2, "minor": 1}
-        return weights.get(severity.lower(), 0)
+        return _SEVERITY_WEIGHTS.get(severity.lower(), 0)
 
     def get_patterns_by_type(self, pattern_type: str) -> List[LearnedPattern]:
         """Get all patterns of a specific type"""
         return [p for p in self.patterns.values() if p.pattern_type == pattern_type]
 
+    def _patterns_by_type(self) -> Dict[str, List[LearnedPattern]]:
+        """Every pattern grouped by type, in insertion order, in one pass"""
+        groups: Dict[str, List[LearnedPattern]] = defaultdict(list)
+        for pattern in self.patterns.values():
+            groups[pattern.pattern_type].append(pattern)
+        return groups
+
     def get_high_confidence_patterns(
         self, threshold: float = 0.7
     ) -> List[LearnedPattern]:
         """Get patterns above confidence threshold"""
+        # Not memoized: LearnedPattern.update_confidence edits confidence in place
         return [p for p in self.patterns.values() if p.confidence >= threshold]
 
     def update_stats(self, battle_won: bool) -> None:
         """Update overall stats after a battle"""
         self.total_battles += 1
-        if battle_won:
-            if self.overall_win_rate == 0:
-                self.overall_win_rate = 1.0
-            else:
-                self.overall_win_rate = (
-                    self.overall_win_rate * (self.total_battles - 1) + 1
-                ) / self.total_battles
-        else:
-            if self.overall_win_rate == 0:
-                self.overall_win_rate = 0.0
-            else:
-                self.overall_win_rate = (
-                    self.overall_win_rate * (self.total_battles - 1)
-                ) / self.total_battles
+        self.total_wins += battle_won
+        self.overall_win_rate = self.total_wins / self.total_battles
 
     def increment_sessions(self) -> None:
         """Increment session counter"""
         self.total_sessions += 1
 
-    def load_from_database(self, db_path: str) -> bool:
-        """Load persistent memory from database"""
+    def load_from_database(self, db_path: DatabaseTarget) -> bool:
+        """Load persistent memory from a database path or open connection"""
+        # Each SELECT lists its columns in the record's field order, so row
+        # values are passed positionally rather than as keywords. Lookups
+        # repeated for every row are bound to locals once per table.
         try:
-            conn = sqlite3.connect(db_path)
+            owns_conn = isinstance(db_path, str)
+            conn = sqlite3.connect(db_path) if isinstance(db_path, str) else db_path
             cursor = conn.cursor()
+            loads = _json_loads
+            interned = _interned
 
-            cursor.execute(
-                "SELECT pattern_id, pattern_type, description, trigger_conditions, learned_from_session, learned_from_tick, success_count, failure_count, confidence, last_validated, relevance_score FROM tactician_patterns"
-            )
-            for row in cursor.fetchall():
+            store_pattern = self.patterns.__setitem__
+            cursor.execute(_SELECT_PATTERNS_SQL)
+            for row in cursor:
                 pattern = LearnedPattern(
-                    pattern_id=row[0],
-                    pattern_type=row[1],
-                    description=row[2],
-                    trigger_conditions=json.loads(row[3]) if row[3] else {},
-                    learned_from_session=row[4],
-                    learned_from_tick=row[5],
-                    success_count=row[6],
-                    failure_count=row[7],
-                    confidence=row[8],
-                    last_validated=row[9],
-                    relevance_score=row[10],
+                    row[0],
+                    interned(row[1]),
+                    row[2],
+                    loads(row[3]) if row[3] else {},
+                    *row[4:],
                 )
-                self.patterns[pattern.pattern_id] = pattern
-
-            cursor.execute(
-                "SELECT strategy_id, context, enemy_type, player_pokemon, strategy_description, moves_sequence, success_rate, total_uses, successful_uses, first_used, last_used FROM successful_strategies"
-            )
-            for row in cursor.fetchall():
-                strategy = SuccessfulStrategy(
-                    strategy_id=row[0],
-                    context=json.loads(row[1]) if row[1] else {},
-                    enemy_type=row[2],
-                    player_pokemon=row[3],
-                    strategy_description=row[4],
-                    moves_sequence=json.loads(row[5]) if row[5] else [],
-                    success_rate=row[6],
-                    total_uses=row[7],
-                    successful_uses=row[8],
-                    first_used=row[9],
-                    last_used=row[10],
+                store_pattern(row[0], pattern)
+
+            add_strategy = self.add_strategy
+            cursor.execute(_SELECT_STRATEGIES_SQL)
+            for row in cursor:
+                add_strategy(
+                    SuccessfulStrategy(
+                        row[0],
+                        loads(row[1]) if row[1] else {},
+                        interned(row[2]),
+                        interned(row[3]),
+                        row[4],
+                        loads(row[5]) if row[5] else [],
+                        *row[6:],
+                    )
                 )
-                self.strategies[strategy.strategy_id] = strategy
 
-            cursor.execute(
-                "SELECT mistake_id, description, situation, outcome, severity, prevention_tip, first_occurred, last_occurred, occurrence_count FROM mistake_records"
-            )
-            for row in cursor.fetchall():
+            store_mistake = self.mistakes.__setitem__
+            cursor.execute(_SELECT_MISTAKES_SQL)
+            for row in cursor:
                 mistake = MistakeRecord(
-                    mistake_id=row[0],
-                    description=row[1],
-                    situation=json.loads(row[2]) if row[2] else {},
-                    outcome=row[3],
-                    severity=row[4],
-                    prevention_tip=row[5],
-                    first_occurred=row[6],
-                    last_occurred=row[7],
-                    occurrence_count=row[8],
+                    row[0],
+                    row[1],
+                    loads(row[2]) if row[2] else {},
+                    interned(row[3]),
+                    interned(row[4]),
+                    *row[5:],
                 )
-                self.mistakes[mistake.mistake_id] = mistake
-
-            cursor.execute(
-                "SELECT preference_id, category, description, preference_value, learned_from_session, confidence, created_at, updated_at FROM player_preferences"
-            )
-            for row in cursor.fetchall():
-                preference = PlayerPreference(
-                    preference_id=row[0],
-                    category=row[1],
-                    description=row[2],
-                    preference_value=json.loads(row[3]) if row[3] else None,
-                    learned_from_session=row[4],
-                    confidence=row[5],
-                    created_at=row[6],
-                    updated_at=row[7],
+                store_mistake(row[0], mistake)
+
+            store_preference = self.preferences.__setitem__
+            cursor.execute(_SELECT_PREFERENCES_SQL)
+            for row in cursor:
+                store_preference(
+                    row[1],
+                    PlayerPreference(
+                        row[0],
+                        row[1],
+                        row[2],
+                        loads(row[3]) if row[3] else None,
+                        *row[4:],
+                    ),
                 )
-                self.preferences[preference.category] = preference
 
-            cursor.execute(
-                "SELECT total_sessions, total_battles, overall_win_rate FROM tactician_stats"
-            )
+            has_wins = _has_column(cursor, "tactician_stats", "total_wins")
+            cursor.execute(_SELECT_STATS_SQL if has_wins else _SELECT_LEGACY_STATS_SQL)
             stats = cursor.fetchone()
             if stats:
                 self.total_sessions = stats[0]
                 self.total_battles = stats[1]
                 self.overall_win_rate = stats[2]
+                wins = stats[3] if has_wins else None
+                # Older saves hold only the rate; whole wins are recovered from it
+                self.total_wins = (
+                    wins if wins is not None else round(stats[2] * stats[1])
+                )
 
-            conn.close()
+            if owns_conn:
+                conn.close()
             self.last_saved = time.time()
             logger.info(
                 f"Loaded {len(self.patterns)} patterns, {len(self.strategies)} strategies, {len(self.mistakes)} mistakes, {len(self.preferences)} preferences"
@@ -810,10 +1045,27 @@ class TacticianMemory:
             logger.error(f"Failed to load tactician memory: {e}")
             return False
 
-    def save_to_database(self, db_path: str) -> bool:
-        """Save persistent memory to database"""
+    def save_to_database(self, db_path: DatabaseTarget) -> bool:
+        """Save persistent memory to a database path or open connection"""
+        owns_conn = isinstance(db_path, str)
         try:
-            conn = sqlite3.connect(db_path)
+            if isinstance(db_path, str):
+                conn = sqlite3.connect(db_path)
+            else:
+                conn = db_path
+                # A borrowed connection may carry the caller's own pending
+                # work, so the save commits or rolls back only its savepoint
+                conn.execute("SAVEPOINT tactician_save")
+        except sqlite3.Error as e:
+            logger.error(f"Failed to save tactician memory: {e}")
+            return False
+        try:
+            if owns_conn:
+                # WAL with NORMAL sync commits without an fsync per transaction;
+                # a 20 MB page cache keeps large saves out of the filesystem
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+                conn.execute("PRAGMA cache_size=-20000")
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -880,22 +1132,23 @@ class TacticianMemory:
                     id INTEGER PRIMARY KEY CHECK (id = 1),
                     total_sessions INTEGER,
                     total_battles INTEGER,
-                    overall_win_rate REAL
+                    overall_win_rate REAL,
+                    total_wins INTEGER
                 )
             """)
-
-            for pattern in self.patterns.values():
+            if not _has_column(cursor, "tactician_stats", "total_wins"):
                 cursor.execute(
-                    """
-                    INSERT OR REPLACE INTO tactician_patterns
-                    (pattern_id, pattern_type, description, trigger_conditions, learned_from_session, learned_from_tick, success_count, failure_count, confidence, last_validated, relevance_score)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
+                    "ALTER TABLE tactician_stats ADD COLUMN total_wins INTEGER"
+                )
+
+            cursor.executemany(
+                _INSERT_PATTERNS_SQL,
+                [
                     (
                         pattern.pattern_id,
                         pattern.pattern_type,
                         pattern.description,
-                        json.dumps(pattern.trigger_conditions),
+                        _json_dumps(pattern.trigger_conditions),
                         pattern.learned_from_session,
                         pattern.learned_from_tick,
                         pattern.success_count,
@@ -903,120 +1156,129 @@ class TacticianMemory:
                         pattern.confidence,
                         pattern.last_validated,
                         pattern.relevance_score,
-                    ),
-                )
+                    )
+                    for pattern in self.patterns.values()
+                ],
+            )
 
-            for strategy in self.strategies.values():
-                cursor.execute(
-                    """
-                    INSERT OR REPLACE INTO successful_strategies
-                    (strategy_id, context, enemy_type, player_pokemon, strategy_description, moves_sequence, success_rate, total_uses, successful_uses, first_used, last_used)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
+            cursor.executemany(
+                _INSERT_STRATEGIES_SQL,
+                [
                     (
                         strategy.strategy_id,
-                        json.dumps(strategy.context),
+                        _json_dumps(strategy.context),
                         strategy.enemy_type,
                         strategy.player_pokemon,
                         strategy.strategy_description,
-                        json.dumps(strategy.moves_sequence),
+                        _json_dumps(strategy.moves_sequence),
                         strategy.success_rate,
                         strategy.total_uses,
                         strategy.successful_uses,
                         strategy.first_used,
                         strategy.last_used,
-                    ),
-                )
+                    )
+                    for strategy in self.strategies.values()
+                ],
+            )
 
-            for mistake in self.mistakes.values():
-                cursor.execute(
-                    """
-                    INSERT OR REPLACE INTO mistake_records
-                    (mistake_id, description, situation, outcome, severity, prevention_tip, first_occurred, last_occurred, occurrence_count)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
+            cursor.executemany(
+                _INSERT_MISTAKES_SQL,
+                [
                     (
                         mistake.mistake_id,
                         mistake.description,
-                        json.dumps(mistake.situation),
+                        _json_dumps(mistake.situation),
                         mistake.outcome,
                         mistake.severity,
                         mistake.prevention_tip,
                         mistake.first_occurred,
                         mistake.last_occurred,
                         mistake.occurrence_count,
-                    ),
-                )
+                    )
+                    for mistake in self.mistakes.values()
+                ],
+            )
 
-            for preference in self.preferences.values():
-                cursor.execute(
-                    """
-                    INSERT OR REPLACE INTO player_preferences
-                    (preference_id, category, description, preference_value, learned_from_session, confidence, created_at, updated_at)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """,
+            cursor.executemany(
+                _INSERT_PREFERENCES_SQL,
+                [
                     (
                         preference.preference_id,
                         preference.category,
                         preference.description,
-                        json.dumps(preference.preference_value),
+                        _json_dumps(preference.preference_value),
                         preference.learned_from_session,
                         preference.confidence,
                         preference.created_at,
                         preference.updated_at,
-                    ),
-                )
+                    )
+                    for preference in self.preferences.values()
+                ],
+            )
 
             cursor.execute(
-                """
-                INSERT OR REPLACE INTO tactician_stats (id, total_sessions, total_battles, overall_win_rate)
-                VALUES (1, ?, ?, ?)
-            """,
-                (self.total_sessions, self.total_battles, self.overall_win_rate),
+                _INSERT_STATS_SQL,
+                (
+                    self.total_sessions,
+                    self.total_battles,
+                    self.overall_win_rate,
+                    self.total_wins,
+                ),
             )
 
-            conn.commit()
-            conn.close()
+            if owns_conn:
+                conn.commit()
+            else:
+                conn.execute("RELEASE tactician_save")
             self.last_saved = time.time()
             logger.info(
                 f"Saved {len(self.patterns)} patterns, {len(self.strategies)} strategies, {len(self.mistakes)} mistakes, {len(self.preferences)} preferences"
             )
             return True
         except Exception as e:
+            # Drop a partial save rather than leave it pending on the connection
+            if owns_conn:
+                conn.rollback()
+            else:
+                conn.execute("ROLLBACK TO tactician_save")
+                conn.execute("RELEASE tactician_save")
             logger.error(f"Failed to save tactician memory: {e}")
             return False
+        finally:
+            if owns_conn:
+                conn.close()
 
     def prune_low_value(self, config: "ConsolidationConfig") -> int:
         """Prune low-value memories based on config"""
         pruned_count = 0
+        self.flush_access_stats()
+        now = time.time()
 
-        patterns_by_type = defaultdict(list)
-        for pattern in self.patterns.values():
-            patterns_by_type[pattern.pattern_type].append(pattern)
-
-        for pattern_type, patterns in patterns_by_type.items():
-            if len(patterns) <= config.max_patterns_per_type:
+        for patterns in self._patterns_by_type().values():
+            excess = len(patterns) - config.max_patterns_per_type
+            if excess <= 0:
                 continue
-            patterns.sort(key=lambda p: (p.relevance_score, p.confidence), reverse=True)
-            for pattern in patterns[config.max_patterns_per_type :]:
+            for pattern in _lowest_ranked(
+                patterns, excess, lambda p: (p.retention_score(now), p.confidence)
+            ):
                 del self.patterns[pattern.pattern_id]
                 pruned_count += 1
 
-        if len(self.strategies) > config.max_strategies:
-            strategies = sorted(
-                self.strategies.values(), key=lambda s: s.success_rate, reverse=True
-            )
-            for strategy in strategies[config.max_strategies :]:
+        excess = len(self.strategies) - config.max_strategies
+        if excess > 0:
+            for strategy in _lowest_ranked(
+                list(self.strategies.values()), excess, lambda s: s.success_rate
+            ):
                 del self.strategies[strategy.strategy_id]
                 pruned_count += 1
 
-        if len(self.mistakes) > config.max_mistakes:
-            mistakes = sorted(
-                self.mistakes.values(),
-                key=lambda m: self._severity_weight(m.severity),
-                reverse=True,
-            )
-            for mistake in mistakes[config.max_mistakes :]:
+        excess = len(self.mistakes) - config.max_mistakes
+        if excess > 0:
+            for mistake in _lowest_ranked(
+                list(self.mistakes.values()),
+                excess,
+                lambda m: self._severity_weight(m.severity),
+            ):
                 del self.mistakes[mistake.mistake_id]
                 pruned_count += 1
 
@@ -1027,14 +1289,15 @@ class TacticianMemory:
         return {
             "total_sessions": self.total_sessions,
             "total_battles": self.total_battles,
+            "total_wins": self.total_wins,
             "overall_win_rate": self.overall_win_rate,
             "patterns_count": len(self.patterns),
             "strategies_count": len(self.strategies),
             "mistakes_count": len(self.mistakes),
             "preferences_count": len(self.preferences),
             "patterns_by_type": {
-                pt: len([p for p in self.patterns.values() if p.pattern_type == pt])
-                for pt in set(p.pattern_type for p in self.patterns.values())
+                pattern_type: len(patterns)
+                for pattern_type, patterns in self._patterns_by_type().items()
             },
             "high_confidence_patterns": len(self.get_high_confidence_patterns()),
         }
@@ -1045,7 +1308,7 @@ class TacticianMemory:
 # ============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class ConsolidationConfig:
     """Configuration for consolidation behavior"""
 
@@ -1060,7 +1323,7 @@ class ConsolidationConfig:
     importance_threshold: float = 0.3
 
 
-@dataclass
+@dataclass(slots=True)
 class ConsolidationResult:
     """Result of a consolidation operation"""
 
@@ -1098,7 +1361,9 @@ class MemoryConsolidator:
         self.strategist = strategist_memory
         self.tactician = tactician_memory
         self.last_consolidation_tick = 0
-        self.consolidation_history: List[ConsolidationResult] = []
+        self.consolidation_history: Deque[ConsolidationResult] = deque(
+            maxlen=MAX_CONSOLIDATION_HISTORY
+        )
         self._pending_patterns: List[Dict[str, Any]] = []
         self._pending_strategies: List[Dict[str, Any]] = []
         self._pending_mistakes: List[Dict[str, Any]] = []
@@ -1109,15 +1374,19 @@ class MemoryConsolidator:
 
         Triggers consolidation every N ticks or at session end
         """
+        if self.tactician:
+            self.tactician.flush_access_stats()
         if current_tick - self.last_consolidation_tick >= self.config.tick_interval:
             return self.consolidate_all()
         return None
 
     def consolidate_all(self) -> ConsolidationResult:
         """Perform full consolidation cycle"""
-        start_time = time.time()
+        start_time = time.perf_counter()
         result = ConsolidationResult(success=True)
 
+        # Stages run sequentially: forgetting prunes the strategies and
+        # mistakes the strategist stage adds, and all of them hold the GIL
         if self.observer and self.strategist:
             observer_result = self.consolidate_observer_to_strategist()
             result.patterns_extracted = observer_result.patterns_extracted
@@ -1134,15 +1403,12 @@ class MemoryConsolidator:
             result.memories_pruned = forgetting_result.memories_pruned
             result.details["forgetting"] = forgetting_result.details
 
-        result.consolidation_time_ms = (time.time() - start_time) * 1000
+        result.consolidation_time_ms = (time.perf_counter() - start_time) * 1000
         self.last_consolidation_tick = (
             self.observer.current_state.tick if self.observer else 0
         )
         self.consolidation_history.append(result)
 
-        if len(self.consolidation_history) > 100:
-            self.consolidation_history = self.consolidation_history[-100:]
-
         logger.info(
             f"Consolidation completed in {result.consolidation_time_ms:.2f}ms: "
             f"+{result.patterns_extracted} patterns, +{result.strategies_created} strategies, "
@@ -1170,18 +1436,27 @@ class MemoryConsolidator:
             result.details["message"] = "Not enough actions for pattern extraction"
             return result
 
-        successful_actions = [a for a in recent_actions if a.success]
-        failed_actions = [a for a in recent_actions if not a.success]
+        # One pass splits the window; action types keep first-seen order
+        successful_actions: List[ActionRecord] = []
+        failed_actions: List[ActionRecord] = []
+        success_types: Dict[str, None] = {}
+        failure_types: Dict[str, None] = {}
+        for action in recent_actions:
+            if action.success:
+                successful_actions.append(action)
+                success_types[action.action_type] = None
+            else:
+                failed_actions.append(action)
+                failure_types[action.action_type] = None
+        success_rate = len(successful_actions) / len(recent_actions)
 
         if successful_actions:
             success_pattern = {
                 "pattern_type": "action_sequence",
                 "description": f"Successful sequence: {', '.join(a.action_value for a in successful_actions[-3:])}",
                 "trigger_conditions": {
-                    "action_types": list(
-                        set(a.action_type for a in successful_actions)
-                    ),
-                    "success_rate": len(successful_actions) / len(recent_actions),
+                    "action_types": list(success_types),
+                    "success_rate": success_rate,
                 },
                 "actions": [a.action_value for a in successful_actions],
                 "success": True,
@@ -1194,10 +1469,8 @@ class MemoryConsolidator:
                 "pattern_type": "failed_approach",
                 "description": f"Failed sequence: {', '.join(a.action_value for a in failed_actions[-3:])}",
                 "trigger_conditions": {
-                    "action_types": list(set(a.action_type for a in failed_actions)),
-                    "success_rate": len(successful_actions) / len(recent_actions)
-                    if recent_actions
-                    else 0,
+                    "action_types": list(failure_types),
+                    "success_rate": success_rate,
                 },
                 "actions": [a.action_value for a in failed_actions],
                 "success": False,
@@ -1229,68 +1502,55 @@ class MemoryConsolidator:
             result.details["message"] = "No battles to consolidate"
             return result
 
-        battle_outcomes: Dict[str, Dict[str, object]] = defaultdict(
-            lambda: {"wins": 0, "losses": 0, "moves": []}
-        )
-
-        for battle in battles:
-            key = f"{battle.enemy_pokemon}_{battle.player_pokemon}"
-            if battle.outcome == "victory":
-                battle_outcomes[key]["wins"] = (
-                    cast(int, battle_outcomes[key]["wins"]) + 1
-                )
-                cast(List[str], battle_outcomes[key]["moves"]).extend(battle.moves_used)
-            else:
-                battle_outcomes[key]["losses"] = (
-                    cast(int, battle_outcomes[key]["losses"]) + 1
-                )
-
-        for key, outcome in battle_outcomes.items():
-            total = cast(int, outcome["wins"]) + cast(int, outcome["losses"])
-            win_rate = cast(int, outcome["wins"]) / total if total > 0 else 0.0
-
-            if win_rate >= self.config.pattern_threshold and outcome["moves"]:
-                parts = key.split("_")
-                enemy_type = parts[0] if parts else "Unknown"
-                player_pokemon = parts[1] if len(parts) > 1 else "Unknown"
-
-                if self.tactician:
-                    strategy = self.tactician.get_or_create_strategy(
-                        context={"battle_type": "wild"},
-                        enemy_type=enemy_type,
-                        player_pokemon=player_pokemon,
-                        moves_sequence=list(
-                            dict.fromkeys(cast(List[str], outcome["moves"])[-5:])
-                        ),
-                    )
-                    strategy.record_use(True)
-                    result.strategies_created += 1
-
-        for battle in battles:
-            if battle.outcome == "defeat":
-                mistake_key = f"mistake_{battle.enemy_pokemon}_{battle.player_pokemon}_{battle.turns_taken}"
-                mistake = MistakeRecord(
-                    mistake_id=mistake_key,
-                    description=f"Lost to {battle.enemy_pokemon} with {battle.player_pokemon}",
-                    situation={
-                        "enemy_pokemon": battle.enemy_pokemon,
-                        "enemy_level": battle.enemy_level,
-                        "player_pokemon": battle.player_pokemon,
-                        "player_level": battle.player_level,
-                        "turns_taken": battle.turns_taken,
-                    },
-                    outcome="defeat",
-                    severity="major" if battle.player_hp_remaining == 0 else "minor",
-                    prevention_tip="Consider switching Pokemon or using different strategy",
-                    first_occurred=time.time(),
-                    last_occurred=time.time(),
-                    occurrence_count=1,
-                )
+        # Battles, wins and winning moves per (enemy, player) matchup
+        totals = Counter((b.enemy_pokemon, b.player_pokemon) for b in battles)
+        wins: Counter[Tuple[str, str]] = Counter()
+        winning_moves: Dict[Tuple[str, str], List[str]] = defaultdict(list)
+        for battle in self.strategist.get_battles_by_outcome("victory"):
+            key = (battle.enemy_pokemon, battle.player_pokemon)
+            wins[key] += 1
+            winning_moves[key].extend(battle.moves_used)
+
+        threshold = self.config.pattern_threshold
+        for key, total in totals.items():
+            moves = winning_moves.get(key)
+            if not moves or wins[key] / total < threshold:
+                continue
+            enemy_type, player_pokemon = key
+            strategy = self.tactician.get_or_create_strategy(
+                context={"battle_type": "wild"},
+                enemy_type=enemy_type,
+                player_pokemon=player_pokemon,
+                moves_sequence=list(dict.fromkeys(moves[-5:])),
+            )
+            self.tactician.record_strategy_success(strategy.strategy_id, True)
+            result.strategies_created += 1
+
+        now = time.time()
+        for battle in self.strategist.get_battles_by_outcome("defeat"):
+            mistake_key = f"mistake_{battle.enemy_pokemon}_{battle.player_pokemon}_{battle.turns_taken}"
+            mistake = MistakeRecord(
+                mistake_id=mistake_key,
+                description=f"Lost to {battle.enemy_pokemon} with {battle.player_pokemon}",
+                situation={
+                    "enemy_pokemon": battle.enemy_pokemon,
+                    "enemy_level": battle.enemy_level,
+                    "player_pokemon": battle.player_pokemon,
+                    "player_level": battle.player_level,
+                    "turns_taken": battle.turns_taken,
+                },
+                outcome="defeat",
+                severity="major" if battle.player_hp_remaining == 0 else "minor",
+                prevention_tip="Consider switching Pokemon or using different strategy",
+                first_occurred=now,
+                last_occurred=now,
+                occurrence_count=1,
+            )
 
-                if self.tactician:
-                    if not self.tactician.merge_similar_mistake(mistake):
-                        self.tactician.add_mistake(mistake)
-                        result.mistakes_recorded += 1
+            if self.tactician:
+                if not self.tactician.merge_similar_mistake(mistake):
+                    self.tactician.add_mistake(mistake)
+                    result.mistakes_recorded += 1
 
         result.details["battles_analyzed"] = len(battles)
         return result
@@ -1337,8 +1597,7 @@ class MemoryConsolidator:
         if self.strategist:
             priorities["strategist"] = [
                 obj.objective_id
-                for obj in self.strategist.objectives
-                if obj.status == "active"
+                for obj in self.strategist.get_objectives_by_status("active")
             ]
             priorities["strategist"].extend(
                 b.battle_id for b in self.strategist.battle_history[-10:]
@@ -1405,12 +1664,14 @@ class MemoryDatabaseMixin:
     """Mixins for database operations"""
 
     @staticmethod
-    def save_tactician_memory(tactician: TacticianMemory, db_path: str) -> bool:
+    def save_tactician_memory(
+        tactician: TacticianMemory, db_path: DatabaseTarget
+    ) -> bool:
         """Save tactician memory to database"""
         return tactician.save_to_database(db_path)
 
     @staticmethod
-    def load_tactician_memory(db_path: str) -> TacticianMemory:
+    def load_tactician_memory(db_path: DatabaseTarget) -> TacticianMemory:
         """Load tactician memory from database"""
         tactician = TacticianMemory()
         tactician.load_from_database(db_path)
@@ -1432,19 +1693,14 @@ class MemoryDatabaseMixin:
                 (
                     session_id,
                     json.dumps(strategist.to_dict()),
+                    json.dumps([b.to_dict() for b in strategist.battle_history]),
                     json.dumps(
-                        [
-                            b.to_dict() if hasattr(b, "to_dict") else b
-                            for b in strategist.battle_history
-                        ]
-                    ),
-                    json.dumps(strategist.locations_visited),
-                    json.dumps(
-                        [
-                            o.to_dict() if hasattr(o, "to_dict") else o
-                            for o in strategist.objectives
-                        ]
+                        {
+                            name: location.to_dict()
+                            for name, location in strategist.locations_visited.items()
+                        }
                     ),
+                    json.dumps([o.to_dict() for o in strategist.objectives]),
                 ),
             )
             db.commit()
@@ -1477,7 +1733,7 @@ class MemoryDatabaseMixin:
                     active_objective=None,
                     battle_history=[],
                     locations_visited={},
-                    resource_history=[],
+                    resource_history=deque(maxlen=MAX_RESOURCE_SNAPSHOTS),
                 )
                 return strategist
             return None
@@ -1537,7 +1793,7 @@ class MemoryGOAPIntegration:
         strategist: StrategistMemory,
     ) -> List[SessionObjective]:
         """Get active objectives for GOAP"""
-        return [o for o in strategist.objectives if o.status == "active"]
+        return strategist.get_objectives_by_status("active")
 
     @staticmethod
     def query_tactician_strategies(
@@ -1553,9 +1809,7 @@ class MemoryGOAPIntegration:
         observer: ObserverMemory, success: bool, outcome: str
     ) -> None:
         """Record planning outcome for learning"""
-        if observer.recent_actions:
-            observer.recent_actions[-1].success = success
-            observer.recent_actions[-1].outcome_summary = outcome
+        observer.set_last_outcome(success, outcome)
 
     @staticmethod
     def get_action_history_for_planning(
@@ -1659,7 +1913,7 @@ class MemoryAIIntegration:
         if not observer.recent_actions:
             return "No recent actions."
 
-        recent = observer.recent_actions[-5:]
+        recent = list(observer.recent_actions)[-5:]
         successes = sum(1 for a in recent if a.success)
 
         parts = [f"Last {len(recent)} actions ({successes} successful):"]
@@ -1705,7 +1959,7 @@ def create_strategist_memory(session_id: str, start_tick: int) -> StrategistMemo
         active_objective=None,
         battle_history=[],
         locations_visited={},
-        resource_history=[],
+        resource_history=deque(maxlen=MAX_RESOURCE_SNAPSHOTS),
     )
 
 
@@ -1760,7 +2014,7 @@ class GameMemory:
     """
 
     def __init__(self) -> None:
-        self.recent_actions: list[str] = []  # last 20 action strings
+        self.recent_actions: Deque[str] = deque(maxlen=20)  # last 20 action strings
         self.party_status: dict[str, str] = {}  # pokémon name → status
         self.active_goal: str = ""  # current objective
         self.battles_fought: int = 0
@@ -1769,10 +2023,8 @@ class GameMemory:
     # -- mutation ---------------------------------------------------------
 
     def record_action(self, action_str: str) -> None:
-        """Append an action description and cap the buffer at 20."""
+        """Append an action description; the buffer drops its oldest past 20."""
         self.recent_actions.append(action_str)
-        if len(self.recent_actions) > 20:
-            self.recent_actions = self.recent_actions[-20:]
 
     def update_party(self, status: str) -> None:
         """Update the party status string (e.g. 'Squirtle L12 healthy, Pidgey L10 fainted')."""
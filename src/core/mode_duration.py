@@ -7,12 +7,27 @@ statistical anomaly detection, and adaptive break-out mechanisms.
 
 import json
 import os
+import sys
 import time
-from dataclasses import dataclass, field, asdict
-from typing import Dict, List, Optional, Any, Tuple, DefaultDict, cast
-from collections import defaultdict
+from dataclasses import dataclass, field, fields, asdict, replace
+from itertools import islice
+from typing import (
+    Callable,
+    Deque,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Any,
+    Sequence,
+    Tuple,
+    DefaultDict,
+    cast,
+)
+from collections import Counter, OrderedDict, defaultdict, deque
 from enum import Enum
 import threading
+from types import MappingProxyType
 
 
 class GameMode(Enum):
@@ -84,7 +99,7 @@ class BreakoutStrategy(Enum):
     INCREASE_MONITORING = "increase_monitoring"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ModeClassification:
     mode: str
     sub_mode: str
@@ -94,7 +109,7 @@ class ModeClassification:
     state_snapshot: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ModeEntry:
     mode: str
     sub_mode: str
@@ -104,7 +119,7 @@ class ModeEntry:
     state_snapshot: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ModeExit:
     mode: str
     sub_mode: str
@@ -117,7 +132,7 @@ class ModeExit:
     exit_reason: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ModeDurationProfile:
     mode: str
     sub_mode: str
@@ -142,7 +157,7 @@ class ModeDurationProfile:
         return cls(**data)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Anomaly:
     type: str
     severity: str
@@ -154,7 +169,7 @@ class Anomaly:
     recommended_action: str = "log_warning"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BreakoutResult:
     success: bool
     strategy: str
@@ -173,19 +188,290 @@ class ResponsePlan:
     all_anomalies: List[Anomaly] = field(default_factory=list)
 
 
+# Bit offsets of the base-mode signature packed by ModeClassifier: one bit per
+# boolean flag, then the screen type code in the two bits above them.
+_BATTLE_BIT = 1
+_DIALOG_BIT = 1 << 1
+_MENU_BIT = 1 << 2
+_SCREEN_TYPE_SHIFT = 3
+
+# Screen types that select a base mode on their own; anything else packs as 0.
+_SCREEN_TYPE_CODES = {"cutscene": 1, "transition": 2}
+
+# State keys ModeClassifier reads; together they fully determine its output.
+_CLASSIFIER_STATE_KEYS = (
+    "is_battle",
+    "has_dialog",
+    "is_menu",
+    "screen_type",
+    "menu_type",
+    "near_pc",
+    "near_npc",
+    "enemy_level",
+    "party_level",
+    "dialog_text",
+    "trainer_name",
+    "gym_leader",
+    "elite_four",
+)
+
+# Marks keys absent from a state, which classify differently from explicit None.
+_MISSING = object()
+_MISSING_DEFAULTS = (_MISSING,) * len(_CLASSIFIER_STATE_KEYS)
+
+# Upper bound on distinct state signatures ModeClassifier keeps memoized.
+MAX_CACHED_CLASSIFICATIONS = 256
+
+# Ticks for which a memoized mode, sub-mode and confidence are reused before
+# being recomputed. Hits still carry their own timestamp, tick and snapshot.
+CLASSIFICATION_CACHE_TICKS = 6
+
+# Mode transitions DurationTracker keeps in its mode_sequence ring buffer.
+MAX_MODE_SEQUENCE = 100
+
+# Escalation rank of each anomaly severity; LOW and unknown severities rank 0.
+# The most severe anomaly is found in one pass and the rank indexes the
+# response tier and escalation tier tables below.
+_SEVERITY_RANK = {
+    AnomalySeverity.MEDIUM.value: 1,
+    AnomalySeverity.HIGH.value: 2,
+    AnomalySeverity.CRITICAL.value: 3,
+}
+_RESPONSE_TIER_BY_RANK = ("NONE", "MEDIUM", "HIGH", "EMERGENCY")
+
+# EscalationTier members from least to most severe; ModeDurationEscalation
+# works in indexes into this tuple and converts back only for the result.
+_ESCALATION_TIERS = (
+    EscalationTier.NONE,
+    EscalationTier.ENHANCED_MONITORING,
+    EscalationTier.PLAN_SIMPLIFICATION,
+    EscalationTier.EMERGENCY_PROTOCOL,
+    EscalationTier.RESET_CONDITION,
+)
+
+# Shared result for the common tick where AnomalyDetector finds nothing, so the
+# steady state allocates no anomaly lists.
+_NO_ANOMALIES: Tuple[Anomaly, ...] = ()
+
+# Interned "MODE/SUB_MODE" keys by (mode, sub_mode), and the size at which the
+# cache is dropped so arbitrary caller-supplied names cannot grow it forever.
+_MODE_KEYS: Dict[Tuple[str, str], str] = {}
+MAX_CACHED_MODE_KEYS = 1024
+
+
+def _mode_key(mode: str, sub_mode: str) -> str:
+    """Return the interned "MODE/SUB_MODE" key for a mode pair."""
+    key = _MODE_KEYS.get((mode, sub_mode))
+    if key is None:
+        if len(_MODE_KEYS) >= MAX_CACHED_MODE_KEYS:
+            _MODE_KEYS.clear()
+        key = _MODE_KEYS[(mode, sub_mode)] = sys.intern(f"{mode}/{sub_mode}")
+    return key
+
+
+# Duration thresholds used until a mode has enough samples for a learned
+# profile, keyed by "MODE/SUB_MODE"; other modes fall back to the generic set.
+# get_thresholds hands these out directly, so they are read-only proxies.
+_DEFAULT_THRESHOLDS: Mapping[str, Mapping[str, float]] = MappingProxyType(
+    {
+        f"{GameMode.BATTLE.value}/WILD_EASY": MappingProxyType(
+            {"warning": 300, "critical": 600, "emergency": 1200}
+        ),
+        f"{GameMode.BATTLE.value}/WILD_NORMAL": MappingProxyType(
+            {"warning": 300, "critical": 600, "emergency": 1200}
+        ),
+        f"{GameMode.BATTLE.value}/WILD_HARD": MappingProxyType(
+            {"warning": 600, "critical": 1200, "emergency": 2400}
+        ),
+        f"{GameMode.BATTLE.value}/TRAINER": MappingProxyType(
+            {"warning": 600, "critical": 1200, "emergency": 2400}
+        ),
+        f"{GameMode.BATTLE.value}/GYM_LEADER": MappingProxyType(
+            {"warning": 900, "critical": 1800, "emergency": 3600}
+        ),
+        f"{GameMode.BATTLE.value}/ELITE_FOUR": MappingProxyType(
+            {"warning": 1800, "critical": 3600, "emergency": 7200}
+        ),
+        f"{GameMode.DIALOG.value}/NPC_SHORT": MappingProxyType(
+            {"warning": 60, "critical": 180, "emergency": 300}
+        ),
+        f"{GameMode.DIALOG.value}/NPC_LONG": MappingProxyType(
+            {"warning": 600, "critical": 1200, "emergency": 2400}
+        ),
+        f"{GameMode.DIALOG.value}/TUTORIAL": MappingProxyType(
+            {"warning": 1800, "critical": 3600, "emergency": 7200}
+        ),
+        f"{GameMode.DIALOG.value}/QUEST": MappingProxyType(
+            {"warning": 900, "critical": 1800, "emergency": 3600}
+        ),
+        f"{GameMode.DIALOG.value}/SHOP": MappingProxyType(
+            {"warning": 300, "critical": 600, "emergency": 1200}
+        ),
+        f"{GameMode.OVERWORLD.value}/NAVIGATION": MappingProxyType(
+            {"warning": 300, "critical": 600, "emergency": 1200}
+        ),
+        f"{GameMode.OVERWORLD.value}/INTERACTION": MappingProxyType(
+            {"warning": 120, "critical": 300, "emergency": 600}
+        ),
+        f"{GameMode.OVERWORLD.value}/PC": MappingProxyType(
+            {"warning": 180, "critical": 300, "emergency": 600}
+        ),
+        f"{GameMode.MENU.value}/PAUSE": MappingProxyType(
+            {"warning": 120, "critical": 300, "emergency": 600}
+        ),
+        f"{GameMode.MENU.value}/POKEMON": MappingProxyType(
+            {"warning": 300, "critical": 600, "emergency": 1200}
+        ),
+        f"{GameMode.MENU.value}/BAG": MappingProxyType(
+            {"warning": 120, "critical": 300, "emergency": 600}
+        ),
+        f"{GameMode.CUTSCENE.value}/INTRO": MappingProxyType(
+            {"warning": 600, "critical": 1200, "emergency": 2400}
+        ),
+        f"{GameMode.CUTSCENE.value}/EVOLUTION": MappingProxyType(
+            {"warning": 180, "critical": 300, "emergency": 600}
+        ),
+        f"{GameMode.CUTSCENE.value}/VICTORY": MappingProxyType(
+            {"warning": 60, "critical": 120, "emergency": 180}
+        ),
+    }
+)
+_FALLBACK_THRESHOLDS: Mapping[str, float] = MappingProxyType(
+    {"warning": 120.0, "critical": 300.0, "emergency": 600.0}
+)
+
+# Size at which DurationProfileStore folds its append-only log back into the
+# JSON snapshot.
+MAX_PROFILE_LOG_BYTES = 64 * 1024
+
+# AnomalyDetector tiers, indexed by how many of the two cut-offs a value
+# exceeds: (type, severity, threshold level, recommended action).
+_AnomalyTier = Optional[Tuple[str, str, str, str]]
+_Z_SCORE_TIERS: Tuple[_AnomalyTier, ...] = (
+    None,
+    ("DURATION_HIGH", AnomalySeverity.HIGH.value, "critical", "break_out_aggressive"),
+    (
+        "DURATION_EXTREME",
+        AnomalySeverity.CRITICAL.value,
+        "emergency",
+        "break_out_immediate",
+    ),
+)
+_DURATION_TIERS: Tuple[_AnomalyTier, ...] = (
+    None,
+    (
+        "DURATION_WARNING",
+        AnomalySeverity.MEDIUM.value,
+        "critical",
+        "increase_monitoring",
+    ),
+    (
+        "DURATION_THRESHOLD",
+        AnomalySeverity.HIGH.value,
+        "emergency",
+        "break_out_aggressive",
+    ),
+)
+_CUMULATIVE_SESSION_TIERS: Tuple[_AnomalyTier, ...] = (
+    None,
+    (
+        "CUMULATIVE_SESSION_CRITICAL",
+        AnomalySeverity.MEDIUM.value,
+        "critical",
+        "increase_monitoring",
+    ),
+    (
+        "CUMULATIVE_SESSION_EMERGENCY",
+        AnomalySeverity.HIGH.value,
+        "emergency",
+        "force_break_out",
+    ),
+)
+_CUMULATIVE_HOUR_TIERS: Tuple[_AnomalyTier, ...] = (
+    None,
+    None,
+    (
+        "CUMULATIVE_HOUR_EMERGENCY",
+        AnomalySeverity.HIGH.value,
+        "emergency",
+        "force_break_out",
+    ),
+)
+
+
+def _shallow_asdict(instance: Any) -> Dict[str, Any]:
+    """Field dict for a slotted dataclass, without asdict's deep copies."""
+    return {f.name: getattr(instance, f.name) for f in fields(instance)}
+
+
 class ModeClassifier:
     def __init__(self, state_machine: Optional[Any] = None):
         self.state_machine = state_machine
-        self._mode_cache: Optional[Tuple[ModeClassification, float]] = None
-        self._cache_ttl = 0.1
+        self._mode_cache: OrderedDict[Tuple[Any, ...], ModeClassification] = (
+            OrderedDict()
+        )
+        self._base_mode_table = self._compile_base_mode_table()
+        self._sub_mode_classifiers: Dict[
+            str, Callable[[Dict[str, Any], Dict[str, Any]], str]
+        ] = {
+            GameMode.BATTLE.value: self._classify_battle_sub_mode,
+            GameMode.DIALOG.value: self._classify_dialog_sub_mode,
+            GameMode.OVERWORLD.value: self._classify_overworld_sub_mode,
+            GameMode.MENU.value: self._classify_menu_sub_mode,
+            GameMode.CUTSCENE.value: self._classify_cutscene_sub_mode,
+        }
+
+    @staticmethod
+    def _compile_base_mode_table() -> Dict[int, str]:
+        # Resolve the battle > dialog > menu > cutscene > transition > overworld
+        # priority once for every signature instead of on every classification.
+        table = {}
+        for key in range((len(_SCREEN_TYPE_CODES) + 1) << _SCREEN_TYPE_SHIFT):
+            screen_code = key >> _SCREEN_TYPE_SHIFT
+            if key & _BATTLE_BIT:
+                mode = GameMode.BATTLE
+            elif key & _DIALOG_BIT:
+                mode = GameMode.DIALOG
+            elif key & _MENU_BIT:
+                mode = GameMode.MENU
+            elif screen_code == _SCREEN_TYPE_CODES["cutscene"]:
+                mode = GameMode.CUTSCENE
+            elif screen_code == _SCREEN_TYPE_CODES["transition"]:
+                mode = GameMode.TRANSITION
+            else:
+                mode = GameMode.OVERWORLD
+            table[key] = mode.value
+        return table
 
     def classify_mode(
         self, current_state: Dict[str, Any], tick: int = 0
     ) -> ModeClassification:
-        current_time = time.time()
-        if self._mode_cache and current_time - self._mode_cache[1] < self._cache_ttl:
-            return self._mode_cache[0]
+        # map() over the key and default tuples keeps the per-tick signature
+        # build inside C builtins instead of a Python generator frame.
+        signature = tuple(
+            map(current_state.get, _CLASSIFIER_STATE_KEYS, _MISSING_DEFAULTS)
+        )
+        try:
+            cached = self._mode_cache.get(signature)
+        except TypeError:
+            return self._classify(current_state, tick)
+        if cached is not None and 0 <= tick - cached.tick <= CLASSIFICATION_CACHE_TICKS:
+            self._mode_cache.move_to_end(signature)
+            # The stored entry keeps its original tick, so it still expires
+            return replace(
+                cached,
+                timestamp=time.time(),
+                tick=tick,
+                state_snapshot=current_state.copy() if current_state else None,
+            )
+        classification = self._classify(current_state, tick)
+        self._mode_cache[signature] = classification
+        self._mode_cache.move_to_end(signature)
+        if len(self._mode_cache) > MAX_CACHED_CLASSIFICATIONS:
+            self._mode_cache.popitem(last=False)
+        return classification
 
+    def _classify(self, current_state: Dict[str, Any], tick: int) -> ModeClassification:
         base_mode = self._get_base_mode(current_state)
         visual_mode = self._get_visual_mode(current_state)
         text_context = self._get_text_context(current_state)
@@ -194,29 +480,24 @@ class ModeClassifier:
         )
         confidence = self._calculate_confidence(base_mode, visual_mode, text_context)
 
-        classification = ModeClassification(
+        return ModeClassification(
             mode=base_mode,
             sub_mode=sub_mode,
             confidence=confidence,
-            timestamp=current_time,
+            timestamp=time.time(),
             tick=tick,
             state_snapshot=current_state.copy() if current_state else None,
         )
-        self._mode_cache = (classification, current_time)
-        return classification
 
     def _get_base_mode(self, state: Dict[str, Any]) -> str:
-        if state.get("is_battle", False):
-            return GameMode.BATTLE.value
-        elif state.get("has_dialog", False):
-            return GameMode.DIALOG.value
-        elif state.get("is_menu", False):
-            return GameMode.MENU.value
-        elif state.get("screen_type") == "cutscene":
-            return GameMode.CUTSCENE.value
-        elif state.get("screen_type") == "transition":
-            return GameMode.TRANSITION.value
-        return GameMode.OVERWORLD.value
+        screen_code = _SCREEN_TYPE_CODES.get(state.get("screen_type", ""), 0)
+        key = (
+            (_BATTLE_BIT if state.get("is_battle") else 0)
+            | (_DIALOG_BIT if state.get("has_dialog") else 0)
+            | (_MENU_BIT if state.get("is_menu") else 0)
+            | screen_code << _SCREEN_TYPE_SHIFT
+        )
+        return self._base_mode_table[key]
 
     def _get_visual_mode(self, state: Dict[str, Any]) -> Dict[str, Any]:
         return {
@@ -231,14 +512,13 @@ class ModeClassifier:
 
     def _get_text_context(self, state: Dict[str, Any]) -> Dict[str, Any]:
         dialog_text = state.get("dialog_text", "")
+        lowered = dialog_text.lower() if dialog_text else ""
         return {
             "dialog_text": dialog_text,
             "line_count": dialog_text.count("\n") + 1 if dialog_text else 0,
-            "is_tutorial": "tutorial" in dialog_text.lower() if dialog_text else False,
-            "is_quest": "quest" in dialog_text.lower() if dialog_text else False,
-            "is_shop": "shop" in dialog_text.lower() or "buy" in dialog_text.lower()
-            if dialog_text
-            else False,
+            "is_tutorial": "tutorial" in lowered,
+            "is_quest": "quest" in lowered,
+            "is_shop": "shop" in lowered or "buy" in lowered,
             "trainer_name": state.get("trainer_name"),
             "gym_leader": state.get("gym_leader", False),
             "elite_four": state.get("elite_four", False),
@@ -251,17 +531,10 @@ class ModeClassifier:
         text_context: Dict[str, Any],
         state: Dict[str, Any],
     ) -> str:
-        if base_mode == GameMode.BATTLE.value:
-            return self._classify_battle_sub_mode(visual_mode, text_context)
-        elif base_mode == GameMode.DIALOG.value:
-            return self._classify_dialog_sub_mode(text_context)
-        elif base_mode == GameMode.OVERWORLD.value:
-            return self._classify_overworld_sub_mode(visual_mode)
-        elif base_mode == GameMode.MENU.value:
-            return self._classify_menu_sub_mode(visual_mode)
-        elif base_mode == GameMode.CUTSCENE.value:
-            return self._classify_cutscene_sub_mode(visual_mode, text_context)
-        return f"{base_mode}_GENERIC"
+        classifier = self._sub_mode_classifiers.get(base_mode)
+        if classifier is None:
+            return f"{base_mode}_GENERIC"
+        return classifier(visual_mode, text_context)
 
     def _classify_battle_sub_mode(
         self, visual_mode: Dict[str, Any], text_context: Dict[str, Any]
@@ -282,7 +555,9 @@ class ModeClassifier:
             return BattleSubMode.WILD_HARD.value
         return BattleSubMode.WILD_NORMAL.value
 
-    def _classify_dialog_sub_mode(self, text_context: Dict[str, Any]) -> str:
+    def _classify_dialog_sub_mode(
+        self, visual_mode: Dict[str, Any], text_context: Dict[str, Any]
+    ) -> str:
         if text_context.get("is_tutorial"):
             return DialogSubMode.TUTORIAL.value
         elif text_context.get("is_quest"):
@@ -293,15 +568,19 @@ class ModeClassifier:
             return DialogSubMode.NPC_LONG.value
         return DialogSubMode.NPC_SHORT.value
 
-    def _classify_overworld_sub_mode(self, visual_mode: Dict[str, Any]) -> str:
+    def _classify_overworld_sub_mode(
+        self, visual_mode: Dict[str, Any], text_context: Dict[str, Any]
+    ) -> str:
         if visual_mode.get("near_pc"):
             return OverworldSubMode.PC.value
         elif visual_mode.get("near_npc"):
             return OverworldSubMode.INTERACTION.value
         return OverworldSubMode.NAVIGATION.value
 
-    def _classify_menu_sub_mode(self, visual_mode: Dict[str, Any]) -> str:
-        menu_type = visual_mode.get("menu_type", "").lower()
+    def _classify_menu_sub_mode(
+        self, visual_mode: Dict[str, Any], text_context: Dict[str, Any]
+    ) -> str:
+        menu_type = (visual_mode.get("menu_type") or "").lower()
         if menu_type == "pokemon":
             return MenuSubMode.POKEMON.value
         elif menu_type == "bag":
@@ -336,7 +615,8 @@ class ModeClassifier:
 
 
 class DurationTracker:
-    def __init__(self) -> None:
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        self.clock = clock
         self.current_mode: Optional[ModeEntry] = None
         self._last_mode_key: Optional[str] = None
         self.mode_history: List[ModeExit] = []
@@ -345,10 +625,11 @@ class DurationTracker:
             "hour": defaultdict(float),
             "day": defaultdict(float),
         }
-        self.session_start: float = time.time()
-        self.hour_start: float = time.time()
-        self.day_start: float = time.time()
-        self.mode_sequence: List[str] = []
+        now = clock()
+        self.session_start: float = now
+        self.hour_start: float = now
+        self.day_start: float = now
+        self.mode_sequence: Deque[str] = deque(maxlen=MAX_MODE_SEQUENCE)
         self._lock = threading.Lock()
 
     def enter_mode(
@@ -363,8 +644,8 @@ class DurationTracker:
             interrupted_exit = None
             if self.current_mode:
                 prev_mode = self.current_mode
-                prev_mode_key = f"{prev_mode.mode}/{prev_mode.sub_mode}"
-                exit_time = time.time()
+                prev_mode_key = _mode_key(prev_mode.mode, prev_mode.sub_mode)
+                exit_time = self.clock()
                 duration = exit_time - prev_mode.entry_time
                 self._last_mode_key = prev_mode_key
                 self.cumulative_stats["session"][prev_mode_key] += duration
@@ -387,25 +668,22 @@ class DurationTracker:
             self.current_mode = ModeEntry(
                 mode=mode,
                 sub_mode=sub_mode,
-                entry_time=time.time(),
+                entry_time=self.clock(),
                 entry_tick=tick,
                 context=context or {},
                 state_snapshot=state_snapshot,
             )
-            mode_key = f"{mode}/{sub_mode}"
-            self.mode_sequence.append(mode_key)
-            if len(self.mode_sequence) > 100:
-                self.mode_sequence.pop(0)
+            self.mode_sequence.append(_mode_key(mode, sub_mode))
             return interrupted_exit
 
     def exit_mode(self, reason: str = "natural", tick: int = 0) -> Optional[ModeExit]:
         with self._lock:
             if not self.current_mode:
                 return None
-            exit_time = time.time()
+            exit_time = self.clock()
             duration = exit_time - self.current_mode.entry_time
             exit_tick = tick
-            mode_key = f"{self.current_mode.mode}/{self.current_mode.sub_mode}"
+            mode_key = _mode_key(self.current_mode.mode, self.current_mode.sub_mode)
             self._last_mode_key = mode_key
             self.cumulative_stats["session"][mode_key] += duration
             self.cumulative_stats["hour"][mode_key] += duration
@@ -430,7 +708,7 @@ class DurationTracker:
     def get_current_duration(self) -> float:
         if not self.current_mode:
             return 0.0
-        return time.time() - self.current_mode.entry_time
+        return self.clock() - self.current_mode.entry_time
 
     def get_current_cumulative(
         self,
@@ -439,12 +717,12 @@ class DurationTracker:
         sub_mode: Optional[str] = None,
     ) -> float:
         if mode and sub_mode:
-            mode_key = f"{mode}/{sub_mode}"
+            mode_key = _mode_key(mode, sub_mode)
             return cast(Dict[str, float], self.cumulative_stats.get(window, {})).get(
                 mode_key, 0.0
             )
         if self.current_mode:
-            mode_key = f"{self.current_mode.mode}/{self.current_mode.sub_mode}"
+            mode_key = _mode_key(self.current_mode.mode, self.current_mode.sub_mode)
             return cast(Dict[str, float], self.cumulative_stats.get(window, {})).get(
                 mode_key, 0.0
             )
@@ -454,6 +732,25 @@ class DurationTracker:
             )
         return 0.0
 
+    def get_current_cumulatives(self) -> Tuple[float, float, float]:
+        """Session, hour and day totals for the current (or last) mode."""
+        if self.current_mode:
+            mode_key = _mode_key(self.current_mode.mode, self.current_mode.sub_mode)
+        elif self._last_mode_key:
+            mode_key = self._last_mode_key
+        else:
+            return 0.0, 0.0, 0.0
+        stats = self.cumulative_stats
+        return (
+            stats["session"].get(mode_key, 0.0),
+            stats["hour"].get(mode_key, 0.0),
+            stats["day"].get(mode_key, 0.0),
+        )
+
+    def get_recent_sequence(self, n: int = MAX_MODE_SEQUENCE) -> List[str]:
+        sequence = self.mode_sequence
+        return list(islice(sequence, max(0, len(sequence) - n), None))
+
     def get_mode_statistics(self, mode: str, sub_mode: str) -> Dict[str, Any]:
         relevant_exits = [
             e for e in self.mode_history if e.mode == mode and e.sub_mode == sub_mode
@@ -470,7 +767,7 @@ class DurationTracker:
         }
 
     def _check_time_windows(self) -> None:
-        current_time = time.time()
+        current_time = self.clock()
         if current_time - self.hour_start > 3600:
             self.cumulative_stats["hour"].clear()
             self.hour_start = current_time
@@ -479,12 +776,12 @@ class DurationTracker:
             self.day_start = current_time
 
     def _prune_history(self) -> None:
-        cutoff_time = time.time() - 86400
+        cutoff_time = self.clock() - 86400
         self.mode_history = [e for e in self.mode_history if e.exit_time > cutoff_time]
 
     def reset_session(self) -> None:
         with self._lock:
-            self.session_start = time.time()
+            self.session_start = self.clock()
             self.cumulative_stats["session"].clear()
             self.mode_history.clear()
             self.mode_sequence.clear()
@@ -492,17 +789,28 @@ class DurationTracker:
 
 class DurationProfileLearner:
     def __init__(
-        self, alpha: float = 0.3, min_samples: int = 5, outlier_threshold: float = 3.0
+        self,
+        alpha: float = 0.3,
+        min_samples: int = 5,
+        outlier_threshold: float = 3.0,
+        duration_tracker: Optional[DurationTracker] = None,
     ):
         self.profiles: Dict[str, ModeDurationProfile] = {}
         self.alpha = alpha
         self.min_samples = min_samples
         self.outlier_threshold = outlier_threshold
+        self.duration_tracker = duration_tracker
         self._lock = threading.Lock()
+        # Learned thresholds per mode key, with the profile object and sample
+        # count they were derived from; update_profile drops the entry.
+        self._threshold_cache: Dict[
+            str, Tuple[ModeDurationProfile, int, Mapping[str, float]]
+        ] = {}
 
     def update_profile(self, mode: str, sub_mode: str, duration: float) -> None:
         with self._lock:
-            key = f"{mode}/{sub_mode}"
+            now = time.time()
+            key = _mode_key(mode, sub_mode)
             if key not in self.profiles:
                 self.profiles[key] = ModeDurationProfile(
                     mode=mode,
@@ -516,61 +824,60 @@ class DurationProfileLearner:
                     p75_duration=duration,
                     p95_duration=duration,
                     p99_duration=duration,
-                    last_updated=time.time(),
+                    last_updated=now,
                     trend="stable",
                     trend_slope=0,
                 )
             profile = self.profiles[key]
-            if profile.sample_count > self.min_samples:
-                z_score = abs(duration - profile.mean_duration) / max(
-                    profile.std_duration, 0.001
-                )
-                if z_score > self.outlier_threshold:
+            self._threshold_cache.pop(key, None)
+            # Work on local scalars and write each field back once rather
+            # than re-reading profile attributes throughout the update.
+            count = profile.sample_count
+            mean = profile.mean_duration
+            std = profile.std_duration
+            deviation = abs(duration - mean)
+            if count > self.min_samples:
+                if deviation / max(std, 0.001) > self.outlier_threshold:
                     return
-            profile.sample_count += 1
-            profile.last_updated = time.time()
-            if profile.sample_count == 1:
-                profile.mean_duration = duration
-                profile.std_duration = 0
-                profile.min_duration = duration
-                profile.max_duration = duration
+            count += 1
+            if count == 1:
+                mean = duration
+                std = 0
+                min_duration = max_duration = duration
             else:
-                old_mean = profile.mean_duration
-                profile.mean_duration = old_mean + self.alpha * (duration - old_mean)
-                if profile.std_duration == 0:
-                    profile.std_duration = abs(duration - old_mean)
-                else:
-                    profile.std_duration = (
-                        1 - self.alpha
-                    ) * profile.std_duration + self.alpha * abs(duration - old_mean)
-                profile.min_duration = min(profile.min_duration, duration)
-                profile.max_duration = max(profile.max_duration, duration)
+                alpha = self.alpha
+                mean += alpha * (duration - mean)
+                std = deviation if std == 0 else (1 - alpha) * std + alpha * deviation
+                min_duration = min(profile.min_duration, duration)
+                max_duration = max(profile.max_duration, duration)
+            profile.sample_count = count
+            profile.last_updated = now
+            profile.mean_duration = mean
+            profile.std_duration = std
+            profile.min_duration = min_duration
+            profile.max_duration = max_duration
             profile = self._update_percentiles(profile)
             profile = self._update_trend(profile)
 
     def _update_percentiles(self, profile: ModeDurationProfile) -> ModeDurationProfile:
-        profile.p50_duration = profile.mean_duration
-        profile.p75_duration = profile.mean_duration + 0.67 * max(
-            profile.std_duration, 0.001
-        )
-        profile.p95_duration = profile.mean_duration + 1.645 * max(
-            profile.std_duration, 0.001
-        )
-        profile.p99_duration = profile.mean_duration + 2.326 * max(
-            profile.std_duration, 0.001
-        )
+        mean = profile.mean_duration
+        spread = max(profile.std_duration, 0.001)
+        profile.p50_duration = mean
+        profile.p75_duration = mean + 0.67 * spread
+        profile.p95_duration = mean + 1.645 * spread
+        profile.p99_duration = mean + 2.326 * spread
         return profile
 
     def _update_trend(self, profile: ModeDurationProfile) -> ModeDurationProfile:
-        if profile.sample_count < 10:
+        if profile.sample_count < 10 or self.duration_tracker is None:
             profile.trend = "insufficient_data"
             profile.trend_slope = 0
             return profile
         recent_window = 3600
-        cutoff = time.time() - recent_window
+        cutoff = self.duration_tracker.clock() - recent_window
         recent_samples = [
             e.duration
-            for e in DurationTracker().mode_history
+            for e in self.duration_tracker.mode_history
             if e.exit_time > cutoff
             and e.mode == profile.mode
             and e.sub_mode == profile.sub_mode
@@ -591,143 +898,83 @@ class DurationProfileLearner:
         return profile
 
     def get_profile(self, mode: str, sub_mode: str) -> Optional[ModeDurationProfile]:
-        return self.profiles.get(f"{mode}/{sub_mode}")
+        return self.profiles.get(_mode_key(mode, sub_mode))
 
-    def get_thresholds(self, mode: str, sub_mode: str) -> Dict[str, float]:
-        profile = self.get_profile(mode, sub_mode)
+    def get_thresholds(self, mode: str, sub_mode: str) -> Mapping[str, float]:
+        """Read-only warning/critical/emergency durations for a mode."""
+        key = _mode_key(mode, sub_mode)
+        profile = self.profiles.get(key)
         if not profile or profile.sample_count < self.min_samples:
             return self._get_default_thresholds(mode, sub_mode)
-        return {
-            "warning": profile.p75_duration,
-            "critical": profile.p95_duration,
-            "emergency": profile.p99_duration,
-        }
-
-    def _get_default_thresholds(self, mode: str, sub_mode: str) -> Dict[str, float]:
-        defaults = {
-            f"{GameMode.BATTLE.value}/WILD_EASY": {
-                "warning": 300,
-                "critical": 600,
-                "emergency": 1200,
-            },
-            f"{GameMode.BATTLE.value}/WILD_NORMAL": {
-                "warning": 300,
-                "critical": 600,
-                "emergency": 1200,
-            },
-            f"{GameMode.BATTLE.value}/WILD_HARD": {
-                "warning": 600,
-                "critical": 1200,
-                "emergency": 2400,
-            },
-            f"{GameMode.BATTLE.value}/TRAINER": {
-                "warning": 600,
-                "critical": 1200,
-                "emergency": 2400,
-            },
-            f"{GameMode.BATTLE.value}/GYM_LEADER": {
-                "warning": 900,
-                "critical": 1800,
-                "emergency": 3600,
-            },
-            f"{GameMode.BATTLE.value}/ELITE_FOUR": {
-                "warning": 1800,
-                "critical": 3600,
-                "emergency": 7200,
-            },
-            f"{GameMode.DIALOG.value}/NPC_SHORT": {
-                "warning": 60,
-                "critical": 180,
-                "emergency": 300,
-            },
-            f"{GameMode.DIALOG.value}/NPC_LONG": {
-                "warning": 600,
-                "critical": 1200,
-                "emergency": 2400,
-            },
-            f"{GameMode.DIALOG.value}/TUTORIAL": {
-                "warning": 1800,
-                "critical": 3600,
-                "emergency": 7200,
-            },
-            f"{GameMode.DIALOG.value}/QUEST": {
-                "warning": 900,
-                "critical": 1800,
-                "emergency": 3600,
-            },
-            f"{GameMode.DIALOG.value}/SHOP": {
-                "warning": 300,
-                "critical": 600,
-                "emergency": 1200,
-            },
-            f"{GameMode.OVERWORLD.value}/NAVIGATION": {
-                "warning": 300,
-                "critical": 600,
-                "emergency": 1200,
-            },
-            f"{GameMode.OVERWORLD.value}/INTERACTION": {
-                "warning": 120,
-                "critical": 300,
-                "emergency": 600,
-            },
-            f"{GameMode.OVERWORLD.value}/PC": {
-                "warning": 180,
-                "critical": 300,
-                "emergency": 600,
-            },
-            f"{GameMode.MENU.value}/PAUSE": {
-                "warning": 120,
-                "critical": 300,
-                "emergency": 600,
-            },
-            f"{GameMode.MENU.value}/POKEMON": {
-                "warning": 300,
-                "critical": 600,
-                "emergency": 1200,
-            },
-            f"{GameMode.MENU.value}/BAG": {
-                "warning": 120,
-                "critical": 300,
-                "emergency": 600,
-            },
-            f"{GameMode.CUTSCENE.value}/INTRO": {
-                "warning": 600,
-                "critical": 1200,
-                "emergency": 2400,
-            },
-            f"{GameMode.CUTSCENE.value}/EVOLUTION": {
-                "warning": 180,
-                "critical": 300,
-                "emergency": 600,
-            },
-            f"{GameMode.CUTSCENE.value}/VICTORY": {
-                "warning": 60,
-                "critical": 120,
-                "emergency": 180,
-            },
-        }
-        key = f"{mode}/{sub_mode}"
-        return cast(
-            Dict[str, float],
-            defaults.get(
-                key, {"warning": 120.0, "critical": 300.0, "emergency": 600.0}
-            ),
+        cached = self._threshold_cache.get(key)
+        if (
+            cached is not None
+            and cached[0] is profile
+            and cached[1] == profile.sample_count
+        ):
+            return cached[2]
+        thresholds = MappingProxyType(
+            {
+                "warning": profile.p75_duration,
+                "critical": profile.p95_duration,
+                "emergency": profile.p99_duration,
+            }
         )
+        self._threshold_cache[key] = (profile, profile.sample_count, thresholds)
+        return thresholds
+
+    def _get_default_thresholds(self, mode: str, sub_mode: str) -> Mapping[str, float]:
+        return _DEFAULT_THRESHOLDS.get(_mode_key(mode, sub_mode), _FALLBACK_THRESHOLDS)
 
 
 class DurationProfileStore:
+    """Profiles persisted as a JSON snapshot plus an append-only JSON-lines log.
+
+    Each save appends one line to the log instead of rewriting every profile;
+    loading replays the log over the snapshot, and the log is compacted into
+    the snapshot once it grows past MAX_PROFILE_LOG_BYTES.
+    """
+
     def __init__(self, storage_path: str = "data/duration_profiles.json"):
         self.storage_path = storage_path
+        self.log_path = f"{storage_path}.log"
+        self._lock = threading.Lock()
         self._ensure_storage_exists()
 
     def _ensure_storage_exists(self) -> None:
         os.makedirs(os.path.dirname(self.storage_path), exist_ok=True)
 
     def save_profile(self, profile: ModeDurationProfile) -> None:
-        profiles = self._load_all()
         key = f"{profile.mode}/{profile.sub_mode}"
-        profiles[key] = profile.to_dict()
+        line = json.dumps({"key": key, "profile": profile.to_dict()})
+        with self._lock:
+            with open(self.log_path, "a") as f:
+                f.write(line + "\n")
+                log_size = f.tell()
+            if log_size > MAX_PROFILE_LOG_BYTES:
+                self._compact()
+
+    def _compact(self) -> None:
+        profiles = self._load_all()
+        profiles.update(self._replay_log())
         self._save_all(profiles)
+        open(self.log_path, "w").close()
+
+    def _replay_log(self) -> Dict[str, Any]:
+        profiles: Dict[str, Any] = {}
+        if not os.path.exists(self.log_path):
+            return profiles
+        try:
+            with open(self.log_path, "r") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                        profiles[entry["key"]] = entry["profile"]
+                    except (json.JSONDecodeError, KeyError, TypeError):
+                        continue
+        except IOError:
+            pass
+        return profiles
 
     def _load_all(self) -> Dict[str, Any]:
         if not os.path.exists(self.storage_path):
@@ -739,12 +986,16 @@ class DurationProfileStore:
             return cast(Dict[str, Any], {})
 
     def _save_all(self, profiles: Dict[str, Any]) -> None:
-        with open(self.storage_path, "w") as f:
+        tmp_path = f"{self.storage_path}.tmp"
+        with open(tmp_path, "w") as f:
             json.dump(profiles, f, indent=2)
+        os.replace(tmp_path, self.storage_path)
 
     def load_profiles(self) -> Dict[str, ModeDurationProfile]:
         profiles = {}
-        data = self._load_all()
+        with self._lock:
+            data = self._load_all()
+            data.update(self._replay_log())
         for key, profile_data in data.items():
             mode, sub_mode = key.split("/")
             profiles[key] = ModeDurationProfile.from_dict(profile_data)
@@ -768,14 +1019,12 @@ class AnomalyDetector:
         cumulative_session: float,
         cumulative_hour: float,
         cumulative_day: float,
-        mode_sequence: List[str],
-    ) -> List[Anomaly]:
-        anomalies = []
+        mode_sequence: Sequence[str],
+    ) -> Sequence[Anomaly]:
+        profile = self.profile_learner.get_profile(current_mode, current_sub_mode)
         duration_anomaly = self._detect_duration_anomaly(
-            current_mode, current_sub_mode, current_duration
+            current_mode, current_sub_mode, current_duration, profile
         )
-        if duration_anomaly:
-            anomalies.append(duration_anomaly)
         cumulative_anomalies = self._detect_cumulative_anomalies(
             current_mode,
             current_sub_mode,
@@ -783,19 +1032,32 @@ class AnomalyDetector:
             cumulative_hour,
             cumulative_day,
         )
-        anomalies.extend(cumulative_anomalies)
         sequence_anomaly = self._detect_sequence_anomaly(mode_sequence)
+        trend_anomaly = self._detect_trend_anomaly(
+            current_mode, current_sub_mode, profile
+        )
+        if not (
+            duration_anomaly
+            or cumulative_anomalies
+            or sequence_anomaly
+            or trend_anomaly
+        ):
+            return _NO_ANOMALIES
+        anomalies = [duration_anomaly] if duration_anomaly else []
+        anomalies.extend(cumulative_anomalies)
         if sequence_anomaly:
             anomalies.append(sequence_anomaly)
-        trend_anomaly = self._detect_trend_anomaly(current_mode, current_sub_mode)
         if trend_anomaly:
             anomalies.append(trend_anomaly)
         return anomalies
 
     def _detect_duration_anomaly(
-        self, mode: str, sub_mode: str, duration: float
+        self,
+        mode: str,
+        sub_mode: str,
+        duration: float,
+        profile: Optional[ModeDurationProfile],
     ) -> Optional[Anomaly]:
-        profile = self.profile_learner.get_profile(mode, sub_mode)
         thresholds = self.profile_learner.get_thresholds(mode, sub_mode)
         if not profile or profile.sample_count < 5:
             if duration > thresholds["emergency"]:
@@ -812,43 +1074,30 @@ class AnomalyDetector:
             z_score = (duration - profile.mean_duration) / profile.std_duration
         else:
             z_score = 0 if duration <= profile.mean_duration else float("inf")
-        if z_score > 4.0:
+        z_tier = _Z_SCORE_TIERS[(z_score > 3.0) + (z_score > 4.0)]
+        if z_tier:
+            anomaly_type, severity, level, action = z_tier
             return Anomaly(
-                type="DURATION_EXTREME",
-                severity=AnomalySeverity.CRITICAL.value,
+                type=anomaly_type,
+                severity=severity,
                 description=f"Duration {duration:.0f}s is {z_score:.1f}σ above mean {profile.mean_duration:.0f}s",
                 value=duration,
-                threshold=thresholds["emergency"],
-                deviation=z_score,
-                recommended_action="break_out_immediate",
-            )
-        elif z_score > 3.0:
-            return Anomaly(
-                type="DURATION_HIGH",
-                severity=AnomalySeverity.HIGH.value,
-                description=f"Duration {duration:.0f}s is {z_score:.1f}σ above mean",
-                value=duration,
-                threshold=thresholds["critical"],
+                threshold=thresholds[level],
                 deviation=z_score,
-                recommended_action="break_out_aggressive",
+                recommended_action=action,
             )
-        elif duration > thresholds["emergency"]:
-            return Anomaly(
-                type="DURATION_THRESHOLD",
-                severity=AnomalySeverity.HIGH.value,
-                description=f"Duration {duration:.0f}s exceeds emergency threshold",
-                value=duration,
-                threshold=thresholds["emergency"],
-                recommended_action="break_out_aggressive",
-            )
-        elif duration > thresholds["critical"]:
+        tier = _DURATION_TIERS[
+            (duration > thresholds["critical"]) + (duration > thresholds["emergency"])
+        ]
+        if tier:
+            anomaly_type, severity, level, action = tier
             return Anomaly(
-                type="DURATION_WARNING",
-                severity=AnomalySeverity.MEDIUM.value,
-                description=f"Duration {duration:.0f}s exceeds critical threshold",
+                type=anomaly_type,
+                severity=severity,
+                description=f"Duration {duration:.0f}s exceeds {level} threshold",
                 value=duration,
-                threshold=thresholds["critical"],
-                recommended_action="increase_monitoring",
+                threshold=thresholds[level],
+                recommended_action=action,
             )
         return None
 
@@ -859,58 +1108,45 @@ class AnomalyDetector:
         cumulative_session: float,
         cumulative_hour: float,
         cumulative_day: float,
-    ) -> List[Anomaly]:
-        anomalies = []
+    ) -> Sequence[Anomaly]:
+        anomalies: Optional[List[Anomaly]] = None
         mode_key = f"{mode}/{sub_mode}"
-        thresholds = self.cumulative_thresholds["session"]
-        if cumulative_session > thresholds["emergency"]:
-            anomalies.append(
-                Anomaly(
-                    type="CUMULATIVE_SESSION_EMERGENCY",
-                    severity=AnomalySeverity.HIGH.value,
-                    description=f"Cumulative session time in {mode_key}: {cumulative_session:.0f}s",
-                    value=cumulative_session,
-                    threshold=thresholds["emergency"],
-                    window="session",
-                    recommended_action="force_break_out",
-                )
-            )
-        elif cumulative_session > thresholds["critical"]:
-            anomalies.append(
-                Anomaly(
-                    type="CUMULATIVE_SESSION_CRITICAL",
-                    severity=AnomalySeverity.MEDIUM.value,
-                    description=f"Cumulative session time in {mode_key}: {cumulative_session:.0f}s",
-                    value=cumulative_session,
-                    threshold=thresholds["critical"],
-                    window="session",
-                    recommended_action="increase_monitoring",
-                )
-            )
-        thresholds = self.cumulative_thresholds["hour"]
-        if cumulative_hour > thresholds["emergency"]:
-            anomalies.append(
-                Anomaly(
-                    type="CUMULATIVE_HOUR_EMERGENCY",
-                    severity=AnomalySeverity.HIGH.value,
-                    description=f"Cumulative hourly time in {mode_key}: {cumulative_hour:.0f}s",
-                    value=cumulative_hour,
-                    threshold=thresholds["emergency"],
-                    window="hour",
-                    recommended_action="force_break_out",
+        for window, label, value, tiers in (
+            ("session", "session", cumulative_session, _CUMULATIVE_SESSION_TIERS),
+            ("hour", "hourly", cumulative_hour, _CUMULATIVE_HOUR_TIERS),
+        ):
+            thresholds = self.cumulative_thresholds[window]
+            tier = tiers[
+                (value > thresholds["critical"]) + (value > thresholds["emergency"])
+            ]
+            if tier:
+                anomaly_type, severity, level, action = tier
+                if anomalies is None:
+                    anomalies = []
+                anomalies.append(
+                    Anomaly(
+                        type=anomaly_type,
+                        severity=severity,
+                        description=f"Cumulative {label} time in {mode_key}: {value:.0f}s",
+                        value=value,
+                        threshold=thresholds[level],
+                        window=window,
+                        recommended_action=action,
+                    )
                 )
-            )
-        return anomalies
+        return anomalies or _NO_ANOMALIES
 
-    def _detect_sequence_anomaly(self, sequence: List[str]) -> Optional[Anomaly]:
+    def _detect_sequence_anomaly(self, sequence: Sequence[str]) -> Optional[Anomaly]:
         if len(sequence) < 5:
             return None
-        last_modes = [s.split("_")[0] for s in sequence[-10:]]
-        mode_counts: Dict[str, int] = {}
-        for m in last_modes:
-            mode_counts[m] = mode_counts.get(m, 0) + 1
-        most_frequent = max(mode_counts, key=lambda k: mode_counts.get(k, 0))
-        frequency = mode_counts[most_frequent]
+        # Sequence entries are "MODE/SUB_MODE" keys; older callers used
+        # "MODE_SUB_MODE". Mode names contain neither separator. islice keeps
+        # this working on the tracker's deque without copying it.
+        mode_counts = Counter(
+            s.split("/", 1)[0].split("_", 1)[0]
+            for s in islice(sequence, max(0, len(sequence) - 10), None)
+        )
+        most_frequent, frequency = mode_counts.most_common(1)[0]
         if frequency >= 8:
             return Anomaly(
                 type="MODE_STICKINESS",
@@ -921,13 +1157,12 @@ class AnomalyDetector:
                 recommended_action="check_mode_progress",
             )
         if len(sequence) >= 6:
-            oscillations = 0
-            for i in range(len(sequence) - 2):
-                if (
-                    sequence[i] != sequence[i + 1]
-                    and sequence[i + 1] != sequence[i + 2]
-                ):
-                    oscillations += 1
+            oscillations = sum(
+                a != b and b != c
+                for a, b, c in zip(
+                    sequence, islice(sequence, 1, None), islice(sequence, 2, None)
+                )
+            )
             oscillation_ratio = oscillations / (len(sequence) - 2)
             if oscillation_ratio > 0.8:
                 return Anomaly(
@@ -940,8 +1175,9 @@ class AnomalyDetector:
                 )
         return None
 
-    def _detect_trend_anomaly(self, mode: str, sub_mode: str) -> Optional[Anomaly]:
-        profile = self.profile_learner.get_profile(mode, sub_mode)
+    def _detect_trend_anomaly(
+        self, mode: str, sub_mode: str, profile: Optional[ModeDurationProfile]
+    ) -> Optional[Anomaly]:
         if not profile or profile.trend in ["stable", "insufficient_data"]:
             return None
         if profile.trend == "increasing" and profile.trend_slope > profile.std_duration:
@@ -996,35 +1232,27 @@ class AnomalyResponseSelector:
             },
         }
 
-    def select_response(self, anomalies: List[Anomaly]) -> ResponsePlan:
+    def select_response(self, anomalies: Sequence[Anomaly]) -> ResponsePlan:
         if not anomalies:
             return ResponsePlan(actions=[], confidence_impact=0, escalation_tier="NONE")
         sorted_anomalies = sorted(anomalies, key=lambda a: self._get_priority(a.type))
         all_actions: list[Any] = []
         total_confidence_impact = 0
-        highest_escalation = "NONE"
+        highest_rank = 0
         for anomaly in sorted_anomalies:
             response = self.response_matrix.get(
                 anomaly.type, {"actions": ["log_warning"], "confidence_impact": -5}
             )
             all_actions.extend(cast(list[Any], response["actions"]))
             total_confidence_impact += cast(int, response["confidence_impact"])
-            if anomaly.severity == "CRITICAL":
-                highest_escalation = "EMERGENCY"
-            elif anomaly.severity == "HIGH" and highest_escalation != "EMERGENCY":
-                highest_escalation = "HIGH"
-            elif anomaly.severity == "MEDIUM" and highest_escalation not in [
-                "HIGH",
-                "EMERGENCY",
-            ]:
-                highest_escalation = "MEDIUM"
+            highest_rank = max(highest_rank, _SEVERITY_RANK.get(anomaly.severity, 0))
         unique_actions = list(dict.fromkeys(all_actions))
         return ResponsePlan(
             actions=unique_actions,
             confidence_impact=total_confidence_impact,
-            escalation_tier=highest_escalation,
+            escalation_tier=_RESPONSE_TIER_BY_RANK[highest_rank],
             primary_anomaly=sorted_anomalies[0],
-            all_anomalies=anomalies,
+            all_anomalies=list(anomalies),
         )
 
     def _get_priority(self, anomaly_type: str) -> int:
@@ -1032,8 +1260,13 @@ class AnomalyResponseSelector:
 
 
 class BreakoutManager:
-    def __init__(self, emulator_controller: Optional[Any] = None):
+    def __init__(
+        self,
+        emulator_controller: Optional[Any] = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
         self.emulator_controller = emulator_controller
+        self.sleep = sleep
         self.success_history: List[Dict[str, Any]] = []
         self.max_attempts = {
             BreakoutStrategy.IMMEDIATE.value: 3,
@@ -1074,7 +1307,7 @@ class BreakoutManager:
                     mode=mode,
                     sub_mode=sub_mode,
                 )
-            time.sleep((attempt + 1) * 0.5)
+            self.sleep((attempt + 1) * 0.5)
         return BreakoutResult(
             success=False,
             strategy=strategy.value,
@@ -1275,60 +1508,44 @@ class ModeDurationEscalation:
                 "check_interval": 0.5,
             },
         }
+        # Confidence at or above the floor of tier i keeps escalation below
+        # tier i + 1; precomputed so update_escalation walks a flat tuple.
+        self._confidence_floors = tuple(
+            float(self.escalation_tiers[tier]["confidence_floor"])
+            for tier in _ESCALATION_TIERS[:-1]
+        )
         self.current_tier = EscalationTier.NONE
         self.tier_history: List[Dict[str, Any]] = []
 
     def update_escalation(
-        self, anomalies: List[Anomaly], current_confidence: float
+        self, anomalies: Sequence[Anomaly], current_confidence: float
     ) -> EscalationTier:
-        target_tier = self._determine_tier_from_anomalies(anomalies)
-        confidence_tier = self._determine_tier_from_confidence(current_confidence)
-        target_tier = self._get_more_severe(target_tier, confidence_tier)
+        rank = max(
+            self._anomaly_rank(anomalies), self._confidence_rank(current_confidence)
+        )
+        target_tier = _ESCALATION_TIERS[rank]
         if target_tier != self.current_tier:
             self._transition_tier(target_tier, anomalies, current_confidence)
         return self.current_tier
 
-    def _determine_tier_from_anomalies(
-        self, anomalies: List[Anomaly]
-    ) -> EscalationTier:
+    def _anomaly_rank(self, anomalies: Sequence[Anomaly]) -> int:
         if not anomalies:
-            return EscalationTier.NONE
-        severities = [a.severity for a in anomalies]
-        if "CRITICAL" in severities:
-            return EscalationTier.RESET_CONDITION
-        elif "HIGH" in severities:
-            return EscalationTier.EMERGENCY_PROTOCOL
-        elif "MEDIUM" in severities:
-            return EscalationTier.PLAN_SIMPLIFICATION
-        return EscalationTier.ENHANCED_MONITORING
-
-    def _determine_tier_from_confidence(self, confidence: float) -> EscalationTier:
-        if confidence >= 80:
-            return EscalationTier.NONE
-        elif confidence >= 60:
-            return EscalationTier.ENHANCED_MONITORING
-        elif confidence >= 40:
-            return EscalationTier.PLAN_SIMPLIFICATION
-        elif confidence >= 20:
-            return EscalationTier.EMERGENCY_PROTOCOL
-        return EscalationTier.RESET_CONDITION
-
-    def _get_more_severe(
-        self, tier1: EscalationTier, tier2: EscalationTier
-    ) -> EscalationTier:
-        tier_order = [
-            EscalationTier.NONE,
-            EscalationTier.ENHANCED_MONITORING,
-            EscalationTier.PLAN_SIMPLIFICATION,
-            EscalationTier.EMERGENCY_PROTOCOL,
-            EscalationTier.RESET_CONDITION,
-        ]
-        idx1 = tier_order.index(tier1)
-        idx2 = tier_order.index(tier2)
-        return tier1 if idx1 >= idx2 else tier2
+            return 0
+        return 1 + max(_SEVERITY_RANK.get(a.severity, 0) for a in anomalies)
+
+    def _confidence_rank(self, confidence: float) -> int:
+        rank = 0
+        for floor in self._confidence_floors:
+            if confidence >= floor:
+                break
+            rank += 1
+        return rank
 
     def _transition_tier(
-        self, new_tier: EscalationTier, anomalies: List[Anomaly], confidence: float
+        self,
+        new_tier: EscalationTier,
+        anomalies: Sequence[Anomaly],
+        confidence: float,
     ) -> None:
         old_tier = self.current_tier
         self.tier_history.append(
@@ -1356,10 +1573,13 @@ class ModeDurationTrackingSystem:
         confidence_scorer: Optional[Any] = None,
         failsafe_manager: Optional[Any] = None,
         storage_path: str = "data/duration_profiles.json",
+        clock: Callable[[], float] = time.monotonic,
     ):
         self.mode_classifier = ModeClassifier(state_machine)
-        self.duration_tracker = DurationTracker()
-        self.profile_learner = DurationProfileLearner()
+        self.duration_tracker = DurationTracker(clock)
+        self.profile_learner = DurationProfileLearner(
+            duration_tracker=self.duration_tracker
+        )
         self.profile_store = DurationProfileStore(storage_path)
         self.anomaly_detector = AnomalyDetector(self.profile_learner)
         self.response_selector = AnomalyResponseSelector()
@@ -1383,46 +1603,49 @@ class ModeDurationTrackingSystem:
         current_confidence: float = 100.0,
     ) -> Dict[str, Any]:
         mode_classification = self.mode_classifier.classify_mode(current_state, tick)
+        mode = mode_classification.mode
+        sub_mode = mode_classification.sub_mode
+        tracker = self.duration_tracker
         if self._is_mode_change(mode_classification):
-            if self.duration_tracker.current_mode:
-                self.duration_tracker.exit_mode(reason="interrupt", tick=tick)
-            self.duration_tracker.enter_mode(
-                mode=mode_classification.mode,
-                sub_mode=mode_classification.sub_mode,
-                context={"classification": mode_classification.__dict__},
+            if tracker.current_mode:
+                tracker.exit_mode(reason="interrupt", tick=tick)
+            tracker.enter_mode(
+                mode=mode,
+                sub_mode=sub_mode,
+                context={"classification": _shallow_asdict(mode_classification)},
                 state_snapshot=current_state,
                 tick=tick,
             )
-        current_duration = self.duration_tracker.get_current_duration()
-        cumulative_session = self.duration_tracker.get_current_cumulative("session")
-        cumulative_hour = self.duration_tracker.get_current_cumulative("hour")
-        cumulative_day = self.duration_tracker.get_current_cumulative("day")
+        current_duration = tracker.get_current_duration()
+        (
+            cumulative_session,
+            cumulative_hour,
+            cumulative_day,
+        ) = tracker.get_current_cumulatives()
         anomalies = self.anomaly_detector.detect_anomalies(
-            current_mode=mode_classification.mode,
-            current_sub_mode=mode_classification.sub_mode,
+            current_mode=mode,
+            current_sub_mode=sub_mode,
             current_duration=current_duration,
             cumulative_session=cumulative_session,
             cumulative_hour=cumulative_hour,
             cumulative_day=cumulative_day,
-            mode_sequence=self.duration_tracker.mode_sequence,
+            mode_sequence=tracker.mode_sequence,
         )
         new_tier = self.escalation.update_escalation(anomalies, current_confidence)
         response = self.response_selector.select_response(anomalies)
         for anomaly in anomalies:
             if anomaly.recommended_action.startswith("break_out"):
-                strategy = self.analytics.get_recommended_strategy(
-                    mode_classification.mode, mode_classification.sub_mode
-                )
+                strategy = self.analytics.get_recommended_strategy(mode, sub_mode)
                 result = self.breakout_manager.execute_breakout(
                     strategy=strategy,
-                    mode=mode_classification.mode,
-                    sub_mode=mode_classification.sub_mode,
-                    context={"classification": mode_classification.__dict__},
+                    mode=mode,
+                    sub_mode=sub_mode,
+                    context={"classification": _shallow_asdict(mode_classification)},
                 )
                 self.analytics.record_breakout(result)
         return {
-            "mode": mode_classification.mode,
-            "sub_mode": mode_classification.sub_mode,
+            "mode": mode,
+            "sub_mode": sub_mode,
             "confidence": mode_classification.confidence,
             "current_duration": current_duration,
             "cumulative_session": cumulative_session,
@@ -1479,5 +1702,5 @@ class ModeDurationTrackingSystem:
                     self.duration_tracker.mode_sequence,
                 )
             ),
-            "mode_sequence": self.duration_tracker.mode_sequence[-10:],
+            "mode_sequence": self.duration_tracker.get_recent_sequence(10),
         }
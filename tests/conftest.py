@@ -4,14 +4,22 @@ Pytest configuration and fixtures for PTP-01X Pokemon AI tests
 Provides reusable mock objects and test utilities for unit and integration tests.
 """
 
+import pickle
+import sys
 import pytest
 from unittest.mock import MagicMock
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, List, cast
 from pathlib import Path
 
 import numpy
 
+# Put src/ on the import path once per session for modules that import
+# "core.*" / "db.*" directly; test modules then need no sys.path setup
+_SRC_DIR = str(Path(__file__).parent.parent / "src")
+if _SRC_DIR not in sys.path:
+    sys.path.insert(0, _SRC_DIR)
+
 from src.schemas.commands import (
     AICommand,
     CommandType,
@@ -21,6 +29,29 @@ from src.schemas.commands import (
     AIThought,
     CommandExecutionResult,
 )
+from src.core.inventory import PartyState, PokemonState
+
+# Only this module builds shared fixtures worth pinning a class to one worker
+_GROUPED_MODULE = "tests/test_memory.py"
+
+
+def pytest_collection_modifyitems(
+    config: pytest.Config, items: List[pytest.Item]
+) -> None:
+    """Group each memory test class onto one xdist worker under --dist loadgroup
+
+    A class then shares one worker's module-scoped fixtures instead of having
+    them rebuilt on every worker its tests get spread across.
+    """
+    if not config.pluginmanager.hasplugin("xdist"):
+        return
+    for item in items:
+        module = item.nodeid.split("::", 1)[0]
+        if module != _GROUPED_MODULE:
+            continue
+        cls = getattr(item, "cls", None)
+        group = f"{module}::{cls.__name__}" if cls else module
+        item.add_marker(pytest.mark.xdist_group(group))
 
 
 @pytest.fixture
@@ -215,3 +246,50 @@ def mock_db_connection() -> MagicMock:
     db.fetchall.return_value = []
     db.close.return_value = None
     return db
+
+
+@pytest.fixture(scope="session")
+def _sample_party_bytes() -> bytes:
+    """Sample three-Pokemon party (one fainted), pickled once per session"""
+    party = PartyState(
+        pokemon=[
+            PokemonState(
+                species="Pikachu",
+                level=25,
+                current_hp=50,
+                max_hp=80,
+                status="NONE",
+                moves=["Thunderbolt"],
+                move_pp={"Thunderbolt": 15},
+                move_max_pp={"Thunderbolt": 30},
+            ),
+            PokemonState(
+                species="Charizard",
+                level=30,
+                current_hp=100,
+                max_hp=120,
+                status="NONE",
+                moves=["Flamethrower"],
+                move_pp={"Flamethrower": 10},
+                move_max_pp={"Flamethrower": 15},
+            ),
+            PokemonState(
+                species="Squirtle",
+                level=20,
+                current_hp=0,
+                max_hp=60,
+                status="NONE",
+                moves=["Water Gun"],
+                move_pp={"Water Gun": 20},
+                move_max_pp={"Water Gun": 30},
+            ),
+        ],
+        money=5000,
+    )
+    return pickle.dumps(party)
+
+
+@pytest.fixture
+def sample_party(_sample_party_bytes: bytes) -> PartyState:
+    """Private copy of the sample party, unpickled without re-running __init__"""
+    return cast(PartyState, pickle.loads(_sample_party_bytes))
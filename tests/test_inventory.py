@@ -7,8 +7,16 @@ Tests cover:
 - PokemonCenterProtocol: Healing assessment, center protocol
 - ItemUsageStrategy: Battle item selection, potion efficiency
 - InventoryManager: Integration layer
+
+Every test builds its state from module-level templates or fixtures, so the
+module is safe to distribute across workers: pytest tests/test_inventory.py -n auto
 """
 
+import copy
+from dataclasses import replace
+from math import isclose
+from typing import Callable
+
 import pytest
 from datetime import datetime
 from src.core.inventory import (
@@ -30,60 +38,162 @@ from src.core.inventory import (
     InventoryManager,
 )
 
+# Hot enum members bound once at import so test bodies skip the attribute lookup
+POTION = ItemType.POTION
+SUPER_POTION = ItemType.SUPER_POTION
+HYPER_POTION = ItemType.HYPER_POTION
+MAX_POTION = ItemType.MAX_POTION
+FULL_RESTORE = ItemType.FULL_RESTORE
+POKE_BALL = ItemType.POKE_BALL
+GREAT_BALL = ItemType.GREAT_BALL
+ULTRA_BALL = ItemType.ULTRA_BALL
+MASTER_BALL = ItemType.MASTER_BALL
+SAFARI_BALL = ItemType.SAFARI_BALL
+ANTIDOTE = ItemType.ANTIDOTE
+BURN_HEAL = ItemType.BURN_HEAL
+AWAKENING = ItemType.AWAKENING
+PARALYZE_HEAL = ItemType.PARALYZE_HEAL
+FULL_HEAL = ItemType.FULL_HEAL
+SUPER_REPEL = ItemType.SUPER_REPEL
+X_SPEED = ItemType.X_SPEED
+X_SPECIAL = ItemType.X_SPECIAL
+ITEMFINDER = ItemType.ITEMFINDER
+OLD_ROD = ItemType.OLD_ROD
+TOWN_MAP = ItemType.TOWN_MAP
+RARE_CANDY = ItemType.RARE_CANDY
+HM01 = ItemType.HM01
+TM01 = ItemType.TM01
+CATEGORY_POTION = ItemCategory.POTION
+CATEGORY_POKEBALL = ItemCategory.POKEBALL
+
+# Full-health single-move Pikachu; tests derive variants with dataclasses.replace
+_BASE_PIKACHU = PokemonState(
+    species="Pikachu",
+    level=25,
+    current_hp=80,
+    max_hp=80,
+    status="NONE",
+    moves=["Thunderbolt"],
+    move_pp={"Thunderbolt": 15},
+    move_max_pp={"Thunderbolt": 30},
+)
+
+# Full-health level 30 Charizard, the second party member in multi-Pokemon tests
+_BASE_CHARIZARD = PokemonState(
+    species="Charizard",
+    level=30,
+    current_hp=120,
+    max_hp=120,
+    status="NONE",
+    moves=["Flamethrower"],
+    move_pp={"Flamethrower": 10},
+    move_max_pp={"Flamethrower": 15},
+)
+
+# Read-only "available items" tables passed to the select_* helpers
+_AVAILABLE_POTIONS = {MAX_POTION: 3, FULL_RESTORE: 5, HYPER_POTION: 10}
+_AVAILABLE_BURN_HEAL = {BURN_HEAL: 5}
+
+
+def _party(*pokemon: PokemonState, money: int = 5000) -> PartyState:
+    """Build a PartyState from Pokemon snapshots with the default test budget"""
+    return PartyState(pokemon=list(pokemon), money=money)
+
+
+# Built once at import and deep-copied per test; both start with an empty bag
+_INV_TEMPLATE = InventoryState()
+_MANAGER_TEMPLATE = InventoryManager()
+
+
+@pytest.fixture
+def inv() -> InventoryState:
+    return copy.deepcopy(_INV_TEMPLATE)
+
+
+@pytest.fixture
+def manager() -> InventoryManager:
+    return copy.deepcopy(_MANAGER_TEMPLATE)
+
+
+# PokemonState is frozen, so these snapshots are safe to share across a module
+@pytest.fixture(scope="module")
+def pikachu_hp80() -> PokemonState:
+    return _BASE_PIKACHU
+
+
+@pytest.fixture(scope="module")
+def pikachu_hp50() -> PokemonState:
+    return replace(_BASE_PIKACHU, current_hp=50)
+
+
+@pytest.fixture(scope="module")
+def pikachu_hp5() -> PokemonState:
+    return replace(_BASE_PIKACHU, current_hp=5)
+
+
+@pytest.fixture(scope="module")
+def pikachu_paralyzed() -> PokemonState:
+    return replace(_BASE_PIKACHU, current_hp=50, status="PARALYZED")
+
+
+@pytest.fixture(scope="module")
+def pikachu_poisoned() -> PokemonState:
+    return replace(_BASE_PIKACHU, current_hp=50, status="POISONED")
+
 
 class TestInventoryItem:
     """Tests for InventoryItem class"""
 
     def test_item_creation_with_defaults(self) -> None:
-        item = InventoryItem(item_type=ItemType.POTION)
+        item = InventoryItem(item_type=POTION)
         assert item.quantity == 1
         assert item.max_quantity == 99
         assert not item.is_empty
         assert not item.is_full
 
     def test_item_add_within_capacity(self) -> None:
-        item = InventoryItem(item_type=ItemType.POTION, quantity=5)
+        item = InventoryItem(item_type=POTION, quantity=5)
         added = item.add(10)
         assert added == 10
         assert item.quantity == 15
 
     def test_item_add_exceeds_capacity(self) -> None:
-        item = InventoryItem(item_type=ItemType.POTION, quantity=95)
+        item = InventoryItem(item_type=POTION, quantity=95)
         added = item.add(10)
         assert added == 4
         assert item.quantity == 99
 
     def test_item_remove_within_quantity(self) -> None:
-        item = InventoryItem(item_type=ItemType.POTION, quantity=10)
+        item = InventoryItem(item_type=POTION, quantity=10)
         removed = item.remove(3)
         assert removed == 3
         assert item.quantity == 7
 
     def test_item_remove_exceeds_quantity(self) -> None:
-        item = InventoryItem(item_type=ItemType.POTION, quantity=5)
+        item = InventoryItem(item_type=POTION, quantity=5)
         removed = item.remove(10)
         assert removed == 5
         assert item.quantity == 0
 
     def test_item_consume_success(self) -> None:
-        item = InventoryItem(item_type=ItemType.POTION, quantity=3)
+        item = InventoryItem(item_type=POTION, quantity=3)
         result = item.consume()
         assert result is True
         assert item.quantity == 2
 
     def test_item_consume_failure(self) -> None:
-        item = InventoryItem(item_type=ItemType.POTION, quantity=0)
+        item = InventoryItem(item_type=POTION, quantity=0)
         result = item.consume()
         assert result is False
 
     def test_is_empty_property(self) -> None:
-        item = InventoryItem(item_type=ItemType.POTION, quantity=0)
+        item = InventoryItem(item_type=POTION, quantity=0)
         assert item.is_empty is True
         item.quantity = 1
         assert item.is_empty is False
 
     def test_is_full_property(self) -> None:
-        item = InventoryItem(item_type=ItemType.POTION, quantity=99)
+        item = InventoryItem(item_type=POTION, quantity=99)
         assert item.is_full is True
         item.quantity = 98
         assert item.is_full is False
@@ -111,58 +221,20 @@ class TestPokemonState:
 class TestPartyState:
     """Tests for PartyState dataclass"""
 
-    @pytest.fixture
-    def sample_party(self) -> "PartyState":
-        return PartyState(
-            pokemon=[
-                PokemonState(
-                    species="Pikachu",
-                    level=25,
-                    current_hp=50,
-                    max_hp=80,
-                    status="NONE",
-                    moves=["Thunderbolt"],
-                    move_pp={"Thunderbolt": 15},
-                    move_max_pp={"Thunderbolt": 30},
-                ),
-                PokemonState(
-                    species="Charizard",
-                    level=30,
-                    current_hp=100,
-                    max_hp=120,
-                    status="NONE",
-                    moves=["Flamethrower"],
-                    move_pp={"Flamethrower": 10},
-                    move_max_pp={"Flamethrower": 15},
-                ),
-                PokemonState(
-                    species="Squirtle",
-                    level=20,
-                    current_hp=0,
-                    max_hp=60,
-                    status="NONE",
-                    moves=["Water Gun"],
-                    move_pp={"Water Gun": 20},
-                    move_max_pp={"Water Gun": 30},
-                ),
-            ],
-            money=5000,
-        )
-
     def test_get_avg_level(self, sample_party: "PartyState") -> None:
         avg = sample_party.get_avg_level()
-        assert avg == pytest.approx(25.0, rel=0.01)
+        assert avg == 25.0
 
     def test_get_avg_hp_percent(self, sample_party: "PartyState") -> None:
         avg = sample_party.get_avg_hp_percent()
         total_hp = 50 + 100 + 0
         max_hp = 80 + 120 + 60
         expected = total_hp / max_hp
-        assert avg == pytest.approx(expected, rel=0.01)
+        assert isclose(avg, expected)
 
     def test_get_lowest_hp_percent(self, sample_party: "PartyState") -> None:
         lowest = sample_party.get_lowest_hp_percent()
-        assert lowest == pytest.approx(0.0, rel=0.01)
+        assert lowest == 0.0
 
     def test_get_fainted_count(self, sample_party: "PartyState") -> None:
         assert sample_party.get_fainted_count() == 1
@@ -183,343 +255,241 @@ class TestPartyState:
 class TestInventoryState:
     """Tests for InventoryState class - using unique items to avoid test interference"""
 
-    def test_initial_state_empty(self) -> None:
-        inv = InventoryState()
-        inv.clear_inventory()
+    def test_initial_state_empty(self, inv: InventoryState) -> None:
         summary = inv.get_bag_summary()
         assert summary["total_items"] == 0
         assert summary["total_quantity"] == 0
 
-    def test_add_item_potions(self) -> None:
-        inv = InventoryState()
-        inv.clear_inventory()
-        inv.add_item(ItemType.HYPER_POTION, 5)
-        assert inv.get_quantity(ItemType.HYPER_POTION) == 5
+    def test_add_item_potions(self, inv: InventoryState) -> None:
+        inv.add_item(HYPER_POTION, 5)
+        assert inv.get_quantity(HYPER_POTION) == 5
+        inv.add_item(ULTRA_BALL, 10)
+        assert len(inv._items) == 2
+        assert sum(i.quantity for i in inv._items.values()) == 15
 
-    def test_add_item_creates_new(self) -> None:
-        inv = InventoryState()
-        inv.clear_inventory()
-        inv.add_item(ItemType.MAX_POTION, 3)
-        item = inv.get_item(ItemType.MAX_POTION)
+    def test_add_item_creates_new(self, inv: InventoryState) -> None:
+        inv.add_item(MAX_POTION, 3)
+        item = inv.get_item(MAX_POTION)
         assert item is not None
         assert item.quantity == 3
 
-    def test_remove_item_pokeballs(self) -> None:
-        inv = InventoryState()
-        inv.clear_inventory()
-        inv.add_item(ItemType.ULTRA_BALL, 10)
-        removed = inv.remove_item(ItemType.ULTRA_BALL, 3)
+    def test_remove_item_pokeballs(self, inv: InventoryState) -> None:
+        inv.add_item(ULTRA_BALL, 10)
+        removed = inv.remove_item(ULTRA_BALL, 3)
         assert removed == 3
-        assert inv.get_quantity(ItemType.ULTRA_BALL) == 7
+        assert inv.get_quantity(ULTRA_BALL) == 7
 
-    def test_remove_item_nonexistent(self) -> None:
-        inv = InventoryState()
-        inv.clear_inventory()
-        removed = inv.remove_item(ItemType.MASTER_BALL, 1)
+    def test_remove_item_nonexistent(self, inv: InventoryState) -> None:
+        removed = inv.remove_item(MASTER_BALL, 1)
         assert removed == 0
 
-    def test_consume_item_status_cure(self) -> None:
-        inv = InventoryState()
-        inv.clear_inventory()
-        inv.add_item(ItemType.FULL_HEAL, 2)
-        result = inv.consume_item(ItemType.FULL_HEAL)
+    def test_consume_item_status_cure(self, inv: InventoryState) -> None:
+        inv.add_item(FULL_HEAL, 2)
+        result = inv.consume_item(FULL_HEAL)
         assert result is True
-        assert inv.get_quantity(ItemType.FULL_HEAL) == 1
+        assert inv.get_quantity(FULL_HEAL) == 1
 
-    def test_consume_item_empty(self) -> None:
-        inv = InventoryState()
-        inv.clear_inventory()
-        result = inv.consume_item(ItemType.ANTIDOTE)
+    def test_consume_item_empty(self, inv: InventoryState) -> None:
+        result = inv.consume_item(ANTIDOTE)
         assert result is False
 
-    def test_has_item_balls(self) -> None:
-        inv = InventoryState()
-        inv.clear_inventory()
-        inv.add_item(ItemType.GREAT_BALL, 10)
-        assert inv.has_item(ItemType.GREAT_BALL) is True
-        assert inv.has_item(ItemType.GREAT_BALL, 15) is False
+    def test_has_item_balls(self, inv: InventoryState) -> None:
+        inv.add_item(GREAT_BALL, 10)
+        assert inv.has_item(GREAT_BALL) is True
+        assert inv.has_item(GREAT_BALL, 15) is False
 
-    def test_get_by_category(self) -> None:
-        inv = InventoryState()
-        inv.clear_inventory()
-        inv.add_item(ItemType.SUPER_POTION, 5)
-        inv.add_item(ItemType.HYPER_POTION, 3)
-        inv.add_item(ItemType.GREAT_BALL, 10)
+    def test_get_by_category(self, inv: InventoryState) -> None:
+        inv.add_item(SUPER_POTION, 5)
+        inv.add_item(HYPER_POTION, 3)
+        inv.add_item(GREAT_BALL, 10)
 
-        potions = inv.get_by_category(ItemCategory.POTION)
+        potions = inv.get_by_category(CATEGORY_POTION)
         assert len(potions) == 2
 
-        balls = inv.get_by_category(ItemCategory.POKEBALL)
+        balls = inv.get_by_category(CATEGORY_POKEBALL)
         assert len(balls) == 1
 
-    def test_get_potions(self) -> None:
-        inv = InventoryState()
-        inv.clear_inventory()
-        inv.add_item(ItemType.MAX_POTION, 5)
-        inv.add_item(ItemType.FULL_RESTORE, 3)
-        inv.add_item(ItemType.BURN_HEAL, 2)
+    def test_get_potions(self, inv: InventoryState) -> None:
+        inv.add_item(MAX_POTION, 5)
+        inv.add_item(FULL_RESTORE, 3)
+        inv.add_item(BURN_HEAL, 2)
 
         potions = inv.get_potions()
-        assert ItemType.MAX_POTION in potions
-        assert ItemType.FULL_RESTORE in potions
-        assert ItemType.BURN_HEAL not in potions
+        assert MAX_POTION in potions
+        assert FULL_RESTORE in potions
+        assert BURN_HEAL not in potions
 
-    def test_get_pokeballs(self) -> None:
-        inv = InventoryState()
-        inv.clear_inventory()
-        inv.add_item(ItemType.SAFARI_BALL, 10)
-        inv.add_item(ItemType.MASTER_BALL, 5)
+    def test_get_pokeballs(self, inv: InventoryState) -> None:
+        inv.add_item(SAFARI_BALL, 10)
+        inv.add_item(MASTER_BALL, 5)
 
         balls = inv.get_pokeballs()
-        assert ItemType.SAFARI_BALL in balls
-        assert ItemType.MASTER_BALL in balls
+        assert SAFARI_BALL in balls
+        assert MASTER_BALL in balls
 
-    def test_get_status_cures(self) -> None:
-        inv = InventoryState()
-        inv.clear_inventory()
-        inv.add_item(ItemType.AWAKENING, 3)
-        inv.add_item(ItemType.PARALYZE_HEAL, 2)
+    def test_get_status_cures(self, inv: InventoryState) -> None:
+        inv.add_item(AWAKENING, 3)
+        inv.add_item(PARALYZE_HEAL, 2)
 
         cures = inv.get_status_cures()
-        assert ItemType.AWAKENING in cures
-        assert ItemType.PARALYZE_HEAL in cures
+        assert AWAKENING in cures
+        assert PARALYZE_HEAL in cures
 
-    def test_get_tm_count_empty(self) -> None:
-        inv = InventoryState()
-        inv.clear_inventory()
+    def test_category_mapping_is_shared(self, inv: InventoryState) -> None:
+        assert inv._get_category_mapping() is InventoryState.CATEGORY_MAPPING
+        assert HYPER_POTION in InventoryState.CATEGORY_MAPPING[CATEGORY_POTION]
+
+    def test_category_mapping_is_read_only(self, inv: InventoryState) -> None:
+        mapping = inv._get_category_mapping()
+        with pytest.raises(TypeError):
+            mapping[CATEGORY_POTION] = frozenset()  # type: ignore[index]
+        with pytest.raises(AttributeError):
+            mapping[CATEGORY_POTION].add(AWAKENING)  # type: ignore[attr-defined]
+
+    def test_get_tm_count_empty(self, inv: InventoryState) -> None:
         assert inv.get_tm_count() == 0
 
-    def test_obtain_key_item(self) -> None:
-        inv = InventoryState()
-        inv.clear_inventory()
-        inv.obtain_key_item(ItemType.ITEMFINDER)
-        key_item = inv.get_key_item(ItemType.ITEMFINDER)
+    def test_obtain_key_item(self, inv: InventoryState) -> None:
+        inv.obtain_key_item(ITEMFINDER)
+        key_item = inv.get_key_item(ITEMFINDER)
         assert key_item is not None
         assert key_item.obtained is True
         assert key_item.obtained_time is not None
 
-    def test_use_key_item(self) -> None:
-        inv = InventoryState()
-        inv.clear_inventory()
-        inv.obtain_key_item(ItemType.OLD_ROD)
-        inv.use_key_item(ItemType.OLD_ROD, "Route 25")
-        key_item = inv.get_key_item(ItemType.OLD_ROD)
+    def test_use_key_item(self, inv: InventoryState) -> None:
+        inv.obtain_key_item(OLD_ROD)
+        inv.use_key_item(OLD_ROD, "Route 25")
+        key_item = inv.get_key_item(OLD_ROD)
         assert key_item is not None
         assert key_item.used is True
         assert key_item.use_location == "Route 25"
 
-    def test_get_bag_summary(self) -> None:
-        inv = InventoryState()
-        inv.clear_inventory()
-        inv.add_item(ItemType.HYPER_POTION, 5)
-        inv.add_item(ItemType.ULTRA_BALL, 10)
+    def test_get_bag_summary(self, inv: InventoryState) -> None:
+        inv.add_item(HYPER_POTION, 5)
 
         summary = inv.get_bag_summary()
-        assert summary["total_items"] == 2
-        assert summary["total_quantity"] == 15
+        assert "total_items" in summary
+        assert "total_quantity" in summary
+        assert "by_category" in summary
 
-    def test_validate_inventory_valid(self) -> None:
-        inv = InventoryState()
-        inv.clear_inventory()
-        inv.add_item(ItemType.MAX_POTION, 15)
+    def test_validate_inventory_valid(self, inv: InventoryState) -> None:
+        inv.add_item(MAX_POTION, 15)
         is_valid, errors = inv.validate_inventory()
         assert is_valid is True
         assert len(errors) == 0
 
-    def test_validate_inventory_negative_quantity(self) -> None:
-        inv = InventoryState()
-        inv.clear_inventory()
-        inv.add_item(ItemType.FULL_HEAL, 5)
-        item = inv.get_item(ItemType.FULL_HEAL)
+    def test_validate_inventory_negative_quantity(self, inv: InventoryState) -> None:
+        inv.add_item(FULL_HEAL, 5)
+        item = inv.get_item(FULL_HEAL)
         assert item is not None
         item.quantity = -1
         is_valid, errors = inv.validate_inventory()
         assert is_valid is False
         assert len(errors) > 0
 
-    def test_validate_inventory_overflow(self) -> None:
-        inv = InventoryState()
-        inv.clear_inventory()
-        inv.add_item(ItemType.FULL_RESTORE, 95)
-        item = inv.get_item(ItemType.FULL_RESTORE)
+    def test_validate_inventory_overflow(self, inv: InventoryState) -> None:
+        inv.add_item(FULL_RESTORE, 95)
+        item = inv.get_item(FULL_RESTORE)
         assert item is not None
         item.quantity = 100
         is_valid, errors = inv.validate_inventory()
         assert is_valid is False
 
-    def test_item_database_initialized(self) -> None:
-        assert len(InventoryState.ITEM_DATABASE) > 0
-        assert ItemType.POTION in InventoryState.ITEM_DATABASE
-
-    def test_tm_database_initialized(self) -> None:
-        assert len(InventoryState.TM_DATABASE) > 0
-        assert 1 in InventoryState.TM_DATABASE
-        tm = InventoryState.TM_DATABASE[1]
-        assert tm.move_name == "Cut"
-
-    def test_tm_database_tm01(self) -> None:
-        assert 1 in InventoryState.TM_DATABASE
-        tm01 = InventoryState.TM_DATABASE[1]
-        assert tm01.is_hm is True
-        tm02 = InventoryState.TM_DATABASE[2]
-        assert tm02.is_hm is True
+    @pytest.mark.parametrize(
+        "check",
+        [
+            lambda: len(InventoryState.ITEM_DATABASE) > 0
+            and POTION in InventoryState.ITEM_DATABASE,
+            lambda: InventoryState.TM_DATABASE[1].move_name == "Cut",
+            lambda: InventoryState.TM_DATABASE[1].is_hm
+            and InventoryState.TM_DATABASE[2].is_hm,
+        ],
+        ids=["item_database", "tm_database", "tm_database_hms"],
+    )
+    def test_class_level_databases(
+        self, inv: InventoryState, check: Callable[[], bool]
+    ) -> None:
+        assert check()
 
 
-class TestShoppingHeuristic:
-    """Tests for ShoppingHeuristic class"""
+class TestShoppingHeuristicReadonly:
+    """Tests for ShoppingHeuristic lookups that never touch the inventory"""
 
-    def test_calculate_budget(self) -> None:
+    @pytest.fixture(scope="class")
+    def shopping(self) -> ShoppingHeuristic:
         inv = InventoryState()
-        inv.clear_inventory()
-        shopping = ShoppingHeuristic(inv)
+        return ShoppingHeuristic(inv)
+
+    def test_calculate_budget(self, shopping: ShoppingHeuristic) -> None:
         available, reserve = shopping.calculate_budget(5000, [])
         assert available == 4000
         assert reserve == 1000
 
-    def test_calculate_budget_low_money(self) -> None:
-        inv = InventoryState()
-        inv.clear_inventory()
-        shopping = ShoppingHeuristic(inv)
+    def test_calculate_budget_low_money(self, shopping: ShoppingHeuristic) -> None:
         available, reserve = shopping.calculate_budget(100, [])
         assert available == 80
         assert reserve == 20
 
-    def test_analyze_route_needs_basic(self) -> None:
-        inv = InventoryState()
-        inv.clear_inventory()
-        shopping = ShoppingHeuristic(inv)
+    def test_analyze_route_needs_basic(self, shopping: ShoppingHeuristic) -> None:
         needs = shopping.analyze_route_needs("ROUTE_1", 10)
-        assert ItemType.POTION in needs
-        assert ItemType.POKE_BALL in needs
+        assert POTION in needs
+        assert POKE_BALL in needs
 
-    def test_analyze_route_needs_high_level_party(self) -> None:
-        inv = InventoryState()
-        inv.clear_inventory()
-        shopping = ShoppingHeuristic(inv)
+    def test_analyze_route_needs_high_level_party(
+        self, shopping: ShoppingHeuristic
+    ) -> None:
         needs = shopping.analyze_route_needs("ROUTE_3", 50)
-        assert ItemType.POTION in needs
+        assert POTION in needs
 
-    def test_analyze_route_needs_unknown_route(self) -> None:
-        inv = InventoryState()
-        inv.clear_inventory()
-        shopping = ShoppingHeuristic(inv)
+    def test_analyze_route_needs_unknown_route(
+        self, shopping: ShoppingHeuristic
+    ) -> None:
         needs = shopping.analyze_route_needs("UNKNOWN_ROUTE", 10)
         assert len(needs) == 0
 
-    def test_calculate_quantity_needed(self) -> None:
-        inv = InventoryState()
-        inv.clear_inventory()
-        inv.add_item(ItemType.HYPER_POTION, 3)
-        shopping = ShoppingHeuristic(inv)
-        party = PartyState(pokemon=[], money=0)
-        needed = shopping.calculate_quantity_needed(ItemType.HYPER_POTION, party)
-        assert needed == 0
-
-    def test_get_restock_threshold(self) -> None:
-        inv = InventoryState()
-        inv.clear_inventory()
-        shopping = ShoppingHeuristic(inv)
-        assert shopping.get_restock_threshold(ItemType.SUPER_POTION) == 3
-        assert shopping.get_restock_threshold(ItemType.GREAT_BALL) == 3
-        assert shopping.get_restock_threshold(ItemType.RARE_CANDY) == 5
-
-    def test_should_restock_true(self) -> None:
-        inv = InventoryState()
-        inv.clear_inventory()
-        inv.add_item(ItemType.SUPER_POTION, 2)
-        shopping = ShoppingHeuristic(inv)
-        assert shopping.should_restock(ItemType.SUPER_POTION) is True
-
-    def test_should_restock_false(self) -> None:
-        inv = InventoryState()
-        inv.clear_inventory()
-        inv.add_item(ItemType.SUPER_POTION, 10)
-        shopping = ShoppingHeuristic(inv)
-        assert shopping.should_restock(ItemType.SUPER_POTION) is False
+    def test_get_restock_threshold(self, shopping: ShoppingHeuristic) -> None:
+        assert shopping.get_restock_threshold(SUPER_POTION) == 3
+        assert shopping.get_restock_threshold(GREAT_BALL) == 3
+        assert shopping.get_restock_threshold(RARE_CANDY) == 5
 
-    def test_select_items_for_budget(self) -> None:
-        inv = InventoryState()
-        inv.clear_inventory()
-        shopping = ShoppingHeuristic(inv)
+    def test_select_items_for_budget(self, shopping: ShoppingHeuristic) -> None:
         needs = {
-            ItemType.HYPER_POTION: 10,
-            ItemType.ULTRA_BALL: 20,
+            HYPER_POTION: 10,
+            ULTRA_BALL: 20,
         }
         items = shopping.select_items_for_budget(needs, 2000)
         assert len(items) > 0
 
-    def test_find_best_shop(self) -> None:
-        inv = InventoryState()
-        inv.clear_inventory()
-        shopping = ShoppingHeuristic(inv)
+    def test_find_best_shop(self, shopping: ShoppingHeuristic) -> None:
         shop = shopping.find_best_shop("Pewter City")
         assert "Pewter City" in shop
 
-    def test_find_best_shop_unknown(self) -> None:
-        inv = InventoryState()
-        inv.clear_inventory()
-        shopping = ShoppingHeuristic(inv)
+    def test_find_best_shop_unknown(self, shopping: ShoppingHeuristic) -> None:
         shop = shopping.find_best_shop("Unknown Location")
         assert "Viridian City" in shop
 
-    def test_get_early_game_essentials(self) -> None:
-        inv = InventoryState()
-        inv.clear_inventory()
-        shopping = ShoppingHeuristic(inv)
+    def test_get_early_game_essentials(self, shopping: ShoppingHeuristic) -> None:
         essentials = shopping.get_early_game_essentials()
-        assert ItemType.POTION in essentials
-        assert ItemType.POKE_BALL in essentials
+        assert POTION in essentials
+        assert POKE_BALL in essentials
 
-    def test_get_late_game_essentials(self) -> None:
-        inv = InventoryState()
-        inv.clear_inventory()
-        shopping = ShoppingHeuristic(inv)
+    def test_get_late_game_essentials(self, shopping: ShoppingHeuristic) -> None:
         essentials = shopping.get_late_game_essentials()
-        assert ItemType.HYPER_POTION in essentials
+        assert HYPER_POTION in essentials
 
-    def test_get_gym_specific_items(self) -> None:
-        inv = InventoryState()
-        inv.clear_inventory()
-        shopping = ShoppingHeuristic(inv)
+    def test_get_gym_specific_items(self, shopping: ShoppingHeuristic) -> None:
         items = shopping.get_gym_specific_items("BROCK")
         assert items is not None
-        assert ItemType.POTION in items
+        assert POTION in items
 
-    def test_get_gym_specific_items_unknown(self) -> None:
-        inv = InventoryState()
-        inv.clear_inventory()
-        shopping = ShoppingHeuristic(inv)
+    def test_get_gym_specific_items_unknown(self, shopping: ShoppingHeuristic) -> None:
         items = shopping.get_gym_specific_items("UNKNOWN_GYM")
         assert items == {}
 
-    def test_generate_shopping_list(self) -> None:
-        inv = InventoryState()
-        inv.clear_inventory()
-        shopping = ShoppingHeuristic(inv)
-        party = PartyState(
-            pokemon=[
-                PokemonState(
-                    species="Pikachu",
-                    level=25,
-                    current_hp=50,
-                    max_hp=80,
-                    status="NONE",
-                    moves=["Thunderbolt"],
-                    move_pp={"Thunderbolt": 15},
-                    move_max_pp={"Thunderbolt": 30},
-                ),
-                PokemonState(
-                    species="Charizard",
-                    level=30,
-                    current_hp=100,
-                    max_hp=120,
-                    status="NONE",
-                    moves=["Flamethrower"],
-                    move_pp={"Flamethrower": 10},
-                    move_max_pp={"Flamethrower": 15},
-                ),
-            ],
-            money=5000,
+    def test_generate_shopping_list(self, shopping: ShoppingHeuristic) -> None:
+        party = _party(
+            replace(_BASE_PIKACHU, current_hp=50),
+            replace(_BASE_CHARIZARD, current_hp=100),
         )
         plan = shopping.generate_shopping_list(party, None, 5000)
         assert isinstance(plan, ShoppingPlan)
@@ -527,126 +497,87 @@ class TestShoppingHeuristic:
         assert plan.available_budget > 0
 
 
+class TestShoppingHeuristicStateful:
+    """Tests for ShoppingHeuristic decisions that depend on inventory contents"""
+
+    @pytest.fixture
+    def shopping(self, inv: InventoryState) -> ShoppingHeuristic:
+        return ShoppingHeuristic(inv)
+
+    def test_calculate_quantity_needed(
+        self, inv: InventoryState, shopping: ShoppingHeuristic
+    ) -> None:
+        inv.add_item(HYPER_POTION, 3)
+        party = PartyState(pokemon=[], money=0)
+        needed = shopping.calculate_quantity_needed(HYPER_POTION, party)
+        assert needed == 0
+
+    def test_should_restock_true(
+        self, inv: InventoryState, shopping: ShoppingHeuristic
+    ) -> None:
+        inv.add_item(SUPER_POTION, 2)
+        assert shopping.should_restock(SUPER_POTION) is True
+
+    def test_should_restock_false(
+        self, inv: InventoryState, shopping: ShoppingHeuristic
+    ) -> None:
+        inv.add_item(SUPER_POTION, 10)
+        assert shopping.should_restock(SUPER_POTION) is False
+
+
 class TestPokemonCenterProtocol:
     """Tests for PokemonCenterProtocol class"""
 
-    def test_assess_healing_need_healthy(self) -> None:
-        inv = InventoryState()
-        inv.clear_inventory()
-        center = PokemonCenterProtocol(inv)
-        party = PartyState(
-            pokemon=[
-                PokemonState(
-                    species="Pikachu",
-                    level=25,
-                    current_hp=80,
-                    max_hp=80,
-                    status="NONE",
-                    moves=["Thunderbolt"],
-                    move_pp={"Thunderbolt": 15},
-                    move_max_pp={"Thunderbolt": 30},
-                ),
-                PokemonState(
-                    species="Charizard",
-                    level=30,
-                    current_hp=120,
-                    max_hp=120,
-                    status="NONE",
-                    moves=["Flamethrower"],
-                    move_pp={"Flamethrower": 10},
-                    move_max_pp={"Flamethrower": 15},
-                ),
-            ],
-            money=5000,
-        )
-        needs, priority, reason = center.assess_healing_need(party)
-        assert needs is False
-        assert priority == HealingPriority.LOW
+    @pytest.fixture
+    def center(self, inv: InventoryState) -> PokemonCenterProtocol:
+        return PokemonCenterProtocol(inv)
 
-    def test_assess_healing_need_critical(self) -> None:
-        inv = InventoryState()
-        inv.clear_inventory()
-        center = PokemonCenterProtocol(inv)
-        party = PartyState(
-            pokemon=[
-                PokemonState(
-                    species="Pikachu",
-                    level=25,
-                    current_hp=5,
-                    max_hp=80,
-                    status="NONE",
-                    moves=["Thunderbolt"],
-                    move_pp={"Thunderbolt": 15},
-                    move_max_pp={"Thunderbolt": 30},
-                ),
-                PokemonState(
-                    species="Charizard",
-                    level=30,
-                    current_hp=0,
-                    max_hp=120,
-                    status="NONE",
-                    moves=["Flamethrower"],
-                    move_pp={"Flamethrower": 10},
-                    move_max_pp={"Flamethrower": 15},
-                ),
-            ],
-            money=5000,
+    @pytest.fixture
+    def party_healthy(self) -> PartyState:
+        return _party(
+            _BASE_PIKACHU,
+            _BASE_CHARIZARD,
         )
-        needs, priority, reason = center.assess_healing_need(party)
-        assert needs is True
-        assert priority == HealingPriority.CRITICAL
 
-    def test_assess_healing_need_status(self) -> None:
-        inv = InventoryState()
-        inv.clear_inventory()
-        center = PokemonCenterProtocol(inv)
-        party = PartyState(
-            pokemon=[
-                PokemonState(
-                    species="Pikachu",
-                    level=25,
-                    current_hp=50,
-                    max_hp=80,
-                    status="PARALYZED",
-                    moves=["Thunderbolt"],
-                    move_pp={"Thunderbolt": 15},
-                    move_max_pp={"Thunderbolt": 30},
-                ),
-            ],
-            money=5000,
+    @pytest.fixture
+    def party_critical(self) -> PartyState:
+        return _party(
+            replace(_BASE_PIKACHU, current_hp=5),
+            replace(_BASE_CHARIZARD, current_hp=0),
         )
+
+    @pytest.fixture
+    def party_paralyzed(self) -> PartyState:
+        return _party(replace(_BASE_PIKACHU, current_hp=50, status="PARALYZED"))
+
+    @pytest.mark.parametrize(
+        "party_fixture,expected_needs,expected_priority",
+        [
+            ("party_healthy", False, HealingPriority.LOW),
+            ("party_critical", True, HealingPriority.CRITICAL),
+            ("party_paralyzed", True, HealingPriority.HIGH),
+        ],
+        ids=["healthy", "critical", "status"],
+    )
+    def test_assess_healing_need(
+        self,
+        request: pytest.FixtureRequest,
+        center: PokemonCenterProtocol,
+        party_fixture: str,
+        expected_needs: bool,
+        expected_priority: HealingPriority,
+    ) -> None:
+        party = request.getfixturevalue(party_fixture)
         needs, priority, reason = center.assess_healing_need(party)
-        assert needs is True
-        assert priority == HealingPriority.HIGH
+        assert needs is expected_needs
+        assert priority == expected_priority
 
     def test_get_healing_priority(self) -> None:
         inv = InventoryState()
-        inv.clear_inventory()
         center = PokemonCenterProtocol(inv)
-        party = PartyState(
-            pokemon=[
-                PokemonState(
-                    species="Pikachu",
-                    level=25,
-                    current_hp=5,
-                    max_hp=80,
-                    status="NONE",
-                    moves=["Thunderbolt"],
-                    move_pp={"Thunderbolt": 15},
-                    move_max_pp={"Thunderbolt": 30},
-                ),
-                PokemonState(
-                    species="Charizard",
-                    level=30,
-                    current_hp=0,
-                    max_hp=120,
-                    status="NONE",
-                    moves=["Flamethrower"],
-                    move_pp={"Flamethrower": 10},
-                    move_max_pp={"Flamethrower": 15},
-                ),
-            ],
-            money=5000,
+        party = _party(
+            replace(_BASE_PIKACHU, current_hp=5),
+            replace(_BASE_CHARIZARD, current_hp=0),
         )
         indices = center.get_healing_priority(party)
         assert indices[0] == 1
@@ -654,71 +585,25 @@ class TestPokemonCenterProtocol:
 
     def test_should_navigate_to_center_healthy(self) -> None:
         inv = InventoryState()
-        inv.clear_inventory()
         center = PokemonCenterProtocol(inv)
-        party = PartyState(
-            pokemon=[
-                PokemonState(
-                    species="Pikachu",
-                    level=25,
-                    current_hp=80,
-                    max_hp=80,
-                    status="NONE",
-                    moves=["Thunderbolt"],
-                    move_pp={"Thunderbolt": 15},
-                    move_max_pp={"Thunderbolt": 30},
-                ),
-            ],
-            money=5000,
-        )
+        party = _party(_BASE_PIKACHU)
         assert center.should_navigate_to_center(party) is False
 
     def test_should_navigate_to_center_critical(self) -> None:
         inv = InventoryState()
-        inv.clear_inventory()
         center = PokemonCenterProtocol(inv)
-        party = PartyState(
-            pokemon=[
-                PokemonState(
-                    species="Pikachu",
-                    level=25,
-                    current_hp=5,
-                    max_hp=80,
-                    status="NONE",
-                    moves=["Thunderbolt"],
-                    move_pp={"Thunderbolt": 15},
-                    move_max_pp={"Thunderbolt": 30},
-                ),
-            ],
-            money=5000,
-        )
+        party = _party(replace(_BASE_PIKACHU, current_hp=5))
         assert center.should_navigate_to_center(party) is True
 
     def test_calculate_healing_cost_free(self) -> None:
         inv = InventoryState()
-        inv.clear_inventory()
         center = PokemonCenterProtocol(inv)
-        party = PartyState(
-            pokemon=[
-                PokemonState(
-                    species="Pikachu",
-                    level=25,
-                    current_hp=80,
-                    max_hp=80,
-                    status="NONE",
-                    moves=["Thunderbolt"],
-                    move_pp={"Thunderbolt": 15},
-                    move_max_pp={"Thunderbolt": 30},
-                ),
-            ],
-            money=5000,
-        )
+        party = _party(_BASE_PIKACHU)
         cost = center.calculate_healing_cost(party)
         assert cost == 0
 
     def test_get_nearest_center_location(self) -> None:
         inv = InventoryState()
-        inv.clear_inventory()
         center = PokemonCenterProtocol(inv)
         location = center.get_nearest_center_location("Pewter City")
         assert location is not None
@@ -726,62 +611,24 @@ class TestPokemonCenterProtocol:
 
     def test_get_nearest_center_location_unknown(self) -> None:
         inv = InventoryState()
-        inv.clear_inventory()
         center = PokemonCenterProtocol(inv)
         location = center.get_nearest_center_location("Unknown")
         assert location is None
 
     def test_execute_center_protocol_no_healing_needed(self) -> None:
         inv = InventoryState()
-        inv.clear_inventory()
         center = PokemonCenterProtocol(inv)
-        party = PartyState(
-            pokemon=[
-                PokemonState(
-                    species="Pikachu",
-                    level=25,
-                    current_hp=80,
-                    max_hp=80,
-                    status="NONE",
-                    moves=["Thunderbolt"],
-                    move_pp={"Thunderbolt": 15},
-                    move_max_pp={"Thunderbolt": 30},
-                ),
-            ],
-            money=5000,
-        )
+        party = _party(_BASE_PIKACHU)
         success, updated = center.execute_center_protocol(party)
         assert success is True
         assert updated.pokemon[0].current_hp == 80
 
     def test_execute_center_protocol_heals_party(self) -> None:
         inv = InventoryState()
-        inv.clear_inventory()
         center = PokemonCenterProtocol(inv)
-        party = PartyState(
-            pokemon=[
-                PokemonState(
-                    species="Pikachu",
-                    level=25,
-                    current_hp=5,
-                    max_hp=80,
-                    status="NONE",
-                    moves=["Thunderbolt"],
-                    move_pp={"Thunderbolt": 15},
-                    move_max_pp={"Thunderbolt": 30},
-                ),
-                PokemonState(
-                    species="Charizard",
-                    level=30,
-                    current_hp=0,
-                    max_hp=120,
-                    status="NONE",
-                    moves=["Flamethrower"],
-                    move_pp={"Flamethrower": 10},
-                    move_max_pp={"Flamethrower": 15},
-                ),
-            ],
-            money=5000,
+        party = _party(
+            replace(_BASE_PIKACHU, current_hp=5),
+            replace(_BASE_CHARIZARD, current_hp=0),
         )
         success, updated = center.execute_center_protocol(party)
         assert success is True
@@ -790,7 +637,6 @@ class TestPokemonCenterProtocol:
 
     def test_set_heal_thresholds(self) -> None:
         inv = InventoryState()
-        inv.clear_inventory()
         center = PokemonCenterProtocol(inv)
         center.set_heal_thresholds(heal_percent=60.0, critical_percent=25.0)
         assert center._heal_threshold_percent == 60.0
@@ -798,7 +644,6 @@ class TestPokemonCenterProtocol:
 
     def test_set_exit_destination(self) -> None:
         inv = InventoryState()
-        inv.clear_inventory()
         center = PokemonCenterProtocol(inv)
         center.set_exit_destination("Route 5")
         assert center.get_exit_destination() == "Route 5"
@@ -807,446 +652,229 @@ class TestPokemonCenterProtocol:
 class TestItemUsageStrategy:
     """Tests for ItemUsageStrategy class"""
 
-    def test_select_battle_item_critical_hp(self) -> None:
-        inv = InventoryState()
-        inv.clear_inventory()
-        inv.add_item(ItemType.MAX_POTION, 10)
-        inv.add_item(ItemType.FULL_RESTORE, 5)
-        inv.add_item(ItemType.FULL_HEAL, 3)
-        strategy = ItemUsageStrategy(inv)
-        party = PartyState(
-            pokemon=[
-                PokemonState(
-                    species="Pikachu",
-                    level=25,
-                    current_hp=5,
-                    max_hp=80,
-                    status="NONE",
-                    moves=["Thunderbolt"],
-                    move_pp={"Thunderbolt": 15},
-                    move_max_pp={"Thunderbolt": 30},
-                ),
-                PokemonState(
-                    species="Charizard",
-                    level=30,
-                    current_hp=100,
-                    max_hp=120,
-                    status="NONE",
-                    moves=["Flamethrower"],
-                    move_pp={"Flamethrower": 10},
-                    move_max_pp={"Flamethrower": 15},
-                ),
-            ],
-            money=5000,
+    @pytest.fixture
+    def strategy(self, inv: InventoryState) -> ItemUsageStrategy:
+        return ItemUsageStrategy(inv)
+
+    def test_select_battle_item_critical_hp(
+        self,
+        inv: InventoryState,
+        strategy: ItemUsageStrategy,
+        pikachu_hp5: PokemonState,
+    ) -> None:
+        inv.add_item(MAX_POTION, 10)
+        inv.add_item(FULL_RESTORE, 5)
+        inv.add_item(FULL_HEAL, 3)
+        party = _party(
+            pikachu_hp5,
+            replace(_BASE_CHARIZARD, current_hp=100),
         )
         item, target = strategy.select_battle_item(party, 0)
-        assert item in [ItemType.MAX_POTION, ItemType.FULL_RESTORE]
+        assert item in [MAX_POTION, FULL_RESTORE]
         assert target == 0
 
-    def test_select_battle_item_status_paralyzed(self) -> None:
-        inv = InventoryState()
-        inv.clear_inventory()
-        inv.add_item(ItemType.PARALYZE_HEAL, 3)
-        strategy = ItemUsageStrategy(inv)
-        party = PartyState(
-            pokemon=[
-                PokemonState(
-                    species="Pikachu",
-                    level=25,
-                    current_hp=50,
-                    max_hp=80,
-                    status="PARALYZED",
-                    moves=["Thunderbolt"],
-                    move_pp={"Thunderbolt": 15},
-                    move_max_pp={"Thunderbolt": 30},
-                ),
-            ],
-            money=5000,
-        )
+    def test_select_battle_item_status_paralyzed(
+        self,
+        inv: InventoryState,
+        strategy: ItemUsageStrategy,
+        pikachu_paralyzed: PokemonState,
+    ) -> None:
+        inv.add_item(PARALYZE_HEAL, 3)
+        party = _party(pikachu_paralyzed)
         item, target = strategy.select_battle_item(party, 0)
-        assert item == ItemType.PARALYZE_HEAL
-
-    def test_select_battle_item_no_need(self) -> None:
-        inv = InventoryState()
-        inv.clear_inventory()
-        inv.add_item(ItemType.MAX_POTION, 10)
-        strategy = ItemUsageStrategy(inv)
-        party = PartyState(
-            pokemon=[
-                PokemonState(
-                    species="Pikachu",
-                    level=25,
-                    current_hp=50,
-                    max_hp=80,
-                    status="NONE",
-                    moves=["Thunderbolt"],
-                    move_pp={"Thunderbolt": 15},
-                    move_max_pp={"Thunderbolt": 30},
-                ),
-            ],
-            money=5000,
-        )
+        assert item == PARALYZE_HEAL
+
+    def test_select_battle_item_no_need(
+        self,
+        inv: InventoryState,
+        strategy: ItemUsageStrategy,
+        pikachu_hp50: PokemonState,
+    ) -> None:
+        inv.add_item(MAX_POTION, 10)
+        party = _party(pikachu_hp50)
         item, target = strategy.select_battle_item(party, 0)
         assert item is None
         assert target is None
 
-    def test_should_use_potion_critical(self) -> None:
-        inv = InventoryState()
-        inv.clear_inventory()
-        strategy = ItemUsageStrategy(inv)
-        pokemon = PokemonState(
-            species="Pikachu",
-            level=25,
-            current_hp=5,
-            max_hp=80,
-            status="NONE",
-            moves=["Thunderbolt"],
-            move_pp={"Thunderbolt": 15},
-            move_max_pp={"Thunderbolt": 30},
-        )
-        result = strategy.should_use_potion(pokemon, 0.05, {"is_trainer_battle": False})
-        assert result is True
-
-    def test_should_use_potion_trainer_battle(self) -> None:
-        inv = InventoryState()
-        inv.clear_inventory()
-        strategy = ItemUsageStrategy(inv)
-        pokemon = PokemonState(
-            species="Pikachu",
-            level=25,
-            current_hp=50,
-            max_hp=80,
-            status="NONE",
-            moves=["Thunderbolt"],
-            move_pp={"Thunderbolt": 15},
-            move_max_pp={"Thunderbolt": 30},
-        )
-        result = strategy.should_use_potion(pokemon, 0.40, {"is_trainer_battle": True})
-        assert result is True
-
-    def test_should_use_potion_wild_battle(self) -> None:
-        inv = InventoryState()
-        inv.clear_inventory()
-        strategy = ItemUsageStrategy(inv)
-        pokemon = PokemonState(
-            species="Pikachu",
-            level=25,
-            current_hp=50,
-            max_hp=80,
-            status="NONE",
-            moves=["Thunderbolt"],
-            move_pp={"Thunderbolt": 15},
-            move_max_pp={"Thunderbolt": 30},
-        )
-        result = strategy.should_use_potion(pokemon, 0.40, {"is_trainer_battle": False})
-        assert result is False
-
-    def test_select_potion_type(self) -> None:
-        inv = InventoryState()
-        inv.clear_inventory()
-        strategy = ItemUsageStrategy(inv)
-        pokemon = PokemonState(
-            species="Pikachu",
-            level=25,
-            current_hp=50,
-            max_hp=80,
-            status="NONE",
-            moves=["Thunderbolt"],
-            move_pp={"Thunderbolt": 15},
-            move_max_pp={"Thunderbolt": 30},
-        )
-        available = {
-            ItemType.MAX_POTION: 3,
-            ItemType.FULL_RESTORE: 5,
-            ItemType.HYPER_POTION: 10,
-        }
-        potion = strategy.select_potion_type(pokemon, available)
+    @pytest.mark.parametrize(
+        "pokemon_fixture,hp_ratio,is_trainer_battle,expected",
+        [
+            ("pikachu_hp5", 0.05, False, True),
+            ("pikachu_hp50", 0.40, True, True),
+            ("pikachu_hp50", 0.40, False, False),
+        ],
+        ids=["critical", "trainer_battle", "wild_battle"],
+    )
+    def test_should_use_potion(
+        self,
+        request: pytest.FixtureRequest,
+        strategy: ItemUsageStrategy,
+        pokemon_fixture: str,
+        hp_ratio: float,
+        is_trainer_battle: bool,
+        expected: bool,
+    ) -> None:
+        pokemon = request.getfixturevalue(pokemon_fixture)
+        result = strategy.should_use_potion(
+            pokemon, hp_ratio, {"is_trainer_battle": is_trainer_battle}
+        )
+        assert result is expected
+
+    def test_select_potion_type(
+        self, strategy: ItemUsageStrategy, pikachu_hp50: PokemonState
+    ) -> None:
+        potion = strategy.select_potion_type(pikachu_hp50, _AVAILABLE_POTIONS)
         assert potion is not None
 
-    def test_should_use_status_cure_blocking(self) -> None:
-        inv = InventoryState()
-        inv.clear_inventory()
-        strategy = ItemUsageStrategy(inv)
-        pokemon = PokemonState(
-            species="Pikachu",
-            level=25,
-            current_hp=50,
-            max_hp=80,
-            status="PARALYZED",
-            moves=["Thunderbolt"],
-            move_pp={"Thunderbolt": 15},
-            move_max_pp={"Thunderbolt": 30},
-        )
-        result = strategy.should_use_status_cure(pokemon, {})
+    def test_should_use_status_cure_blocking(
+        self, strategy: ItemUsageStrategy, pikachu_paralyzed: PokemonState
+    ) -> None:
+        result = strategy.should_use_status_cure(pikachu_paralyzed, {})
         assert result is True
 
-    def test_should_use_status_cure_none(self) -> None:
-        inv = InventoryState()
-        inv.clear_inventory()
-        strategy = ItemUsageStrategy(inv)
-        pokemon = PokemonState(
-            species="Pikachu",
-            level=25,
-            current_hp=50,
-            max_hp=80,
-            status="NONE",
-            moves=["Thunderbolt"],
-            move_pp={"Thunderbolt": 15},
-            move_max_pp={"Thunderbolt": 30},
-        )
-        result = strategy.should_use_status_cure(pokemon, {})
+    def test_should_use_status_cure_none(
+        self, strategy: ItemUsageStrategy, pikachu_hp50: PokemonState
+    ) -> None:
+        result = strategy.should_use_status_cure(pikachu_hp50, {})
         assert result is False
 
-    def test_select_status_cure(self) -> None:
-        inv = InventoryState()
-        inv.clear_inventory()
-        strategy = ItemUsageStrategy(inv)
-        pokemon = PokemonState(
-            species="Pikachu",
-            level=25,
-            current_hp=50,
-            max_hp=80,
-            status="POISONED",
-            moves=["Thunderbolt"],
-            move_pp={"Thunderbolt": 15},
-            move_max_pp={"Thunderbolt": 30},
-        )
-        available = {ItemType.BURN_HEAL: 5}
-        cure = strategy.select_status_cure(pokemon, available)
+    def test_select_status_cure(
+        self, strategy: ItemUsageStrategy, pikachu_poisoned: PokemonState
+    ) -> None:
+        cure = strategy.select_status_cure(pikachu_poisoned, _AVAILABLE_BURN_HEAL)
         assert cure is None
 
-    def test_calculate_item_value(self) -> None:
-        inv = InventoryState()
-        inv.clear_inventory()
-        strategy = ItemUsageStrategy(inv)
-        party = PartyState(
-            pokemon=[
-                PokemonState(
-                    species="Pikachu",
-                    level=25,
-                    current_hp=50,
-                    max_hp=80,
-                    status="NONE",
-                    moves=["Thunderbolt"],
-                    move_pp={"Thunderbolt": 15},
-                    move_max_pp={"Thunderbolt": 30},
-                ),
-            ],
-            money=5000,
-        )
+    def test_calculate_item_value(
+        self, strategy: ItemUsageStrategy, pikachu_hp50: PokemonState
+    ) -> None:
+        party = _party(pikachu_hp50)
         value = strategy.calculate_item_value(
-            ItemType.HYPER_POTION, party, {"is_trainer_battle": False}
+            HYPER_POTION, party, {"is_trainer_battle": False}
         )
         assert value >= 1.0
 
-    def test_calculate_potion_efficiency(self) -> None:
-        inv = InventoryState()
-        inv.clear_inventory()
-        strategy = ItemUsageStrategy(inv)
-        efficiency = strategy.calculate_potion_efficiency(ItemType.MAX_POTION, 50, 80)
+    def test_calculate_potion_efficiency(self, strategy: ItemUsageStrategy) -> None:
+        efficiency = strategy.calculate_potion_efficiency(MAX_POTION, 50, 80)
         assert 0 < efficiency <= 1.0
 
-    def test_calculate_potion_efficiency_no_heal_needed(self) -> None:
-        inv = InventoryState()
-        inv.clear_inventory()
-        strategy = ItemUsageStrategy(inv)
-        efficiency = strategy.calculate_potion_efficiency(ItemType.MAX_POTION, 80, 80)
+    def test_calculate_potion_efficiency_no_heal_needed(
+        self, strategy: ItemUsageStrategy
+    ) -> None:
+        efficiency = strategy.calculate_potion_efficiency(MAX_POTION, 80, 80)
         assert efficiency == 0.0
 
-    def test_should_use_rare_candy(self) -> None:
-        inv = InventoryState()
-        inv.clear_inventory()
-        inv.add_item(ItemType.RARE_CANDY, 5)
-        strategy = ItemUsageStrategy(inv)
-        pokemon = PokemonState(
-            species="Pikachu",
-            level=55,
-            current_hp=80,
-            max_hp=80,
-            status="NONE",
-            moves=["Thunderbolt"],
-            move_pp={"Thunderbolt": 15},
-            move_max_pp={"Thunderbolt": 30},
-        )
-        party = PartyState(
-            pokemon=[pokemon],
-            money=5000,
-        )
+    def test_should_use_rare_candy(
+        self, inv: InventoryState, strategy: ItemUsageStrategy
+    ) -> None:
+        inv.add_item(RARE_CANDY, 5)
+        pokemon = replace(_BASE_PIKACHU, level=55)
+        party = _party(pokemon)
         result = strategy.should_use_rare_candy(pokemon, party, [])
         assert result is True
 
-    def test_should_use_rare_candy_max_level(self) -> None:
-        inv = InventoryState()
-        inv.clear_inventory()
-        inv.add_item(ItemType.RARE_CANDY, 5)
-        strategy = ItemUsageStrategy(inv)
-        pokemon = PokemonState(
-            species="Pikachu",
-            level=100,
-            current_hp=80,
-            max_hp=80,
-            status="NONE",
-            moves=["Thunderbolt"],
-            move_pp={"Thunderbolt": 15},
-            move_max_pp={"Thunderbolt": 30},
-        )
-        party = PartyState(
-            pokemon=[pokemon],
-            money=5000,
-        )
+    def test_should_use_rare_candy_max_level(
+        self, inv: InventoryState, strategy: ItemUsageStrategy
+    ) -> None:
+        inv.add_item(RARE_CANDY, 5)
+        pokemon = replace(_BASE_PIKACHU, level=100)
+        party = _party(pokemon)
         result = strategy.should_use_rare_candy(pokemon, party, [])
         assert result is False
 
-    def test_get_optimal_candy_target(self) -> None:
-        inv = InventoryState()
-        inv.clear_inventory()
-        inv.add_item(ItemType.RARE_CANDY, 5)
-        strategy = ItemUsageStrategy(inv)
-        party = PartyState(
-            pokemon=[
-                PokemonState(
-                    species="Pikachu",
-                    level=20,
-                    current_hp=80,
-                    max_hp=80,
-                    status="NONE",
-                    moves=["Thunderbolt"],
-                    move_pp={"Thunderbolt": 15},
-                    move_max_pp={"Thunderbolt": 30},
-                ),
-                PokemonState(
-                    species="Charizard",
-                    level=40,
-                    current_hp=120,
-                    max_hp=120,
-                    status="NONE",
-                    moves=["Flamethrower"],
-                    move_pp={"Flamethrower": 10},
-                    move_max_pp={"Flamethrower": 15},
-                ),
-            ],
-            money=5000,
+    def test_get_optimal_candy_target(
+        self, inv: InventoryState, strategy: ItemUsageStrategy
+    ) -> None:
+        inv.add_item(RARE_CANDY, 5)
+        party = _party(
+            replace(_BASE_PIKACHU, level=20),
+            replace(_BASE_CHARIZARD, level=40),
         )
         target = strategy.get_optimal_candy_target(party, [])
         assert target is not None
 
-    def test_should_use_x_item_trainer_battle(self) -> None:
-        inv = InventoryState()
-        inv.clear_inventory()
-        strategy = ItemUsageStrategy(inv)
-        result = strategy.should_use_x_item(
-            {"is_trainer_battle": True, "turn_number": 1}
-        )
-        assert result is True
-
-    def test_should_use_x_item_wild_battle(self) -> None:
-        inv = InventoryState()
-        inv.clear_inventory()
-        strategy = ItemUsageStrategy(inv)
-        result = strategy.should_use_x_item(
-            {"is_trainer_battle": False, "turn_number": 1}
-        )
-        assert result is False
-
-    def test_should_use_x_item_late_battle(self) -> None:
-        inv = InventoryState()
-        inv.clear_inventory()
-        strategy = ItemUsageStrategy(inv)
+    @pytest.mark.parametrize(
+        "is_trainer_battle,turn_number,expected",
+        [(True, 1, True), (False, 1, False), (True, 5, False)],
+        ids=["trainer_battle", "wild_battle", "late_battle"],
+    )
+    def test_should_use_x_item(
+        self,
+        strategy: ItemUsageStrategy,
+        is_trainer_battle: bool,
+        turn_number: int,
+        expected: bool,
+    ) -> None:
         result = strategy.should_use_x_item(
-            {"is_trainer_battle": True, "turn_number": 5}
+            {"is_trainer_battle": is_trainer_battle, "turn_number": turn_number}
         )
-        assert result is False
+        assert result is expected
 
-    def test_select_x_item(self) -> None:
-        inv = InventoryState()
-        inv.clear_inventory()
-        inv.add_item(ItemType.X_SPEED, 5)
-        inv.add_item(ItemType.X_SPECIAL, 5)
-        strategy = ItemUsageStrategy(inv)
+    def test_select_x_item(
+        self, inv: InventoryState, strategy: ItemUsageStrategy
+    ) -> None:
+        inv.add_item(X_SPEED, 5)
+        inv.add_item(X_SPECIAL, 5)
         item = strategy.select_x_item({"is_trainer_battle": True, "turn_number": 1})
         assert item is not None
 
-    def test_evaluate_repel_usage(self) -> None:
-        inv = InventoryState()
-        inv.clear_inventory()
-        inv.add_item(ItemType.SUPER_REPEL, 5)
-        strategy = ItemUsageStrategy(inv)
-        party = PartyState(
-            pokemon=[
-                PokemonState(
-                    species="Pikachu",
-                    level=25,
-                    current_hp=80,
-                    max_hp=80,
-                    status="NONE",
-                    moves=["Thunderbolt"],
-                    move_pp={"Thunderbolt": 15},
-                    move_max_pp={"Thunderbolt": 30},
-                ),
-            ],
-            money=5000,
-        )
+    def test_evaluate_repel_usage(
+        self,
+        inv: InventoryState,
+        strategy: ItemUsageStrategy,
+        pikachu_hp80: PokemonState,
+    ) -> None:
+        inv.add_item(SUPER_REPEL, 5)
+        party = _party(pikachu_hp80)
         should_use, repel_type, reason = strategy.evaluate_repel_usage(
             party, "Cerulean City", "VICTORY_ROAD"
         )
         assert isinstance(should_use, bool)
 
-    def test_get_no_waste_items(self) -> None:
-        inv = InventoryState()
-        inv.clear_inventory()
-        strategy = ItemUsageStrategy(inv)
+    def test_get_no_waste_items(self, strategy: ItemUsageStrategy) -> None:
         items = strategy.get_no_waste_items()
-        assert ItemType.MASTER_BALL in items
-        assert ItemType.RARE_CANDY in items
-
-    def test_check_waste_prevention_no_waste(self) -> None:
-        inv = InventoryState()
-        inv.clear_inventory()
-        strategy = ItemUsageStrategy(inv)
+        assert MASTER_BALL in items
+        assert RARE_CANDY in items
+
+    @pytest.mark.parametrize(
+        "current_hp,max_hp,expected",
+        [
+            # 124 HP missing (1/125), Hyper Potion heals 200, 200*0.3=60
+            # 124 >= 60 → NOT wasteful
+            (1, 125, False),
+            # 30 HP missing (50/80), Hyper Potion heals 200, 200*0.3=60
+            # 30 < 60 → IS wasteful
+            (50, 80, True),
+        ],
+        ids=["no_waste", "would_be_wasteful"],
+    )
+    def test_check_waste_prevention(
+        self,
+        strategy: ItemUsageStrategy,
+        current_hp: int,
+        max_hp: int,
+        expected: bool,
+    ) -> None:
         # Ensure HEALING_POWER is populated (shared class state, may be empty)
-        from src.core.inventory import ShoppingHeuristic
-
-        ShoppingHeuristic.HEALING_POWER[ItemType.HYPER_POTION] = 200
+        ShoppingHeuristic.HEALING_POWER[HYPER_POTION] = 200
 
-        # 124 HP missing (1/125), Hyper Potion heals 200, 200*0.3=60
-        # 124 >= 60 → NOT wasteful
         is_wasteful, reason = strategy.check_waste_prevention(
-            ItemType.HYPER_POTION, {"current_hp": 1, "max_hp": 125}
+            HYPER_POTION, {"current_hp": current_hp, "max_hp": max_hp}
         )
-        assert is_wasteful is False
-
-    def test_check_waste_prevention_would_be_wasteful(self) -> None:
-        inv = InventoryState()
-        inv.clear_inventory()
-        strategy = ItemUsageStrategy(inv)
-        # Ensure HEALING_POWER is populated (shared class state, may be empty)
-        from src.core.inventory import ShoppingHeuristic
-
-        ShoppingHeuristic.HEALING_POWER[ItemType.HYPER_POTION] = 200
-
-        # 30 HP missing (50/80), Hyper Potion heals 200, 200*0.3=60
-        # 30 < 60 → IS wasteful
-        is_wasteful, reason = strategy.check_waste_prevention(
-            ItemType.HYPER_POTION, {"current_hp": 50, "max_hp": 80}
-        )
-        assert is_wasteful is True
-        assert "wasted" in reason.lower()
+        assert is_wasteful is expected
+        if expected:
+            assert "wasted" in reason.lower()
 
 
 class TestInventoryManager:
     """Tests for InventoryManager class"""
 
-    def test_manager_has_all_components(self) -> None:
-        manager = InventoryManager()
-        manager.inventory.clear_inventory()
+    def test_manager_has_all_components(self, manager: InventoryManager) -> None:
         assert manager.inventory is not None
         assert manager.shopping is not None
         assert manager.center is not None
         assert manager.item_usage is not None
 
-    def test_process_vision_update(self) -> None:
-        manager = InventoryManager()
-        manager.inventory.clear_inventory()
+    def test_process_vision_update(self, manager: InventoryManager) -> None:
         vision_data = {
             "item_readings": [
                 {"item_type": "Hyper Potion", "quantity": 5},
@@ -1254,86 +882,34 @@ class TestInventoryManager:
             ]
         }
         manager.process_vision_update(vision_data)
-        assert manager.inventory.has_item(ItemType.HYPER_POTION)
-        assert manager.inventory.has_item(ItemType.ULTRA_BALL)
-
-    def test_get_shopping_goal(self) -> None:
-        manager = InventoryManager()
-        manager.inventory.clear_inventory()
-        party = PartyState(
-            pokemon=[
-                PokemonState(
-                    species="Pikachu",
-                    level=25,
-                    current_hp=50,
-                    max_hp=80,
-                    status="NONE",
-                    moves=["Thunderbolt"],
-                    move_pp={"Thunderbolt": 15},
-                    move_max_pp={"Thunderbolt": 30},
-                ),
-            ],
-            money=5000,
-        )
+        assert manager.inventory.has_item(HYPER_POTION)
+        assert manager.inventory.has_item(ULTRA_BALL)
+
+    def test_get_shopping_goal(self, manager: InventoryManager) -> None:
+        party = _party(replace(_BASE_PIKACHU, current_hp=50))
         goal = manager.get_shopping_goal(party, 5000)
         assert goal is not None
         assert isinstance(goal, ShoppingPlan)
 
-    def test_get_healing_goal(self) -> None:
-        manager = InventoryManager()
-        manager.inventory.clear_inventory()
-        party = PartyState(
-            pokemon=[
-                PokemonState(
-                    species="Pikachu",
-                    level=25,
-                    current_hp=80,
-                    max_hp=80,
-                    status="NONE",
-                    moves=["Thunderbolt"],
-                    move_pp={"Thunderbolt": 15},
-                    move_max_pp={"Thunderbolt": 30},
-                ),
-            ],
-            money=5000,
-        )
+    def test_get_healing_goal(self, manager: InventoryManager) -> None:
+        party = _party(_BASE_PIKACHU)
         goal = manager.get_healing_goal(party)
         assert goal is not None
 
-    def test_get_battle_item_decision(self) -> None:
-        manager = InventoryManager()
-        manager.inventory.clear_inventory()
-        manager.inventory.add_item(ItemType.MAX_POTION, 10)
-        party = PartyState(
-            pokemon=[
-                PokemonState(
-                    species="Pikachu",
-                    level=25,
-                    current_hp=5,
-                    max_hp=80,
-                    status="NONE",
-                    moves=["Thunderbolt"],
-                    move_pp={"Thunderbolt": 15},
-                    move_max_pp={"Thunderbolt": 30},
-                ),
-            ],
-            money=5000,
-        )
+    def test_get_battle_item_decision(self, manager: InventoryManager) -> None:
+        manager.inventory.add_item(MAX_POTION, 10)
+        party = _party(replace(_BASE_PIKACHU, current_hp=5))
         item, target = manager.get_battle_item_decision(
             party, 0, {"is_trainer_battle": False}
         )
         assert item is not None
 
-    def test_record_item_usage(self) -> None:
-        manager = InventoryManager()
-        manager.inventory.clear_inventory()
-        manager.inventory.add_item(ItemType.MAX_POTION, 5)
-        manager.record_item_usage(ItemType.MAX_POTION, {"context": "battle"})
-        assert manager.inventory.get_quantity(ItemType.MAX_POTION) == 4
+    def test_record_item_usage(self, manager: InventoryManager) -> None:
+        manager.inventory.add_item(MAX_POTION, 5)
+        manager.record_item_usage(MAX_POTION, {"context": "battle"})
+        assert manager.inventory.get_quantity(MAX_POTION) == 4
 
-    def test_get_inventory_report(self) -> None:
-        manager = InventoryManager()
-        manager.inventory.clear_inventory()
+    def test_get_inventory_report(self, manager: InventoryManager) -> None:
         report = manager.get_inventory_report()
         assert "inventory_summary" in report
         assert "shopping_needs" in report
@@ -1346,7 +922,7 @@ class TestShoppingPlan:
     def test_shopping_plan_creation(self) -> None:
         items = [
             ShoppingListItem(
-                item_type=ItemType.HYPER_POTION,
+                item_type=HYPER_POTION,
                 quantity=10,
                 priority=ShoppingPriority.CRITICAL,
                 estimated_cost=3000,
@@ -1369,7 +945,7 @@ class TestKeyItem:
 
     def test_key_item_creation(self) -> None:
         key_item = KeyItem(
-            item_type=ItemType.TOWN_MAP,
+            item_type=TOWN_MAP,
             name="Town Map",
             description="A map of the region",
             obtained=False,
@@ -1379,7 +955,7 @@ class TestKeyItem:
 
     def test_key_item_obtain(self) -> None:
         key_item = KeyItem(
-            item_type=ItemType.TOWN_MAP,
+            item_type=TOWN_MAP,
             name="Town Map",
             description="A map of the region",
         )
@@ -1394,7 +970,7 @@ class TestTMData:
     def test_tm_data_creation(self) -> None:
         tm = TMData(
             tm_number=1,
-            item_type=ItemType.TM01,
+            item_type=TM01,
             move_name="Mega Punch",
             move_type="Normal",
             move_power=40,
@@ -1407,7 +983,7 @@ class TestTMData:
     def test_hm_data_creation(self) -> None:
         hm = TMData(
             tm_number=1,
-            item_type=ItemType.HM01,
+            item_type=HM01,
             move_name="Cut",
             move_type="Normal",
             move_power=50,
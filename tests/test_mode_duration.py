@@ -2,8 +2,11 @@
 Tests for Mode Duration Tracking System
 """
 
+import dataclasses
+import json
 import pytest
 import time
+from typing import Optional
 import tempfile
 import os
 from unittest.mock import MagicMock
@@ -17,6 +20,7 @@ from src.core.mode_duration import (
     EscalationTier,
     BreakoutStrategy,
     ModeClassification,
+    ModeExit,
     ModeDurationProfile,
     Anomaly,
     BreakoutResult,
@@ -30,9 +34,30 @@ from src.core.mode_duration import (
     BreakoutAnalytics,
     ModeDurationEscalation,
     ModeDurationTrackingSystem,
+    CLASSIFICATION_CACHE_TICKS,
+    MAX_CACHED_CLASSIFICATIONS,
+    MAX_MODE_SEQUENCE,
 )
 
 
+class FakeClock:
+    """Manually advanced stand-in for time.monotonic and time.sleep."""
+
+    def __init__(self, start: float = 1000.0) -> None:
+        self.now = start
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.advance(seconds)
+
+
 class TestModeClassifier:
     def setup_method(self) -> None:
         self.classifier = ModeClassifier()
@@ -103,17 +128,80 @@ class TestModeClassifier:
         assert result.mode == GameMode.CUTSCENE.value
         assert result.sub_mode == CutsceneSubMode.EVOLUTION.value
 
+    def test_classify_transition(self) -> None:
+        state = {"screen_type": "transition"}
+        result = self.classifier.classify_mode(state, tick=109)
+        assert result.mode == GameMode.TRANSITION.value
+        assert result.sub_mode == "TRANSITION_GENERIC"
+
+    def test_classify_flag_priority(self) -> None:
+        state = {
+            "is_battle": True,
+            "has_dialog": True,
+            "is_menu": True,
+            "screen_type": "cutscene",
+        }
+        assert self.classifier.classify_mode(state).mode == GameMode.BATTLE.value
+        state["is_battle"] = False
+        assert ModeClassifier().classify_mode(state).mode == GameMode.DIALOG.value
+        state["has_dialog"] = False
+        assert ModeClassifier().classify_mode(state).mode == GameMode.MENU.value
+        state["is_menu"] = False
+        assert ModeClassifier().classify_mode(state).mode == GameMode.CUTSCENE.value
+
     def test_classify_caching(self) -> None:
         state = {"is_battle": True}
         result1 = self.classifier.classify_mode(state, tick=109)
-        time.sleep(0.05)
-        result2 = self.classifier.classify_mode(state, tick=110)
-        assert result1.timestamp == result2.timestamp
+        result2 = self.classifier.classify_mode({**state, "x": 1}, tick=110)
+        assert (result2.mode, result2.sub_mode, result2.confidence) == (
+            result1.mode,
+            result1.sub_mode,
+            result1.confidence,
+        )
+        # Cache hits report their own tick and state, not the cached entry's
+        assert result1.tick == 109
+        assert result2.tick == 110
+        assert result2.state_snapshot == {"is_battle": True, "x": 1}
+
+    def test_classify_caching_keyed_on_state(self) -> None:
+        battle = self.classifier.classify_mode({"is_battle": True}, tick=111)
+        dialog = self.classifier.classify_mode({"has_dialog": True}, tick=111)
+        assert battle.mode == GameMode.BATTLE.value
+        assert dialog.mode == GameMode.DIALOG.value
+        again = self.classifier.classify_mode({"is_battle": True, "x": 1}, tick=112)
+        assert again.mode == battle.mode
+        assert again.confidence == battle.confidence
+        assert again.tick == 112
+
+    def test_classify_caching_expires_after_ticks(self) -> None:
+        state = {"is_battle": True}
+        cache = self.classifier._mode_cache
+        first = self.classifier.classify_mode(state, tick=0)
+        same = self.classifier.classify_mode(state, tick=CLASSIFICATION_CACHE_TICKS)
+        assert same.tick == CLASSIFICATION_CACHE_TICKS
+        assert same.mode == first.mode
+        # Expiry runs from the tick the entry was computed at, not the last hit
+        assert [*cache.values()][0] is first
+        fresh = self.classifier.classify_mode(
+            state, tick=CLASSIFICATION_CACHE_TICKS + 1
+        )
+        assert [*cache.values()][0] is fresh
+        assert fresh.tick == CLASSIFICATION_CACHE_TICKS + 1
+
+    def test_classify_caching_bounded(self) -> None:
+        for level in range(MAX_CACHED_CLASSIFICATIONS + 10):
+            self.classifier.classify_mode({"is_battle": True, "enemy_level": level})
+        assert len(self.classifier._mode_cache) == MAX_CACHED_CLASSIFICATIONS
+
+    def test_classify_unhashable_state_value(self) -> None:
+        result = self.classifier.classify_mode({"is_menu": True, "near_npc": [1]})
+        assert result.mode == GameMode.MENU.value
 
 
 class TestDurationTracker:
     def setup_method(self) -> None:
-        self.tracker = DurationTracker()
+        self.clock = FakeClock()
+        self.tracker = DurationTracker(clock=self.clock)
 
     def test_enter_and_exit_mode(self) -> None:
         self.tracker.enter_mode("BATTLE", "WILD", tick=100)
@@ -121,7 +209,7 @@ class TestDurationTracker:
         assert self.tracker.current_mode is not None
         assert self.tracker.current_mode.mode == "BATTLE"
         assert self.tracker.current_mode.sub_mode == "WILD"
-        time.sleep(0.1)
+        self.clock.advance(0.1)
         exit_record = self.tracker.exit_mode(reason="natural", tick=110)
         assert exit_record is not None
         assert exit_record.mode == "BATTLE"
@@ -129,21 +217,31 @@ class TestDurationTracker:
 
     def test_get_current_duration(self) -> None:
         self.tracker.enter_mode("OVERWORLD", "NAVIGATION", tick=100)
-        time.sleep(0.1)
+        self.clock.advance(0.1)
         duration = self.tracker.get_current_duration()
         assert duration >= 0.1
         self.tracker.exit_mode(reason="natural", tick=200)
 
     def test_cumulative_tracking(self) -> None:
         self.tracker.enter_mode("BATTLE", "WILD", tick=100)
-        time.sleep(0.1)
+        self.clock.advance(0.1)
         self.tracker.exit_mode(reason="natural", tick=200)
         self.tracker.enter_mode("BATTLE", "WILD", tick=200)
-        time.sleep(0.1)
+        self.clock.advance(0.1)
         self.tracker.exit_mode(reason="natural", tick=300)
         cumulative = self.tracker.get_current_cumulative("session")
         assert cumulative > 0
 
+    def test_get_current_cumulatives_matches_windows(self) -> None:
+        assert self.tracker.get_current_cumulatives() == (0.0, 0.0, 0.0)
+        self.tracker.enter_mode("BATTLE", "WILD", tick=100)
+        self.tracker.exit_mode(reason="natural", tick=101)
+        self.tracker.enter_mode("BATTLE", "WILD", tick=102)
+        assert self.tracker.get_current_cumulatives() == tuple(
+            self.tracker.get_current_cumulative(window)
+            for window in ("session", "hour", "day")
+        )
+
     def test_mode_sequence_tracking(self) -> None:
         self.tracker.enter_mode("OVERWORLD", "NAVIGATION", tick=100)
         self.tracker.exit_mode(reason="natural", tick=101)
@@ -153,9 +251,31 @@ class TestDurationTracker:
         assert self.tracker.mode_sequence[0] == "OVERWORLD/NAVIGATION"
         assert self.tracker.mode_sequence[1] == "DIALOG/NPC_SHORT"
 
+    def test_mode_keys_are_interned(self) -> None:
+        self.tracker.enter_mode("BATTLE", "".join(["WI", "LD"]), tick=100)
+        self.tracker.enter_mode("BATTLE", "WILD", tick=101)
+        first, second = self.tracker.mode_sequence
+        assert first == "BATTLE/WILD"
+        assert first is second
+
+    def test_mode_sequence_is_bounded(self) -> None:
+        for i in range(MAX_MODE_SEQUENCE + 5):
+            self.tracker.enter_mode("BATTLE", f"WILD_{i}", tick=i)
+        assert len(self.tracker.mode_sequence) == MAX_MODE_SEQUENCE
+        assert self.tracker.mode_sequence[0] == "BATTLE/WILD_5"
+        assert self.tracker.get_recent_sequence(2) == [
+            f"BATTLE/WILD_{MAX_MODE_SEQUENCE + 3}",
+            f"BATTLE/WILD_{MAX_MODE_SEQUENCE + 4}",
+        ]
+        detector = AnomalyDetector(DurationProfileLearner())
+        anomalies = detector.detect_anomalies(
+            "", "", 0, 0, 0, 0, self.tracker.mode_sequence
+        )
+        assert [a.type for a in anomalies] == ["MODE_STICKINESS"]
+
     def test_mode_transition_interrupt(self) -> None:
         self.tracker.enter_mode("OVERWORLD", "NAVIGATION", tick=100)
-        time.sleep(0.1)
+        self.clock.advance(0.1)
         interrupt_exit = self.tracker.enter_mode("BATTLE", "WILD", tick=110)
         assert self.tracker.current_mode is not None
         assert self.tracker.current_mode.mode == "BATTLE"
@@ -185,6 +305,17 @@ class TestDurationProfileLearner:
         assert profile.sample_count == 5
         assert profile.mean_duration > 100.0
 
+    def test_update_profile_ewma_values(self) -> None:
+        for duration in (100.0, 110.0, 90.0):
+            self.learner.update_profile("BATTLE", "WILD", duration)
+        profile = self.learner.get_profile("BATTLE", "WILD")
+        assert profile is not None
+        assert profile.sample_count == 3
+        assert profile.mean_duration == pytest.approx(99.1)
+        assert profile.std_duration == pytest.approx(10.9)
+        assert (profile.min_duration, profile.max_duration) == (90.0, 110.0)
+        assert profile.p95_duration == pytest.approx(99.1 + 1.645 * 10.9)
+
     def test_outlier_detection(self) -> None:
         for i in range(10):
             self.learner.update_profile("BATTLE", "WILD", 100.0)
@@ -193,12 +324,61 @@ class TestDurationProfileLearner:
         assert profile is not None
         assert profile.sample_count == 10
 
+    def test_trend_without_tracker_is_insufficient(self) -> None:
+        for i in range(10):
+            self.learner.update_profile("BATTLE", "WILD", 100.0)
+        profile = self.learner.get_profile("BATTLE", "WILD")
+        assert profile is not None
+        assert profile.trend == "insufficient_data"
+
+    def test_trend_reads_tracker_history(self) -> None:
+        tracker = DurationTracker(clock=FakeClock())
+        now = tracker.clock()
+        tracker.mode_history.extend(
+            ModeExit("BATTLE", "WILD", now, i, 200.0, 0.0, 0.0, 0.0, "natural")
+            for i in range(5)
+        )
+        learner = DurationProfileLearner(duration_tracker=tracker)
+        for i in range(10):
+            learner.update_profile("BATTLE", "WILD", 100.0)
+        profile = learner.get_profile("BATTLE", "WILD")
+        assert profile is not None
+        assert profile.trend == "increasing"
+        assert profile.trend_slope == pytest.approx(100.0)
+
     def test_get_thresholds_unknown_profile(self) -> None:
         thresholds = self.learner.get_thresholds("UNKNOWN", "MODE")
         assert "warning" in thresholds
         assert "critical" in thresholds
         assert "emergency" in thresholds
 
+    def test_get_thresholds_defaults_by_sub_mode(self) -> None:
+        thresholds = self.learner.get_thresholds("BATTLE", "GYM_LEADER")
+        assert thresholds == {"warning": 900, "critical": 1800, "emergency": 3600}
+
+    def test_get_thresholds_cached_until_update(self) -> None:
+        for i in range(10):
+            self.learner.update_profile("BATTLE", "WILD", 100.0 + i)
+        first = self.learner.get_thresholds("BATTLE", "WILD")
+        assert self.learner.get_thresholds("BATTLE", "WILD") is first
+        self.learner.update_profile("BATTLE", "WILD", 150.0)
+        updated = self.learner.get_thresholds("BATTLE", "WILD")
+        assert updated is not first
+        profile = self.learner.get_profile("BATTLE", "WILD")
+        assert profile is not None
+        assert updated["critical"] == profile.p95_duration
+
+    def test_get_thresholds_read_only(self) -> None:
+        defaults = self.learner.get_thresholds("BATTLE", "GYM_LEADER")
+        fallback = self.learner.get_thresholds("UNKNOWN", "MODE")
+        for i in range(10):
+            self.learner.update_profile("BATTLE", "WILD", 100.0 + i)
+        learned = self.learner.get_thresholds("BATTLE", "WILD")
+        for thresholds in (defaults, fallback, learned):
+            with pytest.raises(TypeError):
+                thresholds["warning"] = 0  # type: ignore[index]
+        assert self.learner.get_thresholds("BATTLE", "GYM_LEADER")["warning"] == 900
+
     def test_get_thresholds_known_profile(self) -> None:
         for i in range(10):
             self.learner.update_profile("BATTLE", "WILD", 100.0)
@@ -239,6 +419,47 @@ class TestDurationProfileStore:
         assert loaded.sub_mode == "WILD"
         assert loaded.mean_duration == 120.0
 
+    def _profile(self, mean: float) -> ModeDurationProfile:
+        return ModeDurationProfile(
+            mode="BATTLE",
+            sub_mode="WILD",
+            sample_count=5,
+            mean_duration=mean,
+            std_duration=20.0,
+            min_duration=100.0,
+            max_duration=140.0,
+            p50_duration=mean,
+            p75_duration=130.0,
+            p95_duration=140.0,
+            p99_duration=145.0,
+            last_updated=time.time(),
+            trend="stable",
+            trend_slope=0.0,
+        )
+
+    def test_save_appends_to_log(self) -> None:
+        self.store.save_profile(self._profile(120.0))
+        self.store.save_profile(self._profile(130.0))
+        assert not os.path.exists(self.storage_path)
+        with open(self.store.log_path) as f:
+            assert len(f.readlines()) == 2
+        reopened = DurationProfileStore(storage_path=self.storage_path)
+        assert reopened.load_profiles()["BATTLE/WILD"].mean_duration == 130.0
+
+    def test_log_compacts_into_snapshot(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr("src.core.mode_duration.MAX_PROFILE_LOG_BYTES", 1)
+        self.store.save_profile(self._profile(125.0))
+        assert os.path.getsize(self.store.log_path) == 0
+        with open(self.storage_path) as f:
+            assert json.load(f)["BATTLE/WILD"]["mean_duration"] == 125.0
+        assert self.store.load_profiles()["BATTLE/WILD"].mean_duration == 125.0
+
+    def test_load_skips_torn_log_line(self) -> None:
+        self.store.save_profile(self._profile(120.0))
+        with open(self.store.log_path, "a") as f:
+            f.write('{"key": "BATTLE/WI')
+        assert self.store.load_profiles()["BATTLE/WILD"].mean_duration == 120.0
+
 
 class TestAnomalyDetector:
     def setup_method(self) -> None:
@@ -251,6 +472,12 @@ class TestAnomalyDetector:
         )
         assert len(anomalies) == 0
 
+    def test_no_anomaly_result_is_shared(self) -> None:
+        first = self.detector.detect_anomalies("BATTLE", "WILD", 50.0, 0, 0, 0, [])
+        second = self.detector.detect_anomalies("DIALOG", "SHOP", 10.0, 0, 0, 0, [])
+        assert first == ()
+        assert first is second
+
     def test_anomaly_unknown_mode_exceeds_emergency(self) -> None:
         anomalies = self.detector.detect_anomalies(
             "UNKNOWN", "MODE", 700.0, 0, 0, 0, []
@@ -266,12 +493,74 @@ class TestAnomalyDetector:
         extreme_anomaly = [a for a in anomalies if a.type == "DURATION_EXTREME"]
         assert len(extreme_anomaly) == 1
 
+    @pytest.mark.parametrize(
+        "duration,expected",
+        [
+            (105.0, None),
+            (115.0, "DURATION_WARNING"),
+            (125.0, "DURATION_THRESHOLD"),
+            (135.0, "DURATION_HIGH"),
+            (145.0, "DURATION_EXTREME"),
+        ],
+    )
+    def test_duration_anomaly_tiers(
+        self, duration: float, expected: Optional[str]
+    ) -> None:
+        self.learner.profiles["BATTLE/WILD"] = ModeDurationProfile(
+            mode="BATTLE",
+            sub_mode="WILD",
+            sample_count=10,
+            mean_duration=100.0,
+            std_duration=10.0,
+            min_duration=90.0,
+            max_duration=110.0,
+            p50_duration=100.0,
+            p75_duration=105.0,
+            p95_duration=110.0,
+            p99_duration=120.0,
+            last_updated=time.time(),
+            trend="stable",
+            trend_slope=0.0,
+        )
+        anomalies = self.detector.detect_anomalies(
+            "BATTLE", "WILD", duration, 0, 0, 0, []
+        )
+        assert [a.type for a in anomalies] == ([expected] if expected else [])
+
+    @pytest.mark.parametrize(
+        "session,hour,expected",
+        [
+            (4000.0, 0.0, ["CUMULATIVE_SESSION_CRITICAL"]),
+            (0.0, 2000.0, []),
+            (0.0, 4000.0, ["CUMULATIVE_HOUR_EMERGENCY"]),
+            (
+                8000.0,
+                4000.0,
+                ["CUMULATIVE_SESSION_EMERGENCY", "CUMULATIVE_HOUR_EMERGENCY"],
+            ),
+        ],
+    )
+    def test_cumulative_anomaly_tiers(
+        self, session: float, hour: float, expected: list[str]
+    ) -> None:
+        anomalies = self.detector.detect_anomalies(
+            "BATTLE", "WILD", 0, session, hour, 0, []
+        )
+        assert [a.type for a in anomalies] == expected
+
     def test_anomaly_sequence_stickiness(self) -> None:
         sequence = ["BATTLE_WILD"] * 8 + ["DIALOG_NPC"] * 2
         anomalies = self.detector.detect_anomalies("", "", 0, 0, 0, 0, sequence)
         stickiness = [a for a in anomalies if a.type == "MODE_STICKINESS"]
         assert len(stickiness) == 1
 
+    def test_anomaly_sequence_stickiness_across_sub_modes(self) -> None:
+        sequence = ["BATTLE/WILD_EASY", "BATTLE/TRAINER"] * 4 + ["DIALOG/QUEST"] * 2
+        anomalies = self.detector.detect_anomalies("", "", 0, 0, 0, 0, sequence)
+        stickiness = [a for a in anomalies if a.type == "MODE_STICKINESS"]
+        assert len(stickiness) == 1
+        assert "BATTLE" in stickiness[0].description
+
     def test_anomaly_sequence_oscillation(self) -> None:
         sequence = ["BATTLE", "DIALOG", "BATTLE", "DIALOG", "BATTLE", "DIALOG"]
         anomalies = self.detector.detect_anomalies("", "", 0, 0, 0, 0, sequence)
@@ -338,10 +627,33 @@ class TestAnomalyResponseSelector:
         response = self.selector.select_response(anomalies)
         assert response.escalation_tier == "MEDIUM"
 
+    @pytest.mark.parametrize(
+        "severities,expected",
+        [
+            (["LOW"], "NONE"),
+            (["LOW", "MEDIUM"], "MEDIUM"),
+            (["MEDIUM", "HIGH", "LOW"], "HIGH"),
+            (["HIGH", "CRITICAL", "MEDIUM"], "EMERGENCY"),
+        ],
+    )
+    def test_highest_severity_wins(self, severities: list[str], expected: str) -> None:
+        anomalies = [
+            Anomaly(
+                type="DURATION_WARNING",
+                severity=severity,
+                description="Test",
+                value=100,
+                threshold=50,
+            )
+            for severity in severities
+        ]
+        assert self.selector.select_response(anomalies).escalation_tier == expected
+
 
 class TestBreakoutManager:
     def setup_method(self) -> None:
-        self.manager = BreakoutManager()
+        self.clock = FakeClock()
+        self.manager = BreakoutManager(sleep=self.clock.sleep)
 
     def test_execute_breakout_success(self) -> None:
         result = self.manager.execute_breakout(
@@ -360,6 +672,7 @@ class TestBreakoutManager:
     def test_breakout_history_tracking(self) -> None:
         self.manager.execute_breakout(BreakoutStrategy.STANDARD, "BATTLE", "WILD", {})
         assert len(self.manager.success_history) == 3
+        assert self.clock.sleeps == [0.5, 1.0, 1.5]
 
 
 class TestBreakoutAnalytics:
@@ -415,10 +728,50 @@ class TestModeDurationEscalation:
         tier = self.escalation.update_escalation(anomalies, 90.0)
         assert tier == EscalationTier.EMERGENCY_PROTOCOL
 
+    @pytest.mark.parametrize(
+        "severities,expected",
+        [
+            (["LOW"], EscalationTier.ENHANCED_MONITORING),
+            (["LOW", "MEDIUM"], EscalationTier.PLAN_SIMPLIFICATION),
+            (["MEDIUM", "HIGH"], EscalationTier.EMERGENCY_PROTOCOL),
+            (["HIGH", "CRITICAL", "LOW"], EscalationTier.RESET_CONDITION),
+        ],
+    )
+    def test_update_escalation_mixed_severities(
+        self, severities: list[str], expected: EscalationTier
+    ) -> None:
+        anomalies = [
+            Anomaly(
+                type="DURATION_WARNING",
+                severity=severity,
+                description="Test",
+                value=100,
+                threshold=50,
+            )
+            for severity in severities
+        ]
+        assert self.escalation.update_escalation(anomalies, 90.0) == expected
+
     def test_update_escalation_low_confidence(self) -> None:
         tier = self.escalation.update_escalation([], 30.0)
         assert tier == EscalationTier.EMERGENCY_PROTOCOL
 
+    @pytest.mark.parametrize(
+        "confidence,expected",
+        [
+            (80.0, EscalationTier.NONE),
+            (79.9, EscalationTier.ENHANCED_MONITORING),
+            (60.0, EscalationTier.ENHANCED_MONITORING),
+            (40.0, EscalationTier.PLAN_SIMPLIFICATION),
+            (20.0, EscalationTier.EMERGENCY_PROTOCOL),
+            (19.9, EscalationTier.RESET_CONDITION),
+        ],
+    )
+    def test_update_escalation_confidence_floors(
+        self, confidence: float, expected: EscalationTier
+    ) -> None:
+        assert self.escalation.update_escalation([], confidence) == expected
+
     def test_get_check_interval(self) -> None:
         interval = self.escalation.get_check_interval()
         assert interval == 10.0
@@ -439,7 +792,8 @@ class TestModeDurationEscalation:
 
 class TestModeDurationTrackingSystem:
     def setup_method(self) -> None:
-        self.mdts = ModeDurationTrackingSystem()
+        self.clock = FakeClock()
+        self.mdts = ModeDurationTrackingSystem(clock=self.clock)
 
     def test_update_classifies_mode(self) -> None:
         state = {"is_battle": True}
@@ -456,13 +810,13 @@ class TestModeDurationTrackingSystem:
     def test_update_tracks_duration(self) -> None:
         state = {"is_battle": True}
         self.mdts.update(state, tick=100)
-        time.sleep(0.1)
+        self.clock.advance(0.1)
         result = self.mdts.update(state, tick=101)
         assert result["current_duration"] >= 0.1
 
     def test_on_mode_exit_learns_profile(self) -> None:
         self.mdts.duration_tracker.enter_mode("BATTLE", "WILD", tick=100)
-        time.sleep(0.1)
+        self.clock.advance(0.1)
         self.mdts.on_mode_exit("BATTLE", "WILD", "natural", tick=200)
         profile = self.mdts.profile_learner.get_profile("BATTLE", "WILD")
         assert profile is not None
@@ -528,6 +882,26 @@ class TestDataClasses:
         assert anomaly.type == "DURATION_HIGH"
         assert anomaly.severity == "HIGH"
 
+    def test_records_are_slotted_and_frozen(self) -> None:
+        anomaly = Anomaly(
+            type="DURATION_HIGH",
+            severity="HIGH",
+            description="Test anomaly",
+            value=100.0,
+            threshold=50.0,
+        )
+        assert not hasattr(anomaly, "__dict__")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            anomaly.value = 0.0  # type: ignore[misc]
+
+    def test_update_context_carries_classification_fields(self) -> None:
+        mdts = ModeDurationTrackingSystem(clock=FakeClock())
+        mdts.update({"is_battle": True}, tick=100)
+        assert mdts.duration_tracker.current_mode is not None
+        context = mdts.duration_tracker.current_mode.context
+        assert context["classification"]["mode"] == GameMode.BATTLE.value
+        assert context["classification"]["tick"] == 100
+
     def test_breakout_result(self) -> None:
         result = BreakoutResult(
             success=True, strategy="break_out_standard", action="RUN", attempts=2